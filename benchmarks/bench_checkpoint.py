@@ -0,0 +1,60 @@
+"""
+Checkpoint benchmark for the Bowler Program. Snapshots many in-flight games into one checkpoint file and times writing and restoring it.
+
+Usage:
+    python benchmarks/bench_checkpoint.py [--games 50000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.checkpoint import read_checkpoint, write_checkpoint
+from bowling.constants import GameOverPolicy
+from bowling.generator import PROFILES, flatten, random_moves
+
+def in_flight_games(count : int, seed : int) -> dict:
+    """
+    Returns count league games stopped before their last roll, keyed by lane.
+    """
+    rng = random.Random(seed)
+    games = {}
+    for lane in range(count):
+        rolls = [pins for pins in flatten(random_moves(rng, PROFILES["league"])) if pins >= 0]
+        scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RAISE)
+        for pins in rolls[:rng.randrange(len(rolls))]:
+            scoreKeeper.roll(pins)
+        games[f"lane-{lane}"] = scoreKeeper
+    return games
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    games = in_flight_games(args.games, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "games.ckpt")
+        start = time.perf_counter()
+        write_checkpoint(path, games)
+        written = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+        start = time.perf_counter()
+        restored = read_checkpoint(path, on_game_over=GameOverPolicy.RAISE)
+        elapsed = time.perf_counter() - start
+
+    assert all(restored[key].snapshot() == scoreKeeper.snapshot() for key, scoreKeeper in games.items())
+    print(f"games   : {len(restored):,}")
+    print(f"size    : {size / 2**20:.1f} MiB ({size / len(games):.0f} bytes/game)")
+    print(f"write   : {written * 1e3:8.1f} ms")
+    print(f"restore : {elapsed * 1e3:8.1f} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+Concurrency benchmark for the Bowler Program. One writer thread rolls games while N reader threads read them, as lane displays do.
+
+Usage:
+    python benchmarks/bench_concurrent.py [--readers 1 2 4 8] [--seconds 1] [--stress 3]
+
+stress    : the writer rolls, undoes and restarts games for --stress seconds with a thread switch every microsecond, and every
+            reader checks each GameView it reads against the views a single-threaded replay publishes. Reading score, frame, pins
+            and movesRemaining() one by one from the same games is checked the same way and shows the torn reads the view avoids.
+            Fails if any view is torn. tests/test_concurrent.py runs the same check under pytest.
+view      : readers read ScoreKeeper.view of a concurrent game, no lock
+locked    : the writer holds a lock for each roll and readers take it to read score, frame, pins and movesRemaining()
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bowling.ScoreKeeper import GameView, ScoreKeeper
+from bowling.constants import GameOverPolicy
+
+def writer_moves(count : int, seed : int) -> List[Tuple[str, int]]:
+    """
+    Returns count writer calls, ("roll", pins) or ("undo", 0), that a ScoreKeeper with GameOverPolicy.RESTART can make in order.
+    """
+    rng = random.Random(seed)
+    scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART)
+    moves = []
+    for _ in range(count):
+        if rng.random() < 0.05 and scoreKeeper.frame > 0:
+            scoreKeeper.undo()
+            moves.append(("undo", 0))
+        else:
+            pins = rng.randint(0, scoreKeeper.pins)
+            scoreKeeper.roll(pins)
+            moves.append(("roll", pins))
+    return moves
+
+def play(scoreKeeper : ScoreKeeper, moves : List[Tuple[str, int]]) -> None:
+    """
+    Makes the writer calls on a game.
+    """
+    for move, pins in moves:
+        if move == "roll":
+            scoreKeeper.roll(pins)
+        else:
+            scoreKeeper.undo()
+
+class Recorder(ScoreKeeper):
+    """
+    ScoreKeeper that keeps every GameView it publishes.
+    """
+    __slots__ = ('published',)
+
+    def _publish(self) -> None:
+        super()._publish()
+        self.published.append(self._view)
+
+def stress(seconds : float, readers : int, seed : int) -> None:
+    """
+    Checks that readers only ever see whole GameViews while a writer changes the game, and counts torn reads of the separate properties.
+    """
+    moves = writer_moves(5_000, seed)
+    replica = Recorder.__new__(Recorder)
+    replica.published = []
+    replica.__init__(on_game_over=GameOverPolicy.RESTART, concurrent=True)
+    play(replica, moves)
+    replica.reset()
+    # a pass over the moves ends with a reset back to the first view, so version v is the view published at (v - 1) % period of a pass
+    expected : List[GameView] = [view._replace(version=0) for view in replica.published]
+    period = len(expected) - 1
+    states = {(view.score, view.frame, view.pins, view.moves) for view in expected}
+
+    scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART, concurrent=True)
+    done = threading.Event()
+    torn_views, torn_reads, counts = [0], [0], [0, 0]
+
+    def write() -> None:
+        while not done.is_set():
+            play(scoreKeeper, moves)
+            scoreKeeper.reset()
+
+    def read_views() -> None:
+        reads, last = 0, 0
+        while not done.is_set():
+            view = scoreKeeper.view
+            if expected[(view.version - 1) % period] != view._replace(version=0) or view.version < last:
+                torn_views[0] += 1
+            last = view.version
+            reads += 1
+        counts[0] += reads
+
+    def read_properties() -> None:
+        reads = 0
+        while not done.is_set():
+            if (scoreKeeper.score, scoreKeeper.frame, scoreKeeper.pins, scoreKeeper.movesRemaining()) not in states:
+                torn_reads[0] += 1
+            reads += 1
+        counts[1] += reads
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    threads = [threading.Thread(target=write)] + [threading.Thread(target=read_views if number % 2 == 0 else read_properties) for number in range(2 * readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    done.set()
+    for thread in threads:
+        thread.join()
+    sys.setswitchinterval(interval)
+    print(f"stress    view reads {counts[0]:>12,}  torn {torn_views[0]:,}")
+    print(f"stress    property reads {counts[1]:>8,}  torn {torn_reads[0]:,}")
+    if torn_views[0]:
+        sys.exit("a reader saw a torn GameView")
+
+def throughput(name : str, readers : int, seconds : float, seed : int) -> None:
+    """
+    Runs one writer and readers threads for seconds and prints the reads and rolls per second.
+    """
+    moves = writer_moves(5_000, seed)
+    scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART, concurrent=name == "view")
+    lock = threading.Lock()
+    done = threading.Event()
+    reads, rolls = [0] * readers, [0]
+
+    def write() -> None:
+        while not done.is_set():
+            for move, pins in moves:
+                if name == "locked":
+                    with lock:
+                        scoreKeeper.roll(pins) if move == "roll" else scoreKeeper.undo()
+                else:
+                    scoreKeeper.roll(pins) if move == "roll" else scoreKeeper.undo()
+            rolls[0] += len(moves)
+            scoreKeeper.reset()
+
+    def read(number : int) -> None:
+        count = 0
+        if name == "view":
+            while not done.is_set():
+                view = scoreKeeper.view
+                view.score, view.frame, view.pins, view.moves
+                count += 1
+        else:
+            while not done.is_set():
+                with lock:
+                    scoreKeeper.score, scoreKeeper.frame, scoreKeeper.pins, scoreKeeper.movesRemaining()
+                count += 1
+        reads[number] = count
+
+    threads : List[threading.Thread] = [threading.Thread(target=write)] + [threading.Thread(target=read, args=(number,)) for number in range(readers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    done.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<9} readers {readers:<3} {sum(reads) / elapsed:14,.0f} reads/s {rolls[0] / elapsed:12,.0f} writer rolls/s")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--stress", type=float, default=3.0, help="seconds of stress checking, 0 to skip")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.stress:
+        stress(args.stress, max(args.readers), args.seed)
+    for name in ("view", "locked"):
+        for readers in args.readers:
+            throughput(name, readers, args.seconds, args.seed)
+
+if __name__ == '__main__':
+    main()
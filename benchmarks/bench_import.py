@@ -0,0 +1,72 @@
+"""
+Startup benchmark for the Bowler Program. Measures the cold import of the scorer in fresh interpreters with python -X importtime.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 15] [--reference path/to/other/src] [--max-ms N] [--modules]
+
+Every run imports bowling.ScoreKeeper (ScoreKeeper in checkouts from before the package) in a new isolated interpreter,
+with the bytecode compiled beforehand, as a freshly spawned scoring worker would. The time counted is the -X importtime
+self time of every module the import loads beyond those of an empty interpreter, and the median over --repeat runs is
+reported. --modules lists those modules, slowest first. --max-ms fails the run above a budget.
+"""
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+from checkout import SRC
+
+def import_times(statement : str) -> Dict[str, int]:
+    """
+    Returns the -X importtime self time in microseconds of every module loaded by running statement in a new interpreter.
+    """
+    stderr = subprocess.run([sys.executable, "-I", "-X", "importtime", "-c", statement], check=True, capture_output=True, text=True).stderr
+    times : Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+def cold_import(src : str = SRC, repeat : int = 15) -> Tuple[float, List[Tuple[str, int]]]:
+    """
+    Returns the median cold import time of the scorer of a checkout in microseconds, and the modules it loads with their time in the median run.
+    """
+    src = os.path.abspath(src)
+    package = os.path.join(src, "bowling")
+    module = "bowling.ScoreKeeper" if os.path.isdir(package) else "ScoreKeeper"
+    compileall.compile_dir(package if os.path.isdir(package) else src, quiet=1)
+    baseline = set(import_times("pass"))
+    runs = []
+    for _ in range(repeat):
+        loaded = {name: us for name, us in import_times(f"import sys; sys.path.insert(0, {src!r}); import {module}").items() if name not in baseline}
+        runs.append((sum(loaded.values()), loaded))
+    runs.sort(key=lambda run: run[0])
+    total, loaded = runs[len(runs) // 2]
+    return statistics.median(run[0] for run in runs), sorted(loaded.items(), key=lambda item: -item[1])
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=15, help="fresh interpreters per checkout, the median counts")
+    parser.add_argument("--src", default=SRC, help=argparse.SUPPRESS)
+    parser.add_argument("--reference", help="src directory of another checkout to compare against")
+    parser.add_argument("--modules", action="store_true", help="list the modules loaded by the import")
+    parser.add_argument("--max-ms", type=float, help="fail when the cold import takes longer than this")
+    args = parser.parse_args()
+
+    checkouts = [("reference", args.reference)] if args.reference else []
+    for name, src in checkouts + [("current", args.src)]:
+        us, modules = cold_import(src, args.repeat)
+        print(f"{name:<10} cold import: {us / 1000:6.2f} ms   modules: {len(modules)}")
+        if args.modules:
+            for module, module_us in modules:
+                print(f"    {module_us / 1000:6.2f} ms  {module}")
+    if args.max_ms is not None and us / 1000 > args.max_ms:
+        sys.exit(f"the scorer takes {us / 1000:.2f} ms to import, more than {args.max_ms} ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Journal benchmark for the Bowler Program. Scores a league night of lanes with and without the roll journal on local disk and reports throughput and latency.
+
+Usage:
+    python benchmarks/bench_journal.py [--lanes 64] [--games 5] [--threads N] [--dir /path/on/local/disk]
+
+plain     : ScoreKeeper.roll, nothing journaled
+async     : RollJournal.roll without waiting, the committer thread group commits every 2 ms in the background
+fsync     : every roll waits for its own commit, one fsync per roll
+group Nms : every roll waits for its commit, --threads lane threads (one per lane by default) share commits gathered for N ms
+recovery  : read_journal over the journal of the last run
+
+Latency is from a roll's call to its return, so for the waiting runs it is the time until the roll is durable.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameOverPolicy
+from bowling.generator import flatten, random_moves
+from bowling.journal import RollJournal, read_journal
+
+def league_night(lanes : int, games : int, seed : int) -> Dict[str, List[int]]:
+    """
+    Returns the rolls of every lane, games back to back.
+    """
+    rng = random.Random(seed)
+    return {f"lane{lane + 1}": [pins for _ in range(games) for pins in flatten(random_moves(rng)) if pins >= 0] for lane in range(lanes)}
+
+def run(night : Dict[str, List[int]], threads : int, journal : Optional[RollJournal], wait : bool) -> Tuple[float, List[float]]:
+    """
+    Scores every lane's rolls with the lanes split over threads. Returns the elapsed seconds and the latency of every roll.
+    """
+    lanes = list(night)
+    latencies : List[List[float]] = [[] for _ in range(threads)]
+
+    def bowl(number : int) -> None:
+        clock = time.perf_counter
+        games = {lane: ScoreKeeper(on_game_over=GameOverPolicy.RESTART) for lane in lanes[number::threads]}
+        spent = latencies[number]
+        for turn in range(max(len(night[lane]) for lane in games)):
+            for lane, scoreKeeper in games.items():
+                if turn < len(night[lane]):
+                    start = clock()
+                    if journal is None:
+                        scoreKeeper.roll(night[lane][turn])
+                    else:
+                        journal.roll(lane, scoreKeeper, night[lane][turn], wait=wait)
+                    spent.append(clock() - start)
+
+    workers = [threading.Thread(target=bowl, args=(number,)) for number in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    if journal is not None:
+        journal.close()
+    return time.perf_counter() - start, [latency for spent in latencies for latency in spent]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lanes", type=int, default=64)
+    parser.add_argument("--games", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=None, help="lane threads of the group commit runs, one per lane by default")
+    parser.add_argument("--dir", default=None, help="directory on the disk to journal to, a temporary one by default")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    night = league_night(args.lanes, args.games, args.seed)
+    threads = args.threads or args.lanes
+    rolls = sum(map(len, night.values()))
+    directory = tempfile.mkdtemp(dir=args.dir)
+    path = os.path.join(directory, "rolls.journal")
+    runs = [
+        ("plain", 1, None, False),
+        ("async", 1, 0.002, False),
+        ("fsync", 1, None, True),
+        ("group 0ms", threads, 0.0, True),
+        ("group 1ms", threads, 0.001, True),
+        ("group 5ms", threads, 0.005, True),
+    ]
+    print(f"{rolls:,} rolls on {args.lanes} lanes")
+    for name, workers, interval, wait in runs:
+        if os.path.exists(path):
+            os.remove(path)
+        journal = None if name == "plain" else RollJournal(path, interval=interval)
+        elapsed, latencies = run(night, workers, journal, wait)
+        latencies.sort()
+        commits = f"{journal.commits:>8,} commits" if journal is not None else ""
+        print(f"{name:<10} {rolls / elapsed:12,.0f} rolls/s   p50 {statistics.median(latencies) * 1e6:9,.1f} us   "
+              f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:9,.1f} us {commits}")
+
+    start = time.perf_counter()
+    games = read_journal(path)
+    elapsed = time.perf_counter() - start
+    print(f"{'recovery':<10} {rolls / elapsed:12,.0f} rolls/s   {len(games)} games from {os.path.getsize(path):,} bytes")
+    os.remove(path)
+    os.rmdir(directory)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Leaves benchmark for the Bowler Program. Rolls pin-level games with their standing pins, then indexes the packed leaves of a large corpus. Requires numpy.
+
+Usage:
+    python benchmarks/bench_leaves.py [--games 20000] [--corpus 1000000]
+
+roll     : ScoreKeeper.roll with a standing pin mask per ball, against the same rolls without
+index    : LeaveIndex.add_leaves over --corpus games of packed leaves, then the 7-10 conversion rate
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+import numpy as np
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameOverPolicy
+from bowling.leaves import LeaveIndex
+
+def ball(rng : random.Random, standing : int, full : bool) -> int:
+    """
+    Returns the pins left standing after a ball at standing. Pins at the front of a full rack fall more often than those at the back.
+    """
+    left = 0
+    for pin in range(10):
+        if standing >> pin & 1 and rng.random() > (0.9 - 0.05 * pin if full else 0.55):
+            left |= 1 << pin
+    return left
+
+def pin_games(count : int, seed : int) -> list:
+    """
+    Returns count games as lists of (pins, standing pin mask) rolls.
+    """
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        rolls = []
+        for frame in range(10):
+            standing, balls = 0x3FF, 3 if frame == 9 else 2
+            for index in range(balls):
+                left = ball(rng, standing, standing == 0x3FF)
+                rolls.append((bin(standing & ~left).count("1"), left))
+                standing = left or 0x3FF if frame == 9 else left
+                if frame < 9 and not left or index == 1 and (frame < 9 or rolls[-2][1] and left):
+                    break
+        games.append(rolls)
+    return games
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=20_000)
+    parser.add_argument("--corpus", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    games = pin_games(args.games, args.seed)
+    rolls = sum(len(game) for game in games)
+    timings = {}
+    for name, with_leaves in (("plain", False), ("leaves", True)):
+        keepers = []
+        start = time.perf_counter()
+        for game in games:
+            scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RAISE)
+            for pins, left in game:
+                scoreKeeper.roll(pins, left if with_leaves else None)
+            keepers.append(scoreKeeper)
+        timings[name] = (time.perf_counter() - start) / rolls
+    print(f"roll     {timings['plain'] * 1e9:8,.0f} ns plain, {timings['leaves'] * 1e9:8,.0f} ns with leaves")
+
+    index = LeaveIndex()
+    for scoreKeeper in keepers:
+        index.add(scoreKeeper)
+    width = max(len(scoreKeeper.leaves) for scoreKeeper in keepers)
+    packed = np.zeros((len(keepers), width), dtype=np.uint16)
+    for row, scoreKeeper in zip(packed, keepers):
+        row[:len(scoreKeeper.leaves)] = np.frombuffer(scoreKeeper.leaves, dtype=np.uint16)
+    check = LeaveIndex()
+    check.add_leaves(packed)
+    if list(check.counts) != list(index.counts) or list(check.cleared) != list(index.cleared):
+        sys.exit("add and add_leaves disagree")
+
+    corpus = np.resize(packed, (args.corpus, width))
+    start = time.perf_counter()
+    index = LeaveIndex()
+    index.add_leaves(corpus)
+    rate = index.rate((7, 10))
+    elapsed = time.perf_counter() - start
+    print(f"index    {elapsed:8.2f} s for {args.corpus:,} games, 7-10 came up {index.count((7, 10)):,} times, converted {rate or 0:.2%}")
+    print(f"splits   {index.split_rate() or 0:.2%} converted, most common: {' '.join('-'.join(map(str, pins)) for pins, _, _ in index.most_common(5, splits=True))}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Match benchmark for the Bowler Program. Scores league nights of five bowler matches three ways and reports rolls per second and memory per match.
+
+Usage:
+    python benchmarks/bench_match.py [--matches 2000] [--bowlers 5]
+
+separate : one ScoreKeeper per bowler, standings and team totals summed and sorted again after every ball
+roll     : Match.roll for whoever is up
+roll_many: Match.roll_many with each match's rolls in one batch
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bowling.Match import Match
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameOverPolicy
+from bowling.generator import PROFILES, flatten, random_moves
+
+def league_night(matches : int, bowlers : int, seed : int) -> List[List[Tuple[str, int]]]:
+    """
+    Returns the rolls of every match in turn order as (bowler, pins) events.
+    """
+    rng = random.Random(seed)
+    names = [f"bowler-{index}" for index in range(bowlers)]
+    nights = []
+    for _ in range(matches):
+        match = Match(names)
+        games = {name : [pins for pins in flatten(random_moves(rng, PROFILES["league"])) if pins >= 0] for name in names}
+        events = []
+        while not match.finished:
+            bowler = match.up
+            pins = games[bowler].pop(0)
+            match.roll(pins)
+            events.append((bowler, pins))
+        nights.append(events)
+    return nights
+
+def separate(nights, names, teams) -> None:
+    for events in nights:
+        games = {name : ScoreKeeper(on_game_over=GameOverPolicy.RAISE) for name in names}
+        for bowler, pins in events:
+            games[bowler].roll(pins)
+            sorted(((game.score, name) for name, game in games.items()), reverse=True)
+            totals = {}
+            for name, game in games.items():
+                totals[teams[name]] = totals.get(teams[name], 0) + game.score
+
+def match_roll(nights, names, teams) -> None:
+    for events in nights:
+        match = Match(names, teams=teams)
+        for _, pins in events:
+            match.roll(pins)
+
+def match_roll_many(nights, names, teams) -> None:
+    for events in nights:
+        Match(names, teams=teams).roll_many(events)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--matches", type=int, default=2_000)
+    parser.add_argument("--bowlers", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    names = [f"bowler-{index}" for index in range(args.bowlers)]
+    teams = {name : f"team-{index % 2}" for index, name in enumerate(names)}
+    nights = league_night(args.matches, args.bowlers, args.seed)
+    rolls = sum(len(events) for events in nights)
+    for label, run in (("separate", separate), ("roll", match_roll), ("roll_many", match_roll_many)):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            run(nights, names, teams)
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<10} {rolls / best:12,.0f} rolls/s")
+
+    tracemalloc.start()
+    kept = [{name : ScoreKeeper() for name in names} for _ in range(1000)]
+    separate_bytes = tracemalloc.get_traced_memory()[0] / len(kept)
+    del kept
+    tracemalloc.stop()
+    tracemalloc.start()
+    kept = [Match(names, teams=teams) for _ in range(1000)]
+    match_bytes = tracemalloc.get_traced_memory()[0] / len(kept)
+    tracemalloc.stop()
+    print(f"memory: {separate_bytes:,.0f} bytes per {args.bowlers} separate games, {match_bytes:,.0f} bytes per Match")
+
+if __name__ == '__main__':
+    main()
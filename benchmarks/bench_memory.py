@@ -0,0 +1,46 @@
+"""
+Memory benchmark for the Bowler Program. Holds many live games in memory and reports the bytes allocated per game.
+
+Usage:
+    python benchmarks/bench_memory.py [--games 100000] [--src path/to/src]
+
+Point --src at the src directory of another checkout to compare two versions of ScoreKeeper.
+"""
+import argparse
+import tracemalloc
+
+from checkout import SRC, use_checkout
+
+def live_games(count : int):
+    """
+    Creates count ScoreKeepers and plays the first frames of each so every game is mid-play.
+    """
+    from bowling.ScoreKeeper import ScoreKeeper
+    games = []
+    for i in range(count):
+        game = ScoreKeeper()
+        game.roll(10)
+        game.roll(i % 10)
+        game.roll(0)
+        games.append(game)
+    return games
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=100_000)
+    parser.add_argument("--src", default=SRC)
+    args = parser.parse_args()
+    use_checkout(args.src)
+
+    tracemalloc.start()
+    games = live_games(args.games)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"games          : {len(games)}")
+    print(f"live memory    : {current / 2**20:.1f} MiB")
+    print(f"peak memory    : {peak / 2**20:.1f} MiB")
+    print(f"bytes per game : {current / len(games):.0f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Call-count profile of scoreboard rendering for the Bowler Program. Counts the Python function and property calls made per rendered board.
+
+Usage:
+    python benchmarks/bench_render.py [--games 200] [--reference path/to/other/src] [--max-calls N]
+
+Two workloads are profiled over the same finished games: ScoreKeeper.show_scoreboard, and reading the state and score
+of every frame and the symbol of every roll through the frame views. Calls are counted with sys.setprofile, so every
+property read made in Python counts as one call. With --reference the other checkout is profiled in a separate
+process for comparison. --max-calls makes the run fail if a board takes more calls than that, for use as a check.
+"""
+import argparse
+import collections
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+from typing import Callable, Counter, Dict, List
+
+from checkout import SRC, use_checkout
+
+def finished_games(count : int, seed : int) -> List[List[int]]:
+    """
+    Returns the rolls of count random finished 10 frame games.
+    """
+    rng = random.Random(seed)
+    def ball(standing : int) -> int:
+        return standing if rng.random() < 0.3 else rng.randrange(standing)
+    games = []
+    for _ in range(count):
+        rolls = []
+        for _ in range(9):
+            first = ball(10)
+            rolls += [first] if first == 10 else [first, ball(10 - first)]
+        first = ball(10)
+        second = ball(10 if first == 10 else 10 - first)
+        rolls += [first, second]
+        if first + second >= 10:
+            rolls.append(ball(10 if second == 10 or first + second == 10 else 20 - first - second))
+        games.append(rolls)
+    return games
+
+def count_calls(run : Callable[[], None]) -> Counter:
+    """
+    Returns the Python calls made by run, by function.
+    """
+    calls : Counter = collections.Counter()
+    def profile(frame, event, arg) -> None:
+        if event == "call":
+            calls[f"{os.path.basename(frame.f_code.co_filename)}:{getattr(frame.f_code, 'co_qualname', frame.f_code.co_name)}"] += 1
+    sys.setprofile(profile)
+    try:
+        run()
+    finally:
+        sys.setprofile(None)
+    return calls
+
+def profile(games : int, seed : int) -> Dict[str, Dict[str, float]]:
+    """
+    Profiles both workloads and returns the calls per board, overall and by function.
+    """
+    from bowling.ScoreKeeper import ScoreKeeper
+    keepers = []
+    for rolls in finished_games(games, seed):
+        scoreKeeper = ScoreKeeper()
+        for pins in rolls:
+            scoreKeeper.roll(pins)
+        keepers.append(scoreKeeper)
+
+    def show_scoreboard() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for scoreKeeper in keepers:
+                scoreKeeper.show_scoreboard()
+
+    def frames() -> None:
+        for scoreKeeper in keepers:
+            for frame in scoreKeeper._frames:
+                frame.state, frame.score
+                for index in range(len(frame)):
+                    frame[index].symbol
+
+    results = {}
+    for name, run in (("show_scoreboard", show_scoreboard), ("frames", frames)):
+        calls = count_calls(run)
+        results[name] = {"total": sum(calls.values()) / games,
+                         **{function: count / games for function, count in calls.most_common()}}
+    return results
+
+def report(name : str, results : Dict[str, Dict[str, float]], top : int) -> None:
+    """
+    Prints the calls per board of each workload and its busiest functions.
+    """
+    for workload, calls in results.items():
+        print(f"{name:<10} {workload:<16} {calls['total']:8.1f} calls/board")
+        for function, count in list(calls.items())[1:top + 1]:
+            print(f"{'':<28}{count:8.1f}  {function}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top", type=int, default=8, help="functions listed per workload")
+    parser.add_argument("--reference", help="src directory of another checkout to compare against")
+    parser.add_argument("--max-calls", type=float, help="fail if show_scoreboard takes more calls per board")
+    parser.add_argument("--src", default=SRC, help=argparse.SUPPRESS)
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    use_checkout(args.src)
+
+    results = profile(args.games, args.seed)
+    if args.json:
+        print(json.dumps(results))
+        return
+    if args.reference:
+        reference = json.loads(subprocess.run([sys.executable, __file__, "--src", args.reference, "--games", str(args.games), "--seed", str(args.seed), "--json"],
+                                              check=True, capture_output=True, text=True).stdout)
+        report("reference", reference, args.top)
+    report("current", results, args.top)
+    if args.max_calls is not None and results["show_scoreboard"]["total"] > args.max_calls:
+        sys.exit(f"show_scoreboard takes {results['show_scoreboard']['total']:.1f} calls per board, more than {args.max_calls}")
+
+if __name__ == '__main__':
+    main()
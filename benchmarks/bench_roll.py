@@ -0,0 +1,173 @@
+"""
+Microbenchmark of ScoreKeeper.roll for the Bowler Program, with an exhaustive equivalence check against another checkout.
+
+Usage:
+    python benchmarks/bench_roll.py [--games 20000] [--reference path/to/other/src]
+    python benchmarks/bench_roll.py --digest [--rounds 3]
+    python benchmarks/bench_roll.py --instrument
+    python benchmarks/bench_roll.py --rules candlepin
+
+--digest plays every legal game of --rounds frames and hashes everything a caller can observe after each roll
+(score, frame, pins, state, movesRemaining and every frame and roll). With --reference both checkouts are timed
+and digested in separate processes, and the run fails if the digests differ. --instrument times roll before, during
+and after instrument.install, showing the cost of the timed methods and that uninstall leaves none behind. --rules times
+games of another variant from rules.RULES next to tenpin.
+"""
+import argparse
+import hashlib
+import random
+import subprocess
+import sys
+import time
+from typing import Iterator, List
+
+from checkout import SRC, use_checkout
+
+def frame_outcomes(last : bool) -> List[List[int]]:
+    """
+    Returns every legal roll sequence of a frame, with the fresh rack after a strike or spare in the last frame.
+    """
+    if not last:
+        return [[10]] + [[first, second] for first in range(10) for second in range(11 - first)]
+    outcomes = []
+    for first in range(11):
+        for second in range(11 if first == 10 else 11 - first):
+            if first + second >= 10:
+                standing = 10 - second if first == 10 and second < 10 else 10
+                outcomes += [[first, second, third] for third in range(standing + 1)]
+            else:
+                outcomes.append([first, second])
+    return outcomes
+
+def rules_outcomes(name : str, last : bool) -> List[List[int]]:
+    """
+    Returns every legal roll sequence of a frame under the rules of a variant, walked through its transition table.
+    """
+    from bowling.rules import RULES
+    from bowling.transitions import compile_rules
+    rules = compile_rules(RULES[name])
+    def extend(position : int, rolls : List[int]) -> Iterator[List[int]]:
+        for pins in range(rules.width):
+            transition = rules.transitions[rules.index(position, last, pins)]
+            if transition is None:
+                continue
+            if transition.advance or rules.positions[transition.position].ended:
+                yield rolls + [pins]
+            else:
+                yield from extend(transition.position, rolls + [pins])
+    return list(extend(0, []))
+
+def legal_games(rounds : int) -> Iterator[List[int]]:
+    """
+    Yields the rolls of every legal game of rounds frames.
+    """
+    def extend(frame : int, rolls : List[int]) -> Iterator[List[int]]:
+        for outcome in frame_outcomes(frame == rounds - 1):
+            if frame == rounds - 1:
+                yield rolls + outcome
+            else:
+                yield from extend(frame + 1, rolls + outcome)
+    yield from extend(0, [])
+
+def random_games(count : int, seed : int, rules : str = "tenpin") -> List[List[int]]:
+    """
+    Returns count random legal 10 frame games.
+    """
+    rng = random.Random(seed)
+    regular, last = (frame_outcomes(False), frame_outcomes(True)) if rules == "tenpin" else (rules_outcomes(rules, False), rules_outcomes(rules, True))
+    return [sum((rng.choice(regular) for _ in range(9)), []) + rng.choice(last) for _ in range(count)]
+
+def observe(scoreKeeper) -> tuple:
+    """
+    Returns everything a caller can read from a ScoreKeeper.
+    """
+    frames = []
+    for index in range(scoreKeeper.rounds):
+        frame = scoreKeeper._frames[index]
+        frames.append((frame.score, str(frame.state), frame.addend, tuple((frame[i].score, str(frame[i].state), frame[i].symbol) for i in range(len(frame)))))
+    return (scoreKeeper.score, scoreKeeper.frame, scoreKeeper.pins, str(scoreKeeper._state), scoreKeeper.movesRemaining(), tuple(frames))
+
+def digest(rounds : int) -> str:
+    """
+    Hashes the observable state after every roll of every legal game of rounds frames.
+    """
+    from bowling.ScoreKeeper import ScoreKeeper
+    hasher = hashlib.blake2b(digest_size=16)
+    games = 0
+    for rolls in legal_games(rounds):
+        scoreKeeper = ScoreKeeper(rounds=rounds)
+        for pins in rolls:
+            scoreKeeper.roll(pins)
+            hasher.update(repr(observe(scoreKeeper)).encode())
+        games += 1
+    return f"{games} games {hasher.hexdigest()}"
+
+def time_rolls(games : int, seed : int, rules : str = "tenpin") -> float:
+    """
+    Returns the average ns per ScoreKeeper.roll over random games, best of five runs.
+    """
+    from bowling.ScoreKeeper import ScoreKeeper
+    corpus = random_games(games, seed, rules)
+    rolls = sum(len(game) for game in corpus)
+    options = {}
+    if rules != "tenpin":
+        from bowling.rules import RULES
+        options["rules"] = RULES[rules]
+    best = float("inf")
+    for _ in range(5):
+        keepers = [ScoreKeeper(**options) for _ in corpus]
+        start = time.perf_counter()
+        for scoreKeeper, game in zip(keepers, corpus):
+            roll = scoreKeeper.roll
+            for pins in game:
+                roll(pins)
+        best = min(best, time.perf_counter() - start)
+    return best / rolls * 1e9
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=3, help="frames per game for --digest")
+    parser.add_argument("--digest", action="store_true", help="print the digest of every legal game and exit")
+    parser.add_argument("--src", default=SRC, help=argparse.SUPPRESS)
+    parser.add_argument("--reference", help="src directory of another checkout to compare against")
+    parser.add_argument("--instrument", action="store_true", help="time roll with and without instrument.install")
+    parser.add_argument("--rules", help="also time games of this variant from rules.RULES")
+    args = parser.parse_args()
+    use_checkout(args.src)
+
+    if args.instrument:
+        from bowling import instrument
+        print(f"roll, not instrumented: {time_rolls(args.games, args.seed):7.0f} ns")
+        instrument.install()
+        print(f"roll, instrumented:     {time_rolls(args.games, args.seed):7.0f} ns")
+        instrument.uninstall()
+        print(f"roll, uninstalled:      {time_rolls(args.games, args.seed):7.0f} ns")
+        return
+
+    if args.digest:
+        print(digest(args.rounds))
+        return
+
+    if args.rules is not None:
+        print(f"roll, tenpin: {time_rolls(args.games, args.seed):7.0f} ns")
+        print(f"roll, {args.rules}: {time_rolls(args.games, args.seed, args.rules):7.0f} ns")
+        return
+
+    if args.reference is None:
+        print(f"roll: {time_rolls(args.games, args.seed):7.0f} ns")
+        return
+
+    results = {}
+    for name, src in (("reference", args.reference), ("current", SRC)):
+        run = lambda *extra: subprocess.run([sys.executable, __file__, "--src", src, "--games", str(args.games), "--seed", str(args.seed), "--rounds", str(args.rounds), *extra],
+                                            check=True, capture_output=True, text=True).stdout.strip()
+        results[name] = (run(), run("--digest"))
+        print(f"{name:<10} {results[name][0]}   digest: {results[name][1]}")
+    if results["reference"][1] != results["current"][1]:
+        sys.exit("digests differ: the two ScoreKeepers do not behave the same")
+    print("equivalent over every legal game")
+
+if __name__ == '__main__':
+    main()
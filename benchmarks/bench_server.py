@@ -0,0 +1,96 @@
+"""
+Latency benchmark for the asyncio lane server of the Bowler Program. Starts a server process on localhost and drives it with the load generator.
+
+Usage:
+    python benchmarks/bench_server.py [--lanes 50] [--rate 10000] [--duration 10] [--transport unix|tcp]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC)
+
+from bowling.client import generate_load
+
+def free_port() -> int:
+    """
+    Returns a TCP port on localhost that is free right now.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def wait_until_listening(connect, timeout : float = 10.0) -> None:
+    """
+    Polls connect until the server accepts a connection.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connect().close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+def unix_connect(path : str) -> socket.socket:
+    """
+    Opens a connection to a Unix socket.
+    """
+    connection = socket.socket(socket.AF_UNIX)
+    connection.connect(path)
+    return connection
+
+def percentile(values : list, fraction : float) -> float:
+    """
+    Returns the value at a fraction of the sorted values.
+    """
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lanes", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=10_000, help="total rolls per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--transport", choices=["unix", "tcp"], default="unix")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        if args.transport == "unix":
+            target = {"path": os.path.join(directory, "lanes.sock")}
+            command = ["--serve", "--unix", target["path"]]
+            probe = lambda: unix_connect(target["path"])
+        else:
+            port = free_port()
+            target = {"port": port}
+            command = ["--serve", f"127.0.0.1:{port}"]
+            probe = lambda: socket.create_connection(("127.0.0.1", port))
+
+        server = subprocess.Popen([sys.executable, SRC, *command])
+        try:
+            wait_until_listening(probe)
+            start = time.perf_counter()
+            latencies = asyncio.run(generate_load(lanes=args.lanes, rate=args.rate, duration=args.duration, seed=args.seed, **target))
+            elapsed = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+
+    latencies.sort()
+    print(f"transport: {args.transport} lanes: {args.lanes} target: {args.rate:,.0f} rolls/s")
+    print(f"rolls    : {len(latencies):,} achieved: {len(latencies) / elapsed:,.0f} rolls/s")
+    print(f"p50      : {percentile(latencies, 0.50) * 1e6:8.0f} us")
+    print(f"p99      : {percentile(latencies, 0.99) * 1e6:8.0f} us")
+    print(f"mean     : {statistics.fmean(latencies) * 1e6:8.0f} us")
+
+if __name__ == '__main__':
+    main()
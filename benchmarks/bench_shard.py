@@ -0,0 +1,65 @@
+"""
+Throughput benchmark for sharded scoring in the Bowler Program. Rescores one game file with 1, 2, 4 and 8 worker processes.
+
+Usage:
+    python benchmarks/bench_shard.py [--games 200000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bowling.shard import score_file
+
+def random_game(rng : random.Random) -> list:
+    """
+    Returns the rolls of a random legal 10 frame game.
+    """
+    rolls = []
+    for _ in range(9):
+        first = rng.randint(0, 10)
+        rolls.append(first)
+        if first < 10:
+            rolls.append(rng.randint(0, 10 - first))
+    first = rng.randint(0, 10)
+    second = rng.randint(0, 10) if first == 10 else rng.randint(0, 10 - first)
+    rolls += [first, second]
+    if first + second >= 10:
+        rolls.append(rng.randint(0, 10 if second == 10 or first + second == 10 else 20 - first - second))
+    return rolls
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.NamedTemporaryFile("w", suffix=".games", delete=False) as corpus:
+        for _ in range(args.games):
+            corpus.write(" ".join(map(str, random_game(rng))) + "\n")
+
+    try:
+        print(f"cpus: {os.cpu_count()} games: {args.games}")
+        baseline = None
+        expected = None
+        for workers in args.workers:
+            with open(corpus.name, "rb") as source:
+                start = time.perf_counter()
+                scores = list(score_file(source, workers=workers))
+                elapsed = time.perf_counter() - start
+            if expected is None:
+                expected = scores
+            assert scores == expected, "sharded scores differ between worker counts"
+            baseline = baseline or elapsed
+            print(f"workers: {workers:<3} {elapsed:7.2f} s {args.games / elapsed:12,.0f} games/s speedup: {baseline / elapsed:5.2f}x")
+    finally:
+        os.unlink(corpus.name)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Simulation benchmark for the Bowler Program. Prices a pot game and a bracket of bowlers part way through their games and reports live game finishes simulated per second. Requires numpy.
+
+Usage:
+    python benchmarks/bench_simulate.py [--bowlers 8] [--simulations 500000] [--workers N]
+
+Every bowler has rolled a few random frames under a random skill profile. The simulations run once in this process and once across
+--workers processes (the number of CPUs by default), for the pot game alone and with a bracket over the next games, and must agree, as the same seed gives the same outcome on any number of workers.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.generator import SkillProfile, flatten, random_moves
+from bowling.simulation import simulate
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bowlers", type=int, default=8)
+    parser.add_argument("--simulations", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    games, profiles = {}, {}
+    for number in range(args.bowlers):
+        name = f"bowler{number + 1}"
+        profiles[name] = SkillProfile(rng.uniform(0.1, 0.6), rng.uniform(0.3, 0.85))
+        scoreKeeper = ScoreKeeper()
+        frames = rng.randrange(10)
+        rolls = flatten(random_moves(rng, profiles[name])[:frames], rounds=frames) if frames else []
+        for pins in rolls:
+            if pins >= 0:
+                scoreKeeper.roll(pins)
+        games[name] = scoreKeeper
+    bracket = list(games)[:1 << (args.bowlers.bit_length() - 1)]
+
+    outcomes = {}
+    for name, draw in (("pot", ()), ("bracket", bracket)):
+        for workers in sorted({1, args.workers}):
+            start = time.perf_counter()
+            outcomes[name, workers] = simulate(games, profiles, args.simulations, seed=args.seed, workers=workers, bracket=draw)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<8} workers {workers:<3} {args.simulations * args.bowlers / elapsed:14,.0f} finishes/s")
+        if outcomes[name, 1] != outcomes[name, args.workers]:
+            sys.exit("the outcome depends on the number of workers")
+
+    print(f"{'bowler':<10} {'frame':>5} {'score':>5} {'win':>7} {'bracket':>8} {'mean':>7}")
+    for outcome in outcomes["bracket", 1]:
+        bracket_share = f"{outcome.bracket:8.2%}" if outcome.bracket is not None else f"{'-':>8}"
+        print(f"{outcome.bowler:<10} {games[outcome.bowler].frame + 1:>5} {games[outcome.bowler].score:>5} {outcome.win:7.2%} {bracket_share} {outcome.mean:7.1f}")
+
+if __name__ == '__main__':
+    main()
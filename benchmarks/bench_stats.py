@@ -0,0 +1,90 @@
+"""
+Stats benchmark for the Bowler Program. Rolls a season of games up into per-bowler stats and answers top-N queries. Requires numpy.
+
+Usage:
+    python benchmarks/bench_stats.py [--games 200000] [--bowlers 5000] [--top 10]
+
+views    : every game walked through the Frame and Roll views (RollState per roll), as before stats.Ledger
+record   : Ledger.record as each ScoreKeeper game finishes
+bulk     : Ledger.from_games over the whole corpus with vectorized passes
+top      : Ledger.top from the ranking index, against sorting every bowler
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameOverPolicy, RollState
+from bowling.generator import random_games
+from bowling.stats import Ledger
+
+def by_views(keepers, bowlers) -> dict:
+    """
+    Returns strikes, chances and games per bowler counted from the Frame and Roll views.
+    """
+    totals = {}
+    for scoreKeeper, bowler in zip(keepers, bowlers):
+        strikes, frames = 0, 0
+        for index in range(scoreKeeper.rounds):
+            frame = scoreKeeper._frames[index]
+            frames += 1
+            strikes += sum(frame[roll].state == RollState.STRIKE for roll in range(len(frame)))
+        games, total, chances = totals.get(bowler, (0, 0, 0))
+        totals[bowler] = (games + 1, total + strikes, chances + frames)
+    return totals
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=200_000)
+    parser.add_argument("--bowlers", type=int, default=5_000)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pins = random_games(args.games, seed=args.seed)
+    bowlers = [rng.randrange(args.bowlers) for _ in range(args.games)]
+    series = [index // (3 * args.bowlers) for index in range(args.games)]
+    keepers = []
+    for row in pins.tolist():
+        scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RAISE)
+        for roll in row:
+            if roll >= 0:
+                scoreKeeper.roll(roll)
+        keepers.append(scoreKeeper)
+
+    start = time.perf_counter()
+    by_views(keepers, bowlers)
+    print(f"views    {args.games / (time.perf_counter() - start):12,.0f} games/s")
+
+    ledger = Ledger()
+    start = time.perf_counter()
+    for scoreKeeper, bowler, key in zip(keepers, bowlers, series):
+        ledger.record(bowler, scoreKeeper, key)
+    print(f"record   {args.games / (time.perf_counter() - start):12,.0f} games/s")
+
+    start = time.perf_counter()
+    bulk = Ledger.from_games(pins, bowlers, series)
+    print(f"bulk     {args.games / (time.perf_counter() - start):12,.0f} games/s")
+    if sorted(ledger.bowlers) != list(bulk.bowlers) or any(ledger[bowler] != bulk[bowler] for bowler in bulk.bowlers):
+        sys.exit("record and from_games disagree")
+
+    queries = 1_000
+    start = time.perf_counter()
+    for _ in range(queries):
+        leaders = ledger.top(args.top)
+    indexed = (time.perf_counter() - start) / queries
+    start = time.perf_counter()
+    for _ in range(queries // 100):
+        scanned = sorted((ledger[bowler] for bowler in ledger.bowlers), key=lambda stats: -stats.average)[:args.top]
+    scan = (time.perf_counter() - start) / (queries // 100)
+    if [stats.average for stats in leaders] != [stats.average for stats in scanned]:
+        sys.exit("top and a full scan disagree")
+    print(f"top {args.top:<4} {indexed * 1e6:10,.1f} us from the index, {scan * 1e6:10,.1f} us by a full scan of {len(ledger):,} bowlers")
+
+if __name__ == '__main__':
+    main()
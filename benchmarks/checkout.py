@@ -0,0 +1,22 @@
+"""
+Puts the bowling package of a checkout on sys.path for the benchmarks.
+
+Checkouts from before src/bowling existed keep their modules directly in src with sibling imports; for those, src itself
+is registered as the bowling package, so the benchmarks import both layouts as `bowling.X`.
+"""
+import os
+import sys
+import types
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+def use_checkout(src : str = SRC) -> None:
+    """
+    Makes `import bowling` load the package of the src directory of a checkout.
+    """
+    src = os.path.abspath(src)
+    sys.path.insert(0, src)
+    if not os.path.isdir(os.path.join(src, "bowling")):
+        package = types.ModuleType("bowling")
+        package.__path__ = [src]
+        sys.modules["bowling"] = package
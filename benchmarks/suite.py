@@ -0,0 +1,192 @@
+"""
+Benchmark suite for the Bowler Program. Times every scoring hot path over fixed-seed game corpora and saves the results as JSON.
+
+Usage:
+    python benchmarks/suite.py [--output results.json] [--compare baseline.json] [--src path/to/src]
+
+Hot paths: ScoreKeeper.roll, Frame.score, Roll.symbol, ScoreKeeper.movesRemaining and ScoreKeeper.show_scoreboard.
+Startup: the cold import time of the scorer in a fresh interpreter, from bench_import.
+Corpora: perfect games, all spares, gutter games and a seeded random mix of skill levels. The corpora are built here,
+not by the code under test, so results of different commits are measured on the same games.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from bench_import import cold_import
+from checkout import SRC, use_checkout
+
+def skilled_game(rng : random.Random, strike : float, spare : float) -> List[int]:
+    """
+    Returns the rolls of a legal 10 frame game of a bowler with the given strike and spare probabilities.
+    """
+    def ball(standing : int) -> int:
+        return standing if rng.random() < (strike if standing == 10 else spare) else rng.randrange(standing)
+    rolls = []
+    for _ in range(9):
+        first = ball(10)
+        rolls += [first] if first == 10 else [first, ball(10 - first)]
+    first = ball(10)
+    second = ball(10 if first == 10 else 10 - first)
+    rolls += [first, second]
+    if first + second >= 10:
+        rolls.append(ball(10 if second == 10 or first + second == 10 else 20 - first - second))
+    return rolls
+
+def corpora(games : int, seed : int) -> Dict[str, List[List[int]]]:
+    """
+    Returns the fixed game corpora of the suite.
+    """
+    rng = random.Random(seed)
+    skills = [(0.05, 0.15), (0.25, 0.55), (0.6, 0.85)]
+    return {
+        "perfect": [[10] * 12] * games,
+        "all_spares": [[5, 5] * 10 + [5]] * games,
+        "gutter": [[0] * 20] * games,
+        "random_mix": [skilled_game(rng, *skills[i % len(skills)]) for i in range(games)],
+    }
+
+def best_time(run : Callable[[], None], repeat : int) -> float:
+    """
+    Returns the fastest of repeat runs in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def measure(games : List[List[int]], repeat : int) -> Dict[str, float]:
+    """
+    Runs every hot path over one corpus.
+    """
+    from bowling.ScoreKeeper import ScoreKeeper
+    rolls = sum(len(game) for game in games)
+    results : Dict[str, float] = {}
+
+    def play() -> List[ScoreKeeper]:
+        keepers = []
+        for game in games:
+            scoreKeeper = ScoreKeeper()
+            for pins in game:
+                scoreKeeper.roll(pins)
+            keepers.append(scoreKeeper)
+        return keepers
+
+    elapsed = best_time(play, repeat)
+    results["roll_per_s"] = rolls / elapsed
+    results["games_per_s"] = len(games) / elapsed
+
+    finished = play()
+    frames = [scoreKeeper._frames[index] for scoreKeeper in finished for index in range(scoreKeeper.rounds)]
+
+    def frame_score() -> None:
+        for frame in frames:
+            frame.score
+    results["frame_score_per_s"] = len(frames) / best_time(frame_score, repeat)
+
+    rolls_of_frames = [frame[index] for frame in frames for index in range(len(frame))]
+    def roll_symbol() -> None:
+        for roll in rolls_of_frames:
+            roll.symbol
+    results["roll_symbol_per_s"] = len(rolls_of_frames) / best_time(roll_symbol, repeat)
+
+    positions = []
+    for game in games[:max(1, len(games) // 10)]:
+        for length in range(len(game) + 1):
+            scoreKeeper = ScoreKeeper()
+            for pins in game[:length]:
+                scoreKeeper.roll(pins)
+            positions.append(scoreKeeper)
+    def moves_remaining() -> None:
+        for scoreKeeper in positions:
+            scoreKeeper.movesRemaining()
+    results["moves_remaining_per_s"] = len(positions) / best_time(moves_remaining, repeat)
+
+    boards = finished[:max(1, len(finished) // 10)]
+    def show_scoreboard() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            for scoreKeeper in boards:
+                scoreKeeper.show_scoreboard()
+    results["show_scoreboard_per_s"] = len(boards) / best_time(show_scoreboard, repeat)
+
+    tracemalloc.start()
+    before_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    kept = play()
+    current, peak = tracemalloc.get_traced_memory()
+    after_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    results["live_blocks_per_game"] = (after_blocks - before_blocks) / len(kept)
+    results["live_bytes_per_game"] = current / len(kept)
+    results["peak_bytes_per_game"] = peak / len(kept)
+    return results
+
+def git_revision() -> str:
+    """
+    Returns the commit of the checkout holding the suite, or an empty string outside git.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def compare(current : dict, baseline : dict) -> None:
+    """
+    Prints the ratio of every metric to a saved baseline. Ratios above 1 are better, lower is better for the byte and block counts.
+    """
+    print(f"\n{'corpus':<12} {'metric':<24} {'baseline':>14} {'current':>14} {'ratio':>7}")
+    for corpus, metrics in current["results"].items():
+        for metric, value in metrics.items():
+            old = baseline["results"].get(corpus, {}).get(metric)
+            if not old:
+                continue
+            ratio = value / old if metric.endswith("_per_s") else old / value if value else float("inf")
+            print(f"{corpus:<12} {metric:<24} {old:>14,.0f} {value:>14,.0f} {ratio:>6.2f}x")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--games", type=int, default=5_000, help="games per corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement, the fastest counts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--src", default=SRC, help="src directory of the checkout to measure")
+    args = parser.parse_args()
+    use_checkout(args.src)
+
+    results = {"startup": {"cold_import_us": cold_import(args.src)[0]}}
+    print(f"{'startup':<12} cold_import_us={results['startup']['cold_import_us']:,.0f}")
+    for name, games in corpora(args.games, args.seed).items():
+        results[name] = measure(games, args.repeat)
+        print(f"{name:<12} " + "  ".join(f"{metric}={value:,.0f}" for metric, value in results[name].items()))
+
+    report = {
+        "revision": git_revision() if os.path.abspath(args.src) == os.path.abspath(SRC) else os.path.abspath(args.src),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "games": args.games,
+        "seed": args.seed,
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "results": results,
+    }
+    print(f"peak RSS: {report['peak_rss_kib']:,} KiB")
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(report, json.load(baseline))
+
+if __name__ == '__main__':
+    main()
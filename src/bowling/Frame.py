@@ -0,0 +1,367 @@
+from __future__ import annotations
+from array import array
+from .Roll import Roll, RollView
+from .constants import FrameState, RollState
+
+TYPE_CHECKING = False # typing is only imported by type checkers, it would double the import time of the scorer
+if TYPE_CHECKING:
+    from typing import List, Tuple
+
+# RollState values as stored in a ScoreKeeper's roll buffers
+OPEN_MARKS : Tuple[int, ...] = (RollState.OPEN.value, RollState.SPLIT.value, RollState.FOUL.value) # a split or foul is an open roll with more said about it
+SPARE_MARK : int = RollState.SPARE.value
+STRIKE_MARK : int = RollState.STRIKE.value
+
+class Frame():
+    """
+        Frame Class for Bowler Program. Object for storing data for a Bowler Game's Frame.
+
+        Data Properties:
+            - rolls  : List[Roll] - List of Rolls of Frame
+            - size   : int - Size of Frame
+            - state  : FrameState - State of Frame
+            - score  : int - Frame's score
+            - addend : int - addend of Frame from SPARES & STRIKES
+
+        The state and score are worked out when a roll or the addend changes and cached, reading them is a plain field access.
+
+        When printed the object returns the following:
+            - Roll {i} : Score: {score} State: {state} Symbol: {symbol}
+    """
+    __slots__ = ('_rolls', '_size', '_state', '_score', '_addend')
+
+    def __init__(self, turns : int =  2, state : FrameState = FrameState.EMPTY):
+        self._rolls : List[Roll] = [Roll() for _ in range(turns)]
+        self._size : int = turns
+        self._state : FrameState = state
+        self._score : int = 0
+        self._addend : int = 0
+        for roll in self._rolls:
+            roll._frame = self
+
+    def _refresh(self) -> None:
+        """
+        Frame private void Refresh method for Bowler Program. Works out the cached FrameState and score from the Frame's rolls. Called whenever a roll or the addend changes.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        if self._state != FrameState.LAST:
+            if self._rolls[0].state == RollState.STRIKE:
+                self._state = FrameState.STRIKE
+            elif self._rolls[1].state == RollState.SPARE:
+                self._state = FrameState.SPARE
+            elif self._rolls[0].state in (RollState.OPEN, RollState.SPLIT, RollState.FOUL):
+                self._state = FrameState.OPEN
+        self._score = sum(roll.score for roll in self._rolls) + self._addend
+    
+    @property
+    def size(self) -> int:
+        """
+        Frame Read-Only size Property for Bowler Program. Returns number of rolls in a frame
+
+        Data Properties:
+
+        Returns:
+            - Current number of rolls in frame (int)
+        """
+        return len(self._rolls)
+
+    @property
+    def state(self) -> FrameState:
+        """
+        Frame Get state Property for Bowler Program. Returns current FrameState of a frame, as last worked out from the Frame's roll's RollState.
+
+        Data Properties:
+
+        Returns:
+            - Current FrameState of a frame (FrameState)
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state : FrameState) -> None:
+        """
+        Frame Set state Property for Bowler Program. Sets a Frame's FrameState. A STRIKE, SPARE or OPEN shown by the Frame's rolls still takes precedence unless the state is LAST.
+
+        Data Properties:
+            state: 
+
+        Returns:
+            - None
+        """
+        self._state = state
+        self._refresh()
+
+    @property
+    def score(self) -> int:
+        """
+        Frame Read Only score Property for Bowler Program. Returns current Frame's score, the sum of scores in a Frame's rolls plus the addend, cached since they last changed
+
+        Data Properties:
+
+        Returns:
+            - Current Frame score (int)
+        """
+        return self._score
+    
+    @property
+    def addend(self) -> int:
+        """
+        Frame Get addend Property for Bowler Program. Returns the addend points of a Frame.
+
+        Data Properties:
+
+        Returns:
+            - Current addend of a frame (int)
+        """
+        return self._addend
+    
+    @addend.setter
+    def addend(self, score : int) -> None:
+        """
+        Frame Set score Property for Bowler Program. Sets the addend points of a Frame.
+
+        Data Properties:
+            - score : int
+        Returns:
+            - None
+        """
+        self._addend = score
+        self._refresh()
+    
+    def __getitem__(self, index : int) -> Roll:
+        """
+        Frame GetItem Property for Bowler Program. Returns a Roll Object at the corresponding index.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+            index : int
+
+        Returns:
+            - A roll object at the corresponding index (int)
+        """
+        if not (-self._size - 1 < index < self._size):
+            raise IndexError(f"Roll index out of range. This Frame has {self.size} rolls.")
+        return self._rolls[index]
+    
+    def __setitem__(self, index : int, roll: Roll) -> None:
+        """
+        Frame SetItem Property for Bowler Program. Sets a Roll Object at the corresponding index and updates the Frame's state and score from it.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+            index : int
+            roll : Roll
+
+        Returns:
+            - None
+        """
+        if not (-self._size - 1 < index < self._size):
+            raise IndexError(f"Roll index out of range. This Frame has {self.size} rolls.")
+        self._rolls[index]._frame = None
+        self._rolls[index] = roll
+        roll._frame = self
+        self._refresh()
+    
+    def __len__(self) -> int:
+        """
+        Frame len Property for Bowler Program. Returns number of Roll Objects in a frame.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+
+        Returns:
+            - Returns number of Roll Objects in a frame (int)
+        """
+        return self.size
+    
+    def __repr__(self) -> str:
+        """
+        Frame repr Property for Bowler Program. Returns a string representation of a Frame.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+
+        Returns:
+            - Returns a string representation of a Frame (str)
+        """
+        return f"Size: {self.size} Score: {self.score} Addend Offset: {self.addend} State: {self.state} \n" + "\n".join([f"Roll {i} : {self[i - 1]}" for i in range(1, self.size + 1)])
+
+class FrameView(Frame):
+    """
+        FrameView Class for Bowler Program. A Frame that reads and writes a ScoreKeeper's compact roll buffers instead of holding Roll objects.
+        Its state is derived from the RollStates stored in the buffers, and indexing it creates RollView objects on demand.
+
+        Data Properties:
+            - size   : int - Size of Frame
+            - state  : FrameState - State of Frame
+            - score  : int - Frame's score
+            - addend : int - addend of Frame from SPARES & STRIKES
+    """
+    __slots__ = ('_pinfall', '_marks', '_addends', '_index', '_slot', '_last', '_rack')
+
+    def __init__(self, pinfall : array, marks : array, addends : array, index : int, last : bool = False, balls : int = 2, rack : int = 10):
+        self._pinfall : array = pinfall
+        self._marks : array = marks
+        self._addends : array = addends
+        self._rack : int = rack # what a strike scores, a no-tap strike stores fewer pins
+        self._index : int = index
+        self._slot : int = balls * index # first roll slot of the frame
+        self._last : bool = last
+        self._size : int = len(pinfall) - self._slot if last else balls # the last frame takes every slot left
+
+    @property
+    def size(self) -> int:
+        """
+        FrameView Read-Only size Property for Bowler Program. Returns number of rolls in a frame
+
+        Data Properties:
+
+        Returns:
+            - Current number of rolls in frame (int)
+        """
+        return self._size
+
+    @property
+    def state(self) -> FrameState:
+        """
+        FrameView Read-Only state Property for Bowler Program. Returns current FrameState of a frame derived from the RollStates in the buffers.
+
+        Data Properties:
+
+        Returns:
+            - Current FrameState of a frame (FrameState)
+        """
+        if self._last:
+            return FrameState.LAST
+        first : int = self._marks[self._slot]
+        if first == STRIKE_MARK:
+            return FrameState.STRIKE
+        elif SPARE_MARK in self._marks[self._slot + 1:self._slot + self._size]:
+            return FrameState.SPARE
+        elif first in OPEN_MARKS:
+            return FrameState.OPEN
+        return FrameState.EMPTY
+
+    @property
+    def score(self) -> int:
+        """
+        FrameView Read Only score Property for Bowler Program. Returns current Frame's score by calculating the sum of the pins in the Frame's slots and then adding the addend.
+        A strike counts the full rack, also when a no-tap strike knocked fewer pins.
+
+        Data Properties:
+
+        Returns:
+            - Current Frame score (int)
+        """
+        end : int = self._slot + self._size
+        return sum(self._rack if mark == STRIKE_MARK else pins for pins, mark in zip(self._pinfall[self._slot:end], self._marks[self._slot:end])) + self._addends[self._index]
+
+    @property
+    def addend(self) -> int:
+        """
+        FrameView Get addend Property for Bowler Program. Returns the addend points of a Frame.
+
+        Data Properties:
+
+        Returns:
+            - Current addend of a frame (int)
+        """
+        return self._addends[self._index]
+
+    @addend.setter
+    def addend(self, score : int) -> None:
+        """
+        FrameView Set addend Property for Bowler Program. Sets the addend points of a Frame.
+
+        Data Properties:
+            - score : int
+        Returns:
+            - None
+        """
+        self._addends[self._index] = score
+
+    def __getitem__(self, index : int) -> Roll:
+        """
+        FrameView GetItem Property for Bowler Program. Returns a RollView of the slot at the corresponding index.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+            index : int
+
+        Returns:
+            - A roll object at the corresponding index (RollView)
+        """
+        if not (-self._size - 1 < index < self._size):
+            raise IndexError(f"Roll index out of range. This Frame has {self.size} rolls.")
+        return RollView(self._pinfall, self._marks, self._slot + index % self._size)
+
+    def __setitem__(self, index : int, roll : Roll) -> None:
+        """
+        FrameView SetItem Property for Bowler Program. Copies a Roll's score and state into the slot at the corresponding index.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+            index : int
+            roll : Roll
+
+        Returns:
+            - None
+        """
+        if not (-self._size - 1 < index < self._size):
+            raise IndexError(f"Roll index out of range. This Frame has {self.size} rolls.")
+        slot : int = self._slot + index % self._size
+        self._pinfall[slot] = roll.score
+        self._marks[slot] = roll.state.value
+
+class Frames():
+    """
+        Frames Class for Bowler Program. Read-Only sequence of a ScoreKeeper's frames backed by its compact roll buffers.
+        FrameView objects are only created when a frame is indexed.
+
+        Data Properties:
+            - pinfall : array - pins knocked per roll slot
+            - marks   : array - RollState value per roll slot
+            - addends : array - addend per frame
+            - balls   : int - roll slots of a frame other than the last
+            - rack    : int - pins in a full rack
+    """
+    __slots__ = ('_pinfall', '_marks', '_addends', '_rounds', '_balls', '_rack')
+
+    def __init__(self, pinfall : array, marks : array, addends : array, balls : int = 2, rack : int = 10):
+        self._pinfall : array = pinfall
+        self._marks : array = marks
+        self._addends : array = addends
+        self._rounds : int = len(addends)
+        self._balls : int = balls
+        self._rack : int = rack
+
+    def __getitem__(self, index : int) -> FrameView:
+        """
+        Frames GetItem Property for Bowler Program. Returns a FrameView of the frame at the corresponding index.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+            index : int
+
+        Returns:
+            - A frame object at the corresponding index (FrameView)
+        """
+        if not (-self._rounds - 1 < index < self._rounds):
+            raise IndexError(f"Frame index out of range. This Game has {self._rounds} frames.")
+        index %= self._rounds
+        return FrameView(self._pinfall, self._marks, self._addends, index, index == self._rounds - 1, self._balls, self._rack)
+
+    def __len__(self) -> int:
+        """
+        Frames len Property for Bowler Program. Returns number of frames in a game.
+
+        Data Properties:
+
+        Returns:
+            - Returns number of frames in a game (int)
+        """
+        return self._rounds
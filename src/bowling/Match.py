@@ -0,0 +1,271 @@
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from .ScoreKeeper import ScoreKeeper, _blank_game
+from .constants import GameOverPolicy, GameState
+from .rules import TENPIN, Rules
+
+class Match():
+    """
+        Match Class for Bowler Program. The games of every bowler on a lane or lane pair, kept in one set of contiguous buffers.
+        Bowlers take turns a frame at a time in the order given, and bowl out the last frame before the next bowler starts it.
+        Standings and team totals are updated by each roll's change in score instead of being summed again.
+
+        Data Properties:
+            - bowlers   : Tuple[str, ...] - bowlers in turn order
+            - up        : Optional[str] - bowler whose turn it is, None when every game has ended
+            - lane      : Optional[str] - lane of the bowler who is up, bowlers move to the other lane of a pair every frame
+            - standings : List[Tuple[str, int]] - bowlers and scores, best first
+            - teams     : Dict[str, int] - total score per team
+            - finished  : bool
+    """
+    def __init__(self, bowlers : Sequence[str], teams : Optional[Mapping[str, str]] = None, lanes : Sequence[str] = (), rounds : int = 10,
+                 on_game_over : GameOverPolicy = GameOverPolicy.RAISE, rules : Rules = TENPIN):
+        if len(set(bowlers)) != len(bowlers) or not bowlers:
+            raise ValueError(f"A Match needs one or more bowlers with distinct names, got {list(bowlers)}.")
+        self._bowlers : Tuple[str, ...] = tuple(bowlers)
+        self._index : Dict[str, int] = {bowler : index for index, bowler in enumerate(self._bowlers)}
+        self._lanes : Tuple[str, ...] = tuple(lanes)
+
+        # one buffer per field for all bowlers, each ScoreKeeper keeps its game in its own slice
+        count : int = len(self._bowlers)
+        pinfall, marks, addends, totals = _blank_game(rounds, rules)
+        self._pinfall : array = pinfall * count
+        self._marks : array = marks * count
+        self._addends : array = addends * count
+        self._totals : array = totals * count
+        views : Tuple[memoryview, ...] = tuple(memoryview(buffer) for buffer in (self._pinfall, self._marks, self._addends, self._totals))
+        sizes : Tuple[int, ...] = tuple(len(buffer) for buffer in (pinfall, marks, addends, totals))
+        self._games : List[ScoreKeeper] = [
+            ScoreKeeper.bind(*(view[index * size:(index + 1) * size] for view, size in zip(views, sizes)), rules=rules, on_game_over=on_game_over)
+            for index in range(count)
+        ]
+
+        self._team : List[Optional[str]] = [(teams or {}).get(bowler) for bowler in self._bowlers]
+        self._teams : Dict[str, int] = {team : 0 for team in self._team if team is not None}
+        self._scores : List[int] = [0] * count # score of each game as last seen by the Match
+        self._order : List[int] = list(range(count)) # bowler indexes, best score first
+
+    @property
+    def bowlers(self) -> Tuple[str, ...]:
+        """
+        Match Read-Only bowlers Property for Bowler Program. Returns the bowlers in turn order.
+
+        Data Properties:
+
+        Returns:
+            - Bowlers (Tuple[str, ...])
+        """
+        return self._bowlers
+
+    def __getitem__(self, bowler : str) -> ScoreKeeper:
+        """
+        Match GetItem Property for Bowler Program. Returns the game of a bowler. Rolls, corrections and undos should go through the Match so its standings stay current.
+        Will raise a KeyError if the bowler is not in the Match.
+
+        Data Properties:
+            bowler : str
+
+        Returns:
+            - The bowler's game (ScoreKeeper)
+        """
+        return self._games[self._index[bowler]]
+
+    def __len__(self) -> int:
+        """
+        Match len Property for Bowler Program. Returns number of bowlers in the Match.
+
+        Data Properties:
+
+        Returns:
+            - Number of bowlers (int)
+        """
+        return len(self._bowlers)
+
+    def _up(self) -> int:
+        """
+        Match private Up method for Bowler Program. Returns the index of the bowler whose turn it is: the first, in turn order, of the unfinished games furthest behind.
+
+        Data Properties:
+
+        Returns:
+            - Bowler index, -1 when every game has ended (int)
+        """
+        up, frame = -1, None
+        for index, game in enumerate(self._games):
+            if game._state != GameState.GAME_END and (frame is None or game._frame < frame):
+                up, frame = index, game._frame
+        return up
+
+    @property
+    def up(self) -> Optional[str]:
+        """
+        Match Read-Only up Property for Bowler Program. Returns the bowler whose turn it is.
+
+        Data Properties:
+
+        Returns:
+            - Bowler who is up, None when every game has ended (Optional[str])
+        """
+        index : int = self._up()
+        return None if index < 0 else self._bowlers[index]
+
+    @property
+    def lane(self) -> Optional[str]:
+        """
+        Match Read-Only lane Property for Bowler Program. Returns the lane of the bowler who is up. Bowlers start on the first lane and change lanes every frame.
+
+        Data Properties:
+
+        Returns:
+            - Lane, None without lanes or when every game has ended (Optional[str])
+        """
+        index : int = self._up()
+        if index < 0 or not self._lanes:
+            return None
+        return self._lanes[self._games[index]._frame % len(self._lanes)]
+
+    @property
+    def finished(self) -> bool:
+        """
+        Match Read-Only finished Property for Bowler Program. Returns whether every bowler's game has ended.
+
+        Data Properties:
+
+        Returns:
+            - Whether the Match is over (bool)
+        """
+        return all(game._state == GameState.GAME_END for game in self._games)
+
+    def roll(self, pins : int, leave : Optional[int] = None, foul : bool = False) -> str:
+        """
+        Match roll method for Bowler Program. Scores a roll for the bowler who is up, with its standing pins and foul as ScoreKeeper.roll takes them.
+        Will raise a GameOverError when every game has ended, or the ScoreKeeper's exception for an illegal roll.
+
+        Data Properties:
+            pins : int
+            leave : Optional[int]
+            foul : bool
+
+        Returns:
+            - The bowler who rolled (str)
+        """
+        index : int = self._up()
+        if index < 0:
+            index = 0 # every game has ended, the bowler's GameOverPolicy decides
+        try:
+            self._games[index].roll(pins, leave, foul)
+        finally:
+            self._update(index)
+        return self._bowlers[index]
+
+    def roll_many(self, events : Iterable[Tuple[str, int]]) -> int:
+        """
+        Match roll_many method for Bowler Program. Scores a batch of (bowler, pins) rolls in one call, e.g. everything a lane pair reported since the last poll.
+        Each bowler's rolls must be in order, but bowlers may be interleaved in any way. Standings and team totals are updated once per bowler at the end of the batch.
+        Will raise like ScoreKeeper.roll on an illegal roll, the rolls before it stay scored.
+
+        Data Properties:
+            events : Iterable[Tuple[str, int]]
+
+        Returns:
+            - Number of rolls scored (int)
+        """
+        index, games = self._index, self._games
+        touched : set = set()
+        count : int = 0
+        try:
+            for bowler, pins in events:
+                position : int = index[bowler]
+                games[position].roll(pins)
+                touched.add(position)
+                count += 1
+        finally:
+            for position in touched:
+                self._update(position)
+        return count
+
+    def correct(self, bowler : str, frame : int, roll : int, pins : int) -> None:
+        """
+        Match correct method for Bowler Program. Corrects a past roll of a bowler, see ScoreKeeper.correct, and updates the standings.
+
+        Data Properties:
+            bowler : str
+            frame : int - 0-frames
+            roll : int - 0-rolls of the frame
+            pins : int
+
+        Returns:
+            - None
+        """
+        position : int = self._index[bowler]
+        self._games[position].correct(frame, roll, pins)
+        self._update(position)
+
+    def undo(self, bowler : str) -> None:
+        """
+        Match undo method for Bowler Program. Takes back the last roll of a bowler, see ScoreKeeper.undo, and updates the standings.
+        Will raise a ValueError if the bowler has not rolled.
+
+        Data Properties:
+            bowler : str
+
+        Returns:
+            - None
+        """
+        position : int = self._index[bowler]
+        self._games[position].undo()
+        self._update(position)
+
+    def _update(self, position : int) -> None:
+        """
+        Match private void Update method for Bowler Program. Applies the change in a bowler's score since the Match last saw it to the team total and the standings.
+
+        Data Properties:
+            position : int - bowler index
+
+        Returns:
+            - None
+        """
+        score : int = self._games[position]._score
+        delta : int = score - self._scores[position]
+        if delta == 0:
+            return
+        self._scores[position] = score
+        team : Optional[str] = self._team[position]
+        if team is not None:
+            self._teams[team] += delta
+
+        # move the bowler up or down the standings until the order holds again, ties keep turn order
+        order, scores = self._order, self._scores
+        place : int = order.index(position)
+        while place > 0 and (scores[order[place - 1]], -order[place - 1]) < (score, -position):
+            order[place] = order[place - 1]
+            place -= 1
+        while place < len(order) - 1 and (scores[order[place + 1]], -order[place + 1]) > (score, -position):
+            order[place] = order[place + 1]
+            place += 1
+        order[place] = position
+
+    @property
+    def standings(self) -> List[Tuple[str, int]]:
+        """
+        Match Read-Only standings Property for Bowler Program. Returns the bowlers by score, best first. Ties are listed in turn order.
+
+        Data Properties:
+
+        Returns:
+            - Bowler and score pairs (List[Tuple[str, int]])
+        """
+        return [(self._bowlers[position], self._scores[position]) for position in self._order]
+
+    @property
+    def teams(self) -> Dict[str, int]:
+        """
+        Match Read-Only teams Property for Bowler Program. Returns the total score of every team.
+
+        Data Properties:
+
+        Returns:
+            - Score per team (Dict[str, int])
+        """
+        return dict(self._teams)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+from array import array
+from .constants import RollState, Symbols
+
+TYPE_CHECKING = False # typing is only imported by type checkers, it would double the import time of the scorer
+if TYPE_CHECKING:
+    from typing import List, Optional, Tuple
+
+def symbol_of(score : int, state : RollState) -> str:
+    """
+    Roll symbol_of Function for Bowler Program. Returns the scoreboard symbol of a roll: its pins when OPEN, its pins in brackets when a SPLIT, otherwise the mark of its RollState.
+
+    Data Properties:
+        score : int
+        state : RollState
+
+    Returns:
+        - A string representation of the roll (str)
+    """
+    if state == RollState.SPLIT:
+        return f"({Symbols[score]})"
+    return Symbols[score] if state == RollState.OPEN else Symbols.get(state, "")
+
+# RollState member by value, replaces the RollState(value) call when reading a roll slot
+ROLL_STATES : Tuple[Optional[RollState], ...] = tuple(next((state for state in RollState if state.value == value), None) for value in range(max(state.value for state in RollState) + 1))
+
+# symbol of a roll slot indexed by RollState value * 11 + pins
+SLOT_SYMBOLS : List[str] = [""] * (len(ROLL_STATES) * 11)
+for _state in RollState:
+    for _pins in range(11):
+        SLOT_SYMBOLS[_state.value * 11 + _pins] = symbol_of(_pins, _state)
+
+class Roll():
+    """
+        Roll Class for Bowler Program. Object for storing data for a Bowler Game Frame's Roll.
+
+        Data Properties:
+            - score : int
+            - state : RollState
+            - symbol : str
+
+        The symbol is worked out when the score or state changes and cached, so reading it is a plain field access.
+        A Roll held by a Frame tells its frame when it changes, so the frame can update its cached state and score.
+
+        When printed the object returns the following:
+            - Score: {score} State: {state} Symbol: {symbol}
+    """
+    __slots__ = ('_score', '_state', '_symbol', '_frame')
+
+    def __init__(self, score : int = 0, state : RollState = RollState.EMPTY):
+        self._score : int = score
+        self._state : RollState = state
+        self._symbol : str = symbol_of(score, state)
+        self._frame = None # Frame holding the roll
+    
+    @property    
+    def score(self) -> int:
+        """
+        Roll Get score Property for Bowler Program. Returns current score of a Roll.
+
+        Data Properties:
+
+        Returns:
+            - Current score of a Roll (int)
+        """
+        return self._score
+
+    @score.setter
+    def score(self, score : int) -> None:
+        """
+        Roll Set score Property for Bowler Program. Will automatically set a Roll's state to Open or Stike depending on score.
+
+        Data Properties:
+            score : int
+
+        Returns:
+            - None
+        """
+        if score == 0:
+            self._state = RollState.OPEN
+        elif score == 10:
+            self._state = RollState.STRIKE
+        self._score = score
+        self._changed()
+
+    @property
+    def state(self) -> RollState:
+        """
+        Roll Get state Property for Bowler Program. Returns current state of a Roll.
+
+        Data Properties:
+
+        Returns:
+            - Current state of a Roll (RollState)
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state : RollState) -> None:
+        """
+        Roll Get state Property for Bowler Program. Sets current state of a Roll.
+
+        Data Properties:
+            state : RollState
+
+        Returns:
+            - None
+        """
+        self._state = state
+        self._changed()
+
+    def _changed(self) -> None:
+        """
+        Roll private void Changed method for Bowler Program. Refreshes the cached symbol and the cached values of the Frame holding the Roll.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        self._symbol = symbol_of(self._score, self._state)
+        if self._frame is not None:
+            self._frame._refresh()
+    
+    @property
+    def symbol(self) -> str:
+        """
+        Roll Read Only symbol Property for Bowler Program. Returns a string representation of the current score of a Roll.
+
+        Data Properties:
+
+        Returns:
+            - A string representation of the current score of a Roll (str)
+        """
+        return self._symbol
+    
+    def __repr__(self) -> str:
+        """
+        Roll repr Property for Bowler Program. Returns a string representation of a Roll.
+
+        Data Properties:
+
+        Returns:
+            - Returns a string representation of a Roll (str)
+        """
+        return f"Score: {self.score} State: {self.state} Symbol: {self.symbol}"
+
+class RollView(Roll):
+    """
+        RollView Class for Bowler Program. A Roll that reads and writes a slot of a ScoreKeeper's compact roll buffers instead of its own fields.
+        Created lazily when a ScoreKeeper's frames are indexed, so a game only pays for the Roll objects someone looks at.
+        Nothing is cached in a view, its state and symbol are table lookups on the slot.
+
+        Data Properties:
+            - score : int
+            - state : RollState
+            - symbol : str
+    """
+    __slots__ = ('_pinfall', '_marks', '_slot')
+
+    def __init__(self, pinfall : array, marks : array, slot : int):
+        self._pinfall : array = pinfall
+        self._marks : array = marks
+        self._slot : int = slot
+
+    @property
+    def score(self) -> int:
+        """
+        RollView Get score Property for Bowler Program. Returns the pins stored in the Roll's slot.
+
+        Data Properties:
+
+        Returns:
+            - Current score of a Roll (int)
+        """
+        return self._pinfall[self._slot]
+
+    @score.setter
+    def score(self, score : int) -> None:
+        """
+        RollView Set score Property for Bowler Program. Will automatically set a Roll's state to Open or Stike depending on score.
+
+        Data Properties:
+            score : int
+
+        Returns:
+            - None
+        """
+        if score == 0:
+            self.state = RollState.OPEN
+        elif score == 10:
+            self.state = RollState.STRIKE
+        self._pinfall[self._slot] = score
+
+    @property
+    def state(self) -> RollState:
+        """
+        RollView Get state Property for Bowler Program. Returns the RollState stored in the Roll's slot.
+
+        Data Properties:
+
+        Returns:
+            - Current state of a Roll (RollState)
+        """
+        return ROLL_STATES[self._marks[self._slot]]
+
+    @state.setter
+    def state(self, state : RollState) -> None:
+        """
+        RollView Set state Property for Bowler Program. Stores a RollState in the Roll's slot.
+
+        Data Properties:
+            state : RollState
+
+        Returns:
+            - None
+        """
+        self._marks[self._slot] = state.value
+
+    @property
+    def symbol(self) -> str:
+        """
+        RollView Read Only symbol Property for Bowler Program. Returns a string representation of the pins and RollState stored in the Roll's slot.
+
+        Data Properties:
+
+        Returns:
+            - A string representation of the current score of a Roll (str)
+        """
+        return SLOT_SYMBOLS[self._marks[self._slot] * 11 + self._pinfall[self._slot]]
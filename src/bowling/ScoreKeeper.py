@@ -0,0 +1,752 @@
+from __future__ import annotations
+import struct
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from .constants import GameOverPolicy, GameState, RollState
+from .exceptions import GameOverError
+from .rules import PACKED, TENPIN, Rules, pack_rules, unpack_rules
+from .transitions import CompiledRules, compile_rules
+
+TYPE_CHECKING = False # typing is only imported by type checkers, it would double the import time of the scorer
+if TYPE_CHECKING:
+    from typing import List, Optional, Tuple
+    from .Frame import Frames
+    from .render import Scoreboard
+
+@lru_cache(maxsize=None)
+def _blank_game(rounds: int, rules : Rules = TENPIN) -> Tuple[array, array, array, array]:
+    """
+    ScoreKeeper private blank game Function for Bowler Program. Returns the empty buffers of a game, shared as templates by every ScoreKeeper with the same rounds and rules.
+
+    Data Properties:
+        rounds : int
+        rules : Rules
+
+    Returns:
+        - Empty pinfall, marks, addends and totals buffers (Tuple[array, array, array, array])
+    """
+    # compact game storage: one byte per roll slot (frame i uses slots balls * i up to the next frame, the last frame every slot left) and one per frame addend
+    slots : int = compile_rules(rules).slots(rounds)
+    pinfall : array = array('b', bytes(slots)) # pins knocked per roll slot
+    marks : array = array('b', [RollState.EMPTY.value]) * slots # RollState value per roll slot
+    addends : array = array('b', bytes(rounds)) # addend per frame
+    totals : array = array('i', bytes(4 * rounds)) # running cumulative score per frame, valid up to the current frame
+    return pinfall, marks, addends, totals
+
+DEFAULT_SCOREBOARD : Optional[Scoreboard] = None # created on the first board shown, so the scorer loads without render
+SNAPSHOT : struct.Struct = struct.Struct("<HHHBI") # rounds, frame, Position id, pins, score, followed by the packed rules and the roll buffers
+
+class GameView(namedtuple("GameView", ("score", "frame", "pins", "moves", "state", "frames", "version"))):
+    """
+        GameView Class for Bowler Program. Immutable copy of what a lane display reads of a game, all taken at the same point.
+        A concurrent ScoreKeeper publishes a new one after every roll, correction, undo and reset, so other threads read a whole game without a lock.
+
+        Data Properties:
+            - score   : int
+            - frame   : int - 0-frames
+            - pins    : int - pins standing
+            - moves   : int - movesRemaining
+            - state   : GameState
+            - frames  : Tuple[int, ...] - running score through every frame rolled so far
+            - version : int - number of views the game has published up to this one, 0 for a game that does not publish
+    """
+    __slots__ = ()
+
+class ScoreKeeper():
+    """
+        ScoreKeeper Class for Bowler Program. Object for storing scoring data and game state for a Bowler Game program.
+
+        Data Properties:
+            - frame : int
+            - score : int
+            - pins : int
+            - rounds : int
+            - rules : Rules
+            - movesRemaining : int
+            - rolls : List[int]
+            - leaves : Optional[array]
+            - view : GameView
+            - roll : None
+            - correct : None
+            - undo : None
+            - reset : None
+            - snapshot : bytes
+            - showScoreboard : None
+    """
+
+    __slots__ = ('_pinfall', '_marks', '_addends', '_totals', '_frame', '_position', '_state', '_score', '_pins', '_rounds', '_rules', '_leaves', '_view', '_verbose', '_on_game_over', '_scoreboard')
+
+    def __init__(self, rounds: int = 10, verbose : bool = False, on_game_over : GameOverPolicy = GameOverPolicy.PROMPT, scoreboard : Optional[Scoreboard] = None,
+                 rules : Rules = TENPIN, concurrent : bool = False):
+        pinfall, marks, addends, totals = _blank_game(rounds, rules)
+        self._pinfall : array = pinfall[:]
+        self._marks : array = marks[:]
+        self._addends : array = addends[:]
+        self._totals : array = totals[:]
+        self._frame : int = 0 # 0-frames
+        self._position : int = 0 # Position id in the rules' transition table
+        self._state : GameState = GameState.FIRST_ROLL
+        self._score : int = 0 
+        self._rules : CompiledRules = compile_rules(rules) # shared by every game with the same rules
+        self._pins : int = rules.pins
+        self._rounds : int = rounds
+        self._leaves : Optional[array] = None # standing pins and flags per roll slot, see leaves.py, created by the first roll given its standing pins
+        self._verbose : bool = verbose
+        self._on_game_over : GameOverPolicy = on_game_over
+        self._scoreboard : Optional[Scoreboard] = scoreboard
+        self._view : Optional[GameView] = None # published after every change when concurrent, see view
+        if concurrent:
+            self._publish()
+
+    def reset(self) -> None:
+        """
+        ScoreKeeper reset method for Bowler Program. Starts a new game in place, reusing the existing roll buffers. Keeps rounds, rules, verbose and the GameOverPolicy.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        self._clear()
+        if self._view is not None:
+            self._publish()
+
+    def _clear(self) -> None:
+        """
+        ScoreKeeper private void Clear method for Bowler Program. Empties the game for reset, without publishing it to concurrent readers.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        pinfall, marks, addends, totals = _blank_game(self._rounds, self._rules.rules)
+        self._pinfall[:] = pinfall
+        self._marks[:] = marks
+        self._addends[:] = addends
+        self._totals[:] = totals
+        self._leaves = None
+        self._frame = 0
+        self._position = 0
+        self._state = GameState.FIRST_ROLL
+        self._score = 0
+        self._pins = self._rules.pins
+
+    def snapshot(self) -> bytes:
+        """
+        ScoreKeeper snapshot method for Bowler Program. Returns the full state of a game, finished or not, as a compact byte string for ScoreKeeper.restore.
+        The leaves follow the roll buffers only when the game has any.
+
+        Data Properties:
+
+        Returns:
+            - Snapshot of the game (bytes)
+        """
+        return (SNAPSHOT.pack(self._rounds, self._frame, self._position, self._pins, self._score) + pack_rules(self._rules.rules)
+                + self._pinfall.tobytes() + self._marks.tobytes() + self._addends.tobytes() + self._totals.tobytes()
+                + (b"" if self._leaves is None else self._leaves.tobytes()))
+
+    @classmethod
+    def restore(cls, snapshot : bytes, verbose : bool = False, on_game_over : GameOverPolicy = GameOverPolicy.PROMPT, scoreboard : Optional[Scoreboard] = None,
+                concurrent : bool = False) -> "ScoreKeeper":
+        """
+        ScoreKeeper restore method for Bowler Program. Rebuilds a game from ScoreKeeper.snapshot without replaying its rolls.
+        Will raise a ValueError if the snapshot is malformed.
+
+        Data Properties:
+            snapshot : bytes - or any bytes-like buffer, e.g. a memoryview slice of a checkpoint
+            verbose : bool
+            on_game_over : GameOverPolicy
+            scoreboard : Optional[Scoreboard]
+            concurrent : bool - publish a GameView after every change, see view
+
+        Returns:
+            - The restored game (ScoreKeeper)
+        """
+        if len(snapshot) < SNAPSHOT.size + PACKED.size:
+            raise ValueError("Malformed ScoreKeeper snapshot.")
+        rounds, frame, position, pins, score = SNAPSHOT.unpack_from(snapshot)
+        rules : CompiledRules = compile_rules(unpack_rules(snapshot, SNAPSHOT.size))
+        slots : int = rules.slots(rounds)
+        start : int = SNAPSHOT.size + PACKED.size
+        totals : int = start + 2 * slots + rounds
+        leaves : int = totals + 4 * rounds
+        if len(snapshot) not in (leaves, leaves + 2 * slots) or frame >= rounds or position >= len(rules.positions):
+            raise ValueError("Malformed ScoreKeeper snapshot.")
+        self : ScoreKeeper = cls.__new__(cls)
+        self._pinfall, self._marks, self._addends, self._totals = array('b'), array('b'), array('b'), array('i')
+        self._pinfall.frombytes(snapshot[start:start + slots])
+        self._marks.frombytes(snapshot[start + slots:start + 2 * slots])
+        self._addends.frombytes(snapshot[start + 2 * slots:totals])
+        self._totals.frombytes(snapshot[totals:leaves])
+        self._leaves = None
+        if len(snapshot) > leaves:
+            self._leaves = array('H')
+            self._leaves.frombytes(snapshot[leaves:])
+        self._frame = frame
+        self._position = position
+        self._state = rules.states[position]
+        self._score = score
+        self._pins = pins
+        self._rounds = rounds
+        self._rules = rules
+        self._verbose = verbose
+        self._on_game_over = on_game_over
+        self._scoreboard = scoreboard
+        self._view = None
+        if concurrent:
+            self._publish()
+        return self
+
+    @classmethod
+    def bind(cls, pinfall : memoryview, marks : memoryview, addends : memoryview, totals : memoryview, rules : Rules = TENPIN, verbose : bool = False,
+             on_game_over : GameOverPolicy = GameOverPolicy.PROMPT, scoreboard : Optional[Scoreboard] = None, concurrent : bool = False) -> "ScoreKeeper":
+        """
+        ScoreKeeper bind method for Bowler Program. Starts a new game kept in slices of buffers shared with other games, e.g. every bowler of a Match in one set of arrays.
+        The slices are memoryviews of arrays with the formats and lengths _blank_game gives for the game's rounds and rules, and are cleared to an empty game.
+
+        Data Properties:
+            pinfall : memoryview - one slot per roll slot of the rules
+            marks : memoryview - one slot per roll slot of the rules
+            addends : memoryview - rounds slots
+            totals : memoryview - rounds slots
+            rules : Rules
+            verbose : bool
+            on_game_over : GameOverPolicy
+            scoreboard : Optional[Scoreboard]
+            concurrent : bool - publish a GameView after every change, see view
+
+        Returns:
+            - The new game (ScoreKeeper)
+        """
+        self : ScoreKeeper = cls.__new__(cls)
+        self._pinfall, self._marks, self._addends, self._totals = pinfall, marks, addends, totals
+        self._rounds = len(addends)
+        self._rules = compile_rules(rules)
+        self._verbose = verbose
+        self._on_game_over = on_game_over
+        self._scoreboard = scoreboard
+        self._view = None
+        self.reset()
+        if concurrent:
+            self._publish()
+        return self
+
+    @property
+    def _frames(self) -> Frames:
+        """
+        ScoreKeeper private Read-Only frames Property for Bowler Program. Returns a lazy view of the game's frames over the compact roll buffers.
+        The Frame and Roll views are only imported on first use.
+
+        Data Properties:
+
+        Returns:
+            - Sequence of the game's frames (Frames)
+        """
+        from .Frame import Frames
+        return Frames(self._pinfall, self._marks, self._addends, self._rules.balls, self._rules.pins)
+    
+    @property
+    def frame(self) -> int:
+        """
+        ScoreKeeper Read-Only frame Property for Bowler Program. Returns current frame of the Game.
+
+        Data Properties:
+
+        Returns:
+            - Current frame of the game (int)
+        """
+        return self._frame
+    
+    @property
+    def score(self) -> int:
+        """
+        ScoreKeeper Read-Only score Property for Bowler Program. Returns current score of a Game.
+
+        Data Properties:
+
+        Returns:
+            - Current score of the game (int)
+        """
+        return self._score
+    
+    @property
+    def pins(self) -> int:
+        """
+        ScoreKeeper Read-Only pin Property for Bowler Program. Returns current pins of a Game.
+
+        Data Properties:
+
+        Returns:
+            - Current number of pins standing (int)
+        """
+        return self._pins
+
+    @property
+    def rounds(self) -> int:
+        """
+        ScoreKeeper Read-Only round Property for Bowler Program. Returns current round of a Game.
+
+        Data Properties:
+
+        Returns:
+            - Current round (int)
+        """
+        return self._rounds
+
+    @property
+    def rules(self) -> Rules:
+        """
+        ScoreKeeper Read-Only rules Property for Bowler Program. Returns the scoring rules of a Game.
+
+        Data Properties:
+
+        Returns:
+            - Rules of the game (Rules)
+        """
+        return self._rules.rules
+
+    @property
+    def leaves(self) -> Optional[array]:
+        """
+        ScoreKeeper Read-Only leaves Property for Bowler Program. Returns the leave of every roll slot: the pins left standing, pin n in bit n - 1, and the
+        KNOWN, FULL, SPLIT and FOUL flags of leaves.py. Slots of rolls made without standing pins are 0.
+
+        Data Properties:
+
+        Returns:
+            - One leave per roll slot, None until a roll is given its standing pins or a foul (Optional[array])
+        """
+        return self._leaves
+
+    @property
+    def view(self) -> GameView:
+        """
+        ScoreKeeper Read-Only view Property for Bowler Program. Returns the score, frame, pins, moves remaining, state and frame scores of a game as one immutable GameView.
+        A concurrent ScoreKeeper (concurrent=True) returns the view published after its last change, so threads reading while another rolls
+        always see a whole roll applied or not at all, without a lock: the view is swapped in by one attribute store once the roll is complete.
+        The game must still be changed from one thread at a time. Otherwise the view is made on each call.
+
+        Data Properties:
+
+        Returns:
+            - The game as it stands (GameView)
+        """
+        view : Optional[GameView] = self._view
+        return view if view is not None else self._make_view(0)
+
+    def _make_view(self, version: int) -> GameView:
+        """
+        ScoreKeeper private Make View method for Bowler Program. Copies what a GameView holds out of the game.
+
+        Data Properties:
+            version : int
+
+        Returns:
+            - The game as it stands (GameView)
+        """
+        frame : int = self._frame
+        rolled : int = frame + (self._marks[self._rules.balls * frame] != RollState.EMPTY.value) # frames with a roll in them
+        return GameView(self._score, frame, self._pins, self.movesRemaining(), self._state, tuple(self._totals[:rolled]), version)
+
+    def _publish(self) -> None:
+        """
+        ScoreKeeper private void Publish method for Bowler Program. Publishes the game as it stands to concurrent readers, see view.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        self._view = self._make_view(self._view.version + 1 if self._view is not None else 1)
+
+    def movesRemaining(self) -> int:
+        """
+        ScoreKeeper movesRemaining Method for Bowler Program. Returns the most moves left in a Game, counting the fill balls of the last frame.
+
+        Data Properties:
+
+        Returns:
+            - Number of moves left in the game (int)
+        """
+        rules : CompiledRules = self._rules
+        remaining_frames: int = self._rounds - self._frame - 1
+        moves : int = rules.moves[self._position * 2 + (remaining_frames == 0)] # rolls left in the current frame
+        if remaining_frames:
+            moves += (remaining_frames - 1) * rules.balls + rules.last_slots
+        return moves
+
+    def roll(self, pins, leave : Optional[int] = None, foul : bool = False) -> None:
+        """
+        ScoreKeeper roll method for Bowler Program. Handles the game stage mechanics of a game and allocates points.
+        Given the pins left standing, the roll also records its leave: a ball at a full ten pin rack that leaves a split is marked SPLIT,
+        and a roll of 0 that knocked pins down, or one reported as a foul, is marked FOUL and its pins are respotted.
+        Will raise a ValueError if the standing pins do not match the roll.
+
+        Data Properties:
+            - pins : int - Number of pins that are knocked
+            - leave : Optional[int] - pins left standing after the ball, pin n in bit n - 1 (see leaves.leave_mask)
+            - foul : bool - the ball was a foul, pins must be 0
+
+        Returns:
+            - None
+            - If ScoreKeeper's verbose attribute if enabled roll will print the game's progress after each turn.
+            - After the game has ended the roll is handled by the ScoreKeeper's GameOverPolicy: PROMPT asks on stdin, RAISE raises GameOverError,
+              IGNORE drops the roll and RESTART resets the game and scores the roll in the new one.
+        """
+        # validaiton
+        if pins < 0 or pins > self._pins:
+            raise Exception(f"Roll Exceeds # of Available Pins. \n Roll: {pins} , Available Pins: {self._pins}")
+
+        if self._state == GameState.GAME_END:
+            if self._on_game_over == GameOverPolicy.IGNORE:
+                return
+            elif self._on_game_over == GameOverPolicy.RAISE:
+                raise GameOverError(f"The Game is Over. Final Score: {self._score}")
+            if leave is not None or foul: # checked at the new game's full rack before the finished game is cleared for it
+                from .leaves import encode_leave
+                rack : int = self._rules.pins
+                encode_leave(pins, leave, foul, (1 << rack) - 1, rack, True, rack)
+            if self._on_game_over == GameOverPolicy.RESTART:
+                self._clear() # published with the roll, concurrent readers never see the empty game
+            else:
+                self._prompt_restart()
+                if self._state == GameState.GAME_END:
+                    return
+
+        if leave is None and not foul:
+            self._apply(pins)
+        else:
+            encoded, mark = self._leave(pins, leave, foul) # checked before the roll changes anything
+            self._stamp(self._apply(pins), encoded, mark)
+        if self._view is not None:
+            self._publish()
+
+        if self._verbose:
+            self.show_scoreboard()
+
+    def _apply(self, pins: int) -> int:
+        """
+        ScoreKeeper private Apply method for Bowler Program. Scores a legal roll of a game in progress: marks its slot, allocates bonuses and moves the game state on.
+
+        Data Properties:
+            pins : int
+
+        Returns:
+            - Roll slot the roll was stored in (int)
+        """
+        # one table lookup decides the roll's slot, marks, bonuses, next state and frame advance (see transitions.CompiledRules.index)
+        frame : int = self._frame
+        rules : CompiledRules = self._rules
+        position, state, slot, mark, striked, bonus, advance, standing, score = rules.transitions[(self._position * 2 + (frame == self._rounds - 1)) * rules.width + pins]
+
+        for back in bonus: # STRIKE and SPARE addends of earlier frames
+            self._addend(frame - back, score)
+        slot += rules.balls * frame
+        self._pinfall[slot] = pins # what was knocked, a no-tap strike scores the full rack but replays as the pins it took
+        self._marks[slot] = mark
+        for unused in range(slot + 1, slot + 1 + striked):
+            self._marks[unused] = RollState.STRIKED.value
+        self._score += score # running total
+        self._credit(frame, score)
+        self._position = position
+        self._state = state
+        self._pins = standing
+        if advance:
+            self._advance(frame) # move to next frame
+        return slot
+
+    def _leave(self, pins: int, leave: Optional[int], foul: bool) -> Tuple[int, Optional[int]]:
+        """
+        ScoreKeeper private Leave method for Bowler Program. Works out the leave of a legal roll about to be scored, from the pins standing before it.
+        The leave helpers are only imported by the first roll given its standing pins.
+        Will raise a ValueError if the standing pins do not match the roll.
+
+        Data Properties:
+            pins : int
+            leave : Optional[int]
+            foul : bool
+
+        Returns:
+            - Leave of the roll and the RollState value it marks, None to keep the one the roll scores (Tuple[int, Optional[int]])
+        """
+        from .leaves import KNOWN, PINS, encode_leave, leave_mark
+        rules : CompiledRules = self._rules
+        frame : int = self._frame
+        slot : int = rules.transitions[(self._position * 2 + (frame == self._rounds - 1)) * rules.width + pins].slot + rules.balls * frame
+        full : bool = rules.positions[self._position].fresh
+        before : Optional[int] = (1 << rules.pins) - 1 if full else None
+        if not full and self._leaves is not None and self._leaves[slot - 1] & KNOWN:
+            before = self._leaves[slot - 1] & PINS # the pins the ball before left
+        encoded : int = encode_leave(pins, leave, foul, before, self._pins, full, rules.pins)
+        if self._leaves is None:
+            self._leaves = array('H', bytes(2 * len(self._marks)))
+        return encoded, leave_mark(encoded)
+
+    def _stamp(self, slot: int, leave: int, mark: Optional[int]) -> None:
+        """
+        ScoreKeeper private void Stamp method for Bowler Program. Stores the leave of a roll and marks a foul or split in place of its OPEN RollState.
+
+        Data Properties:
+            slot : int
+            leave : int
+            mark : Optional[int] - RollState value from leaves.leave_mark
+
+        Returns:
+            - None
+        """
+        self._leaves[slot] = leave
+        if mark is not None:
+            self._marks[slot] = mark
+
+    def correct(self, frame: int, roll: int, pins: int) -> None:
+        """
+        ScoreKeeper correct method for Bowler Program. Changes the pins of a roll already made, e.g. a mis-read pinfall, and rescores the game from that frame on.
+        Only the edited frame, the bonuses it owes the two frames before it and the frames after it are recomputed, from the rolls stored in the game's buffers.
+        The leaves of the edited roll and the rest of its frame are dropped, fouls excepted, as are those of later rolls the edit moves to another slot.
+        Will raise a ValueError if the roll has not been made or the correction makes a later roll illegal, the game is left unchanged.
+
+        Data Properties:
+            frame : int - 0-frames
+            roll : int - 0-rolls of the frame
+            pins : int
+
+        Returns:
+            - None
+        """
+        empty, striked = RollState.EMPTY.value, RollState.STRIKED.value
+        balls : int = self._rules.balls
+        slot : int = balls * frame + roll
+        if not (0 <= frame < self._rounds and 0 <= roll < (self._rules.last_slots if frame == self._rounds - 1 else balls)) or self._marks[slot] in (empty, striked):
+            raise ValueError(f"Frame {frame + 1} has no roll {roll + 1} to correct.")
+        position : int = sum(1 for mark in self._marks[balls * frame:slot] if mark != empty and mark != striked) # rolls made before it in the frame
+        leaves : List[Tuple[int, int]] = self._taken_leaves(frame)
+        rolls : List[int] = self._rewind(frame)
+        corrected : List[int] = rolls[:position] + [pins] + rolls[position + 1:]
+        kept : List[Tuple[int, int]] = []
+        if leaves: # the standing pins after the edited roll no longer hold in its frame, a foul is still a foul
+            from .leaves import FOUL
+            end : int = balls * (frame + 1) if frame < self._rounds - 1 else len(self._marks)
+            kept = [(taken, leave if index < position or taken >= end else leave & FOUL if index > position else 0) for index, (taken, leave) in enumerate(leaves)]
+        if not self._replay(corrected, kept):
+            self._rewind(frame)
+            self._replay(rolls, leaves)
+            raise ValueError(f"Correcting frame {frame + 1} roll {roll + 1} to {pins} makes the rolls after it illegal: {corrected}")
+        if self._view is not None:
+            self._publish()
+
+        if self._verbose:
+            self.show_scoreboard()
+
+    def undo(self) -> None:
+        """
+        ScoreKeeper undo method for Bowler Program. Takes back the last roll of the game, rescoring only the frames it touched.
+        Will raise a ValueError if no roll has been made.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        frame : int = self._frame
+        if self._marks[self._rules.balls * frame] == RollState.EMPTY.value: # the last roll ended the frame before
+            frame -= 1
+        if frame < 0:
+            raise ValueError("There is no roll to undo.")
+        leaves : List[Tuple[int, int]] = self._taken_leaves(frame)
+        self._replay(self._rewind(frame)[:-1], leaves[:-1])
+        if self._view is not None:
+            self._publish()
+
+        if self._verbose:
+            self.show_scoreboard()
+
+    def _rewind(self, frame: int) -> List[int]:
+        """
+        ScoreKeeper private Rewind method for Bowler Program. Takes back every roll from a frame on, including the bonuses they paid to the frames before it.
+
+        Data Properties:
+            frame : int
+
+        Returns:
+            - Pins of the rolls taken back in the order they were rolled (List[int])
+        """
+        empty, striked, strike, spare = RollState.EMPTY.value, RollState.STRIKED.value, RollState.STRIKE.value, RollState.SPARE.value
+        rules : CompiledRules = self._rules
+        rack : int = rules.pins
+        start : int = rules.balls * frame
+        rolls : List[int] = [self._pinfall[slot] for slot in range(start, len(self._marks)) if self._marks[slot] != empty and self._marks[slot] != striked]
+
+        # a frame's bonus is paid by the rolls after its mark, keep the part rolled before this frame and work out what it is still owed
+        owed : List[int] = []
+        for previous in range(frame - 1, max(frame - rules.reach, 0) - 1, -1):
+            first : int = rules.balls * previous
+            marked : int = next((slot for slot in range(first, first + rules.balls) if self._marks[slot] == strike or self._marks[slot] == spare), -1)
+            paid : List[int] = [] if marked < 0 else [rack if self._marks[slot] == strike else self._pinfall[slot] # a no-tap strike paid the full rack
+                                                      for slot in range(marked + 1, start) if self._marks[slot] != empty and self._marks[slot] != striked]
+            balls : int = 0 if marked < 0 else rules.rules.bonus[marked - first]
+            taken : int = self._addends[previous] - sum(paid[:balls])
+            self._addends[previous] -= taken
+            for index in range(previous, frame):
+                self._totals[index] -= taken
+            owed.append(max(balls - len(paid), 0))
+
+        pinfall, marks, addends, totals = _blank_game(self._rounds, rules.rules)
+        if self._leaves is not None:
+            self._leaves[start:] = array('H', bytes(2 * (len(self._leaves) - start)))
+        self._pinfall[start:] = pinfall[start:]
+        self._marks[start:] = marks[start:]
+        self._addends[frame:] = addends[frame:]
+        self._totals[frame:] = totals[frame:]
+        self._score = self._totals[frame - 1] if frame > 0 else 0
+        self._totals[frame] = self._score
+        self._frame = frame
+        self._position = rules.start(tuple(owed))
+        self._state = rules.states[self._position]
+        self._pins = rules.pins
+        return rolls
+
+    def _taken_leaves(self, frame: int) -> List[Tuple[int, int]]:
+        """
+        ScoreKeeper private Taken Leaves method for Bowler Program. Returns the slot and leave of every roll _rewind would take back from a frame on.
+
+        Data Properties:
+            frame : int
+
+        Returns:
+            - (slot, leave) per roll in the order they were rolled, empty when the game has no leaves (List[Tuple[int, int]])
+        """
+        if self._leaves is None:
+            return []
+        empty, striked = RollState.EMPTY.value, RollState.STRIKED.value
+        return [(slot, self._leaves[slot]) for slot in range(self._rules.balls * frame, len(self._marks)) if self._marks[slot] != empty and self._marks[slot] != striked]
+
+    def _replay(self, rolls: List[int], leaves: List[Tuple[int, int]] = ()) -> bool:
+        """
+        ScoreKeeper private Replay method for Bowler Program. Scores rolls taken back by _rewind, stopping at the first illegal one.
+        A roll's leave is put back when the roll lands in the slot it was taken from.
+
+        Data Properties:
+            rolls : List[int]
+            leaves : List[Tuple[int, int]] - (slot, leave) per roll from _taken_leaves
+
+        Returns:
+            - Whether every roll was legal (bool)
+        """
+        if leaves:
+            from .leaves import leave_mark
+        for index, pins in enumerate(rolls):
+            if self._state == GameState.GAME_END or not 0 <= pins <= self._pins:
+                return False
+            slot : int = self._apply(pins)
+            if index < len(leaves):
+                taken, leave = leaves[index]
+                if taken == slot and leave:
+                    self._stamp(slot, leave, leave_mark(leave))
+        return True
+
+    def _addend(self, frame: int , pins: int) -> None:
+        """
+        ScoreKeeper private void Addend method for Bowler Program. Handles point allocation for previous frames that were strikes or spares.
+
+        Data Properties:
+            frame : int
+            pins: int
+
+        Returns:
+            - None
+        """
+        self._addends[frame] += pins
+        self._score += pins
+        self._credit(frame, pins)
+
+    def _credit(self, frame: int, pins: int) -> None:
+        """
+        ScoreKeeper private void Credit method for Bowler Program. Adds points scored in a frame to the cumulative totals from that frame up to the current frame.
+        Bonuses only reach back two frames, so at most three totals are touched.
+
+        Data Properties:
+            frame : int
+            pins: int
+
+        Returns:
+            - None
+        """
+        for index in range(frame, self._frame + 1):
+            self._totals[index] += pins
+
+    def _advance(self, frame: int) -> None:
+        """
+        ScoreKeeper private void Advance method for Bowler Program. Moves the game to the frame after frame and carries the cumulative total into it.
+
+        Data Properties:
+            frame : int
+
+        Returns:
+            - None
+        """
+        self._frame = frame + 1
+        self._totals[frame + 1] = self._totals[frame]
+
+    def cumulative_score(self, frame: int) -> Optional[int]:
+        """
+        ScoreKeeper cumulative_score Method for Bowler Program. Returns the running score of a game through a frame, as shown on the scoreboard.
+
+        Data Properties:
+            frame : int - 0-frames
+
+        Returns:
+            - Running score through the frame, or None if the frame has not been rolled yet (Optional[int])
+        """
+        if self._marks[self._rules.balls * frame] == RollState.EMPTY.value:
+            return None
+        return self._totals[frame]
+
+    def rolls(self) -> List[int]:
+        """
+        ScoreKeeper rolls Method for Bowler Program. Returns the pins of every roll made so far in the order they were rolled.
+
+        Data Properties:
+
+        Returns:
+            - Pins knocked per roll (List[int])
+        """
+        empty, striked = RollState.EMPTY.value, RollState.STRIKED.value
+        return [self._pinfall[slot] for slot, mark in enumerate(self._marks) if mark != empty and mark != striked]
+    
+    def _prompt_restart(self) -> None:
+        """
+        ScoreKeeper private void Prompt Restart method for Bowler Program. Asks on stdin whether to start a new game after the game has ended and resets the game on Y.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        print("Sorry! The Game is Over. Would you Like to Restart?")
+        keep_playing: str = input("Y/N?")
+        if keep_playing == "Y":
+            self._clear() # published with the roll that asked
+        elif keep_playing == "N":
+            print("Goodbye!")
+        else:
+            print("Sorry! Please enter Y or N")
+    
+    def show_scoreboard(self):
+        """
+        ScoreKeeper public void Show Scoreboard method for Bowler Program. Prints a custom grid view of a game's progress including current round, frame, score, remaining pins, and moves.
+        The board is built by the ScoreKeeper's Scoreboard and written in one call, see render.Scoreboard for plain and delta output.
+
+        Data Properties:
+
+        Returns:
+            - None
+        
+        # Adopted from: https://github.com/BnkColon/bowling-scoreboard/blob/b7711251eaf43e4c1833d69467bec53c54af2ecb/bowling-scoreboard.py#L114 
+        """
+        global DEFAULT_SCOREBOARD
+        if self._scoreboard is None and DEFAULT_SCOREBOARD is None:
+            from .render import Scoreboard
+            DEFAULT_SCOREBOARD = Scoreboard()
+        (self._scoreboard or DEFAULT_SCOREBOARD).show(self)
@@ -0,0 +1,7 @@
+"""
+Python-Based Bowling ScoreKeeper Program.
+
+Importing the package loads nothing else. Import the module you need, e.g. `from bowling.ScoreKeeper import ScoreKeeper`:
+the scorer itself only loads what a roll needs, and the scoreboard, the frame views and the optional engines (batch,
+stream, shard, server, archive, checkpoint, instrument) load on first use.
+"""
@@ -0,0 +1,92 @@
+import argparse
+import random
+import sys
+from typing import List, Optional
+from .ScoreKeeper import ScoreKeeper
+from .generator import random_moves
+from .rules import RULES, Rules
+
+def moves(seed : Optional[int] = None) -> List[List[Optional[int]]]:
+    return random_moves(random.Random(seed))
+
+def play(moves : List[List[Optional[int]]], scoreKeeper : ScoreKeeper = ScoreKeeper()):
+    for i in range(len(moves) - 1):
+        first_roll, second_roll = moves[i]
+        scoreKeeper.roll(first_roll)
+        if second_roll is not None:
+            scoreKeeper.roll(second_roll)
+    first_roll, second_roll, third_roll = moves[len(moves) - 1]
+    scoreKeeper.roll(first_roll)
+    scoreKeeper.roll(second_roll)
+    if third_roll is not None:
+        scoreKeeper.roll(third_roll)
+
+
+def stream(path : str, rules : Rules) -> None:
+    from .stream import score_stream
+    source = sys.stdin if path == "-" else open(path)
+    try:
+        for record in score_stream(source, rules=rules):
+            print(record, flush=True)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+def shard(path : str, workers : Optional[int], rules : Rules) -> None:
+    from .shard import score_file
+    with open(path, "rb") as source:
+        sys.stdout.writelines(f"{score}\n" for score in score_file(source, workers=workers, rules=rules))
+
+def serve(address : str, path : Optional[str], rules : Rules) -> None:
+    import asyncio
+    from .server import serve
+    host, _, port = address.rpartition(":")
+    try:
+        asyncio.run(serve(host=host or "127.0.0.1", port=int(port), path=path, rules=rules))
+    except KeyboardInterrupt:
+        pass
+
+def metrics(address : Optional[str], path : Optional[str]) -> None:
+    import atexit
+    from . import instrument
+    instrument.install()
+    if address is not None:
+        host, _, port = address.rpartition(":")
+        instrument.serve_metrics(host=host or "127.0.0.1", port=int(port))
+    if path is not None:
+        atexit.register(instrument.write_prometheus, path)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="bowling", description="Python-Based Bowling ScoreKeeper Program.")
+    parser.add_argument("--stream", metavar="FILE", nargs="?", const="-", help="score newline-delimited 'lane game pins' roll events from FILE (default: stdin) and print each game as it ends")
+    parser.add_argument("--shard", metavar="FILE", help="rescore a game file (one game per line, rolls separated by spaces) across worker processes and print one score per line")
+    parser.add_argument("--workers", type=int, help="number of worker processes for --shard (default: number of CPUs)")
+    parser.add_argument("--serve", metavar="HOST:PORT", nargs="?", const="127.0.0.1:7010", help="run the asyncio lane server on a TCP address (default: 127.0.0.1:7010)")
+    parser.add_argument("--unix", metavar="PATH", help="with --serve, listen on a Unix socket instead of TCP")
+    parser.add_argument("--rules", choices=sorted(RULES), default="tenpin", help="scoring rules of the games for --stream, --shard and --serve (default: tenpin)")
+    parser.add_argument("--seed", type=int, help="seed of the randomly generated demo game")
+    parser.add_argument("--metrics", metavar="HOST:PORT", nargs="?", const="127.0.0.1:9710", help="instrument ScoreKeeper and serve Prometheus metrics over HTTP (default: 127.0.0.1:9710); --shard workers are not covered")
+    parser.add_argument("--metrics-file", metavar="FILE", help="instrument ScoreKeeper and write Prometheus metrics to FILE on exit")
+    args = parser.parse_args()
+
+    if args.metrics is not None or args.metrics_file is not None:
+        metrics(args.metrics, args.metrics_file)
+
+    rules : Rules = RULES[args.rules]
+    if args.serve is not None:
+        serve(args.serve, args.unix, rules)
+        return
+
+    if args.shard is not None:
+        shard(args.shard, args.workers, rules)
+        return
+
+    if args.stream is not None:
+        stream(args.stream, rules)
+        return
+
+    scoreKeeper : ScoreKeeper = ScoreKeeper(verbose=True)
+    play(moves=moves(args.seed), scoreKeeper=scoreKeeper)
+
+if __name__ == '__main__':
+    main()
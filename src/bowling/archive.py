@@ -0,0 +1,253 @@
+import mmap
+import os
+import struct
+from typing import BinaryIO, Iterator, NamedTuple, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameState, RollState
+from .rules import NINE_PIN_NO_TAP, TENPIN
+
+MAGIC : bytes = b"BWLR"
+VERSION : int = 1
+HEADER : struct.Struct = struct.Struct("<4sHH8x") # magic, version, record size
+RECORD : struct.Struct = struct.Struct("<QIHH10H11sB") # game id, timestamp, lane, final score, cumulative frame scores, 21 pin nibbles, roll count
+ROUNDS : int = 10
+SLOTS : int = 2 * ROUNDS + 1
+EMPTY_NIBBLE : int = 0xF
+
+class ArchivedGame(NamedTuple):
+    """
+        ArchivedGame Class for Bowler Program. A completed game decoded from a binary archive record.
+
+        Data Properties:
+            - game      : int - game id
+            - lane      : int - lane id
+            - timestamp : int - seconds since the epoch
+            - score     : int - final score
+            - frames    : Tuple[int, ...] - cumulative score per frame
+            - rolls     : Tuple[int, ...] - pins per roll in the order they were rolled
+    """
+    game : int
+    lane : int
+    timestamp : int
+    score : int
+    frames : Tuple[int, ...]
+    rolls : Tuple[int, ...]
+
+def pack_rolls(rolls) -> bytes:
+    """
+    Archive pack_rolls Function for Bowler Program. Packs up to 21 rolls two per byte, low nibble first, unused nibbles set to 0xF.
+
+    Data Properties:
+        rolls : Sequence[int]
+
+    Returns:
+        - 11 packed bytes (bytes)
+    """
+    nibbles = list(rolls) + [EMPTY_NIBBLE] * (SLOTS + 1 - len(rolls))
+    return bytes(nibbles[i] | nibbles[i + 1] << 4 for i in range(0, SLOTS + 1, 2))
+
+def unpack_rolls(packed : bytes, count : int) -> Tuple[int, ...]:
+    """
+    Archive unpack_rolls Function for Bowler Program. Unpacks the rolls of a record.
+
+    Data Properties:
+        packed : bytes
+        count : int
+
+    Returns:
+        - Pins per roll (Tuple[int, ...])
+    """
+    return tuple((packed[i >> 1] >> (4 * (i & 1))) & 0xF for i in range(count))
+
+def pack_game(scoreKeeper : ScoreKeeper, game : int = 0, lane : int = 0, timestamp : int = 0) -> bytes:
+    """
+    Archive pack_game Function for Bowler Program. Serializes a finished ten frame game into one fixed-width record.
+    Will raise a ValueError if the game is not finished, does not have ten frames or is not scored like tenpin (9-pin no-tap strikes are stored as 10 and qualify).
+
+    Data Properties:
+        scoreKeeper : ScoreKeeper
+        game : int
+        lane : int
+        timestamp : int
+
+    Returns:
+        - One record of RECORD.size bytes (bytes)
+    """
+    if scoreKeeper.rounds != ROUNDS or scoreKeeper._state != GameState.GAME_END or scoreKeeper.rules not in (TENPIN, NINE_PIN_NO_TAP):
+        raise ValueError("Only finished ten frame tenpin games can be archived.")
+    empty, striked, strike = RollState.EMPTY.value, RollState.STRIKED.value, RollState.STRIKE.value
+    rolls = [10 if mark == strike else pins for pins, mark in zip(scoreKeeper._pinfall, scoreKeeper._marks) if mark != empty and mark != striked] # a no-tap strike rescores as tenpin
+    frames = [scoreKeeper.cumulative_score(index) for index in range(ROUNDS)]
+    return RECORD.pack(game, timestamp, lane, scoreKeeper.score, *frames, pack_rolls(rolls), len(rolls))
+
+class RecordWriter():
+    """
+        RecordWriter Class for Bowler Program. Appends finished games to a binary archive, writing the file header when the file is empty.
+
+        Data Properties:
+            - count : int - records written by this writer
+    """
+    def __init__(self, file : BinaryIO):
+        self._file : BinaryIO = file
+        self._count : int = 0
+        if file.tell() == 0:
+            file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+    @property
+    def count(self) -> int:
+        """
+        RecordWriter Read-Only count Property for Bowler Program. Returns the number of records written by this writer.
+
+        Data Properties:
+
+        Returns:
+            - Records written (int)
+        """
+        return self._count
+
+    def write(self, scoreKeeper : ScoreKeeper, game : int = 0, lane : int = 0, timestamp : int = 0) -> None:
+        """
+        RecordWriter write Method for Bowler Program. Appends a finished game.
+
+        Data Properties:
+            scoreKeeper : ScoreKeeper
+            game : int
+            lane : int
+            timestamp : int
+
+        Returns:
+            - None
+        """
+        self._file.write(pack_game(scoreKeeper, game=game, lane=lane, timestamp=timestamp))
+        self._count += 1
+
+class RecordReader():
+    """
+        RecordReader Class for Bowler Program. Memory-maps a binary archive for random access and iteration without reading the whole file.
+        Use as a context manager, or call close() when done.
+
+        Data Properties:
+            - buffer : memoryview - the records, straight from the mapping
+    """
+    def __init__(self, path : str):
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < HEADER.size:
+                raise ValueError(f"{path} is not a game archive.")
+            self._map : mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, size = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or size != RECORD.size:
+            raise ValueError(f"{path} is not a version {VERSION} game archive.")
+        self._count : int = (len(self._map) - HEADER.size) // RECORD.size
+        self._buffer : memoryview = memoryview(self._map)[HEADER.size:HEADER.size + self._count * RECORD.size]
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        RecordReader Read-Only buffer Property for Bowler Program. Returns the records as a zero-copy view of the mapping.
+
+        Data Properties:
+
+        Returns:
+            - Records, RECORD.size bytes each (memoryview)
+        """
+        return self._buffer
+
+    def __len__(self) -> int:
+        """
+        RecordReader len Property for Bowler Program. Returns number of records in the archive.
+
+        Data Properties:
+
+        Returns:
+            - Number of records (int)
+        """
+        return self._count
+
+    def __getitem__(self, index : int) -> ArchivedGame:
+        """
+        RecordReader GetItem Property for Bowler Program. Decodes record N without touching the others.
+        Will raise an IndexError if index out of range.
+
+        Data Properties:
+            index : int
+
+        Returns:
+            - The game at the corresponding index (ArchivedGame)
+        """
+        if not (-self._count - 1 < index < self._count):
+            raise IndexError(f"Record index out of range. This archive has {self._count} records.")
+        return self._decode((index % self._count) * RECORD.size)
+
+    def __iter__(self) -> Iterator[ArchivedGame]:
+        """
+        RecordReader iter Property for Bowler Program. Decodes the records one at a time in file order.
+
+        Data Properties:
+
+        Returns:
+            - Iterator of games (Iterator[ArchivedGame])
+        """
+        for offset in range(0, self._count * RECORD.size, RECORD.size):
+            yield self._decode(offset)
+
+    def _decode(self, offset : int) -> ArchivedGame:
+        """
+        RecordReader private Decode method for Bowler Program. Decodes the record at a byte offset of the buffer.
+
+        Data Properties:
+            offset : int
+
+        Returns:
+            - The decoded game (ArchivedGame)
+        """
+        game, timestamp, lane, score, *frames, packed, count = RECORD.unpack_from(self._buffer, offset)
+        return ArchivedGame(game, lane, timestamp, score, tuple(frames), unpack_rolls(packed, count))
+
+    def records(self):
+        """
+        RecordReader records Method for Bowler Program. Returns the archive as a NumPy structured array over the mapping, without copying. Requires numpy.
+
+        Data Properties:
+
+        Returns:
+            - Structured array with fields game, timestamp, lane, score, frames, pins and rolls (np.ndarray)
+        """
+        import numpy as np
+        dtype = np.dtype([("game", "<u8"), ("timestamp", "<u4"), ("lane", "<u2"), ("score", "<u2"),
+                          ("frames", "<u2", (ROUNDS,)), ("pins", "u1", (11,)), ("rolls", "u1")])
+        return np.frombuffer(self._buffer, dtype=dtype, count=self._count)
+
+    def pins(self):
+        """
+        RecordReader pins Method for Bowler Program. Unpacks every record's rolls into the padded pin array batch.score_games takes. Requires numpy.
+
+        Data Properties:
+
+        Returns:
+            - Pin array of shape (records, 21) padded with -1 (np.ndarray)
+        """
+        import numpy as np
+        packed = self.records()["pins"]
+        nibbles = np.empty((self._count, 2 * packed.shape[1]), dtype=np.int8)
+        nibbles[:, 0::2] = packed & 0xF
+        nibbles[:, 1::2] = packed >> 4
+        nibbles[nibbles == EMPTY_NIBBLE] = -1
+        return nibbles[:, :SLOTS]
+
+    def close(self) -> None:
+        """
+        RecordReader close Method for Bowler Program. Releases the mapping. Arrays returned by records() must be dropped first.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        self._buffer.release()
+        self._map.close()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
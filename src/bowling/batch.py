@@ -0,0 +1,68 @@
+from typing import Tuple
+import numpy as np
+
+PAD : int = -1 # marks an unused roll slot in a padded game row
+
+def roll_slots(rounds : int = 10) -> int:
+    """
+    Batch roll_slots Function for Bowler Program. Returns the width of a padded game row.
+
+    Data Properties:
+        rounds : int
+
+    Returns:
+        - Maximum number of rolls in a game of the given rounds (int)
+    """
+    return 2 * rounds + 1
+
+def score_games(pins, rounds : int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batch score_games Function for Bowler Program. Scores many games at once without a ScoreKeeper per game.
+    Every row of pins holds one game's rolls in order, padded with PAD (-1) up to 2 * rounds + 1 columns.
+    One frame is scored per pass, for every game in the batch at once, strike and spare bonuses are read by looking ahead in the row.
+
+    Data Properties:
+        pins : array-like of shape (games, 2 * rounds + 1)
+        rounds : int
+
+    Returns:
+        - Final scores of shape (games,) (np.ndarray)
+        - Cumulative frame scores of shape (games, rounds), -1 for frames not yet rolled (np.ndarray)
+        - Games that are still in progress score the rolls known so far, as ScoreKeeper.show_scoreboard does
+    """
+    rows : np.ndarray = np.asarray(pins, dtype=np.int16)
+    if rows.ndim != 2 or rows.shape[1] > roll_slots(rounds):
+        raise ValueError(f"Pin array must have shape (games, {roll_slots(rounds)}). Got: {rows.shape}")
+    if rows.size and (rows.min() < PAD or rows.max() > 10):
+        raise ValueError("Pin counts must be between 0 and 10, or -1 for padding.")
+
+    games : int = rows.shape[0]
+    # two extra pad columns let the look-ahead of the last frame run off the end safely
+    padded : np.ndarray = np.full((games, roll_slots(rounds) + 2), PAD, dtype=np.int16)
+    padded[:, :rows.shape[1]] = rows
+    known : np.ndarray = padded >= 0
+    counted : np.ndarray = np.where(known, padded, 0)
+
+    index : np.ndarray = np.arange(games)
+    start : np.ndarray = np.zeros(games, dtype=np.intp)
+    cumulative : np.ndarray = np.zeros((games, rounds), dtype=np.int16)
+    total : np.ndarray = np.zeros(games, dtype=np.int16)
+
+    for frame in range(rounds):
+        first : np.ndarray = counted[index, start]
+        second : np.ndarray = counted[index, start + 1]
+        third : np.ndarray = counted[index, start + 2]
+        strike : np.ndarray = first == 10
+        spare : np.ndarray = ~strike & (first + second == 10)
+
+        if frame < rounds - 1:
+            score = np.where(strike | spare, 10 + third, first + second)
+            score = np.where(strike, score + second, score)
+        else: # the last frame keeps its own fill balls and earns no look-ahead
+            score = first + second + np.where(strike | spare, third, 0)
+
+        total += score
+        cumulative[:, frame] = np.where(known[index, start], total, -1)
+        start = start + np.where(strike & (frame < rounds - 1), 1, 2)
+
+    return total.astype(np.int32), cumulative
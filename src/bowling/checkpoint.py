@@ -0,0 +1,152 @@
+import os
+import struct
+import time
+from typing import Callable, Dict, Mapping
+from .ScoreKeeper import ScoreKeeper
+
+MAGIC : bytes = b"BWLC"
+HEADER : struct.Struct = struct.Struct("<4sI") # magic, number of games
+ENTRY : struct.Struct = struct.Struct("<HH") # key length, snapshot length, followed by the key and the snapshot
+
+def dump_checkpoint(games : Mapping[str, ScoreKeeper]) -> bytes:
+    """
+    Checkpoint dump_checkpoint Function for Bowler Program. Serializes the snapshots of many games into one buffer.
+
+    Data Properties:
+        games : Mapping[str, ScoreKeeper] - games by key, e.g. lane id
+
+    Returns:
+        - Checkpoint (bytes)
+    """
+    parts = [HEADER.pack(MAGIC, len(games))]
+    for key, scoreKeeper in games.items():
+        name : bytes = key.encode()
+        snapshot : bytes = scoreKeeper.snapshot()
+        parts += (ENTRY.pack(len(name), len(snapshot)), name, snapshot)
+    return b"".join(parts)
+
+def load_checkpoint(data : bytes, **options) -> Dict[str, ScoreKeeper]:
+    """
+    Checkpoint load_checkpoint Function for Bowler Program. Restores every game of a checkpoint without replaying rolls.
+    Will raise a ValueError if the checkpoint is malformed.
+
+    Data Properties:
+        data : bytes
+        options - verbose, on_game_over and scoreboard for ScoreKeeper.restore
+
+    Returns:
+        - Games by key (Dict[str, ScoreKeeper])
+    """
+    if len(data) < HEADER.size or HEADER.unpack_from(data)[0] != MAGIC:
+        raise ValueError("Not a ScoreKeeper checkpoint.")
+    _, count = HEADER.unpack_from(data)
+    view : memoryview = memoryview(data)
+    games : Dict[str, ScoreKeeper] = {}
+    offset : int = HEADER.size
+    for _ in range(count):
+        if offset + ENTRY.size > len(data):
+            raise ValueError("Malformed ScoreKeeper checkpoint.")
+        size, length = ENTRY.unpack_from(data, offset)
+        offset += ENTRY.size
+        if offset + size + length > len(data):
+            raise ValueError("Malformed ScoreKeeper checkpoint.")
+        key : str = str(view[offset:offset + size], "utf-8")
+        offset += size
+        games[key] = ScoreKeeper.restore(view[offset:offset + length], **options)
+        offset += length
+    if offset != len(data):
+        raise ValueError("Malformed ScoreKeeper checkpoint.")
+    return games
+
+def write_checkpoint(path : str, games : Mapping[str, ScoreKeeper]) -> None:
+    """
+    Checkpoint write_checkpoint Function for Bowler Program. Writes every game to a checkpoint file in one bulk write.
+    The file is written next to path, synced and renamed over it, so a crash never leaves a half written checkpoint.
+
+    Data Properties:
+        path : str
+        games : Mapping[str, ScoreKeeper]
+
+    Returns:
+        - None
+    """
+    data : bytes = dump_checkpoint(games)
+    temporary : str = f"{path}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporary, path)
+
+def read_checkpoint(path : str, **options) -> Dict[str, ScoreKeeper]:
+    """
+    Checkpoint read_checkpoint Function for Bowler Program. Restores every game of a checkpoint file.
+
+    Data Properties:
+        path : str
+        options - verbose, on_game_over and scoreboard for ScoreKeeper.restore
+
+    Returns:
+        - Games by key (Dict[str, ScoreKeeper])
+    """
+    with open(path, "rb") as file:
+        return load_checkpoint(file.read(), **options)
+
+class Checkpointer():
+    """
+        Checkpointer Class for Bowler Program. Writes periodic checkpoints of in-flight games from the loop that scores them.
+        Call tick after applying rolls, it writes a checkpoint once interval seconds have passed since the last one.
+
+        Data Properties:
+            - path : str
+            - interval : float - seconds between checkpoints
+            - count : int - checkpoints written
+    """
+    def __init__(self, path : str, interval : float = 5.0, clock : Callable[[], float] = time.monotonic):
+        self._path : str = path
+        self._interval : float = interval
+        self._clock : Callable[[], float] = clock
+        self._last : float = clock()
+        self._count : int = 0
+
+    @property
+    def count(self) -> int:
+        """
+        Checkpointer Read-Only count Property for Bowler Program. Returns the number of checkpoints written.
+
+        Data Properties:
+
+        Returns:
+            - Checkpoints written (int)
+        """
+        return self._count
+
+    def tick(self, games : Mapping[str, ScoreKeeper]) -> bool:
+        """
+        Checkpointer tick Method for Bowler Program. Writes a checkpoint of games if one is due.
+
+        Data Properties:
+            games : Mapping[str, ScoreKeeper]
+
+        Returns:
+            - Whether a checkpoint was written (bool)
+        """
+        now : float = self._clock()
+        if now - self._last < self._interval:
+            return False
+        self.checkpoint(games)
+        return True
+
+    def checkpoint(self, games : Mapping[str, ScoreKeeper]) -> None:
+        """
+        Checkpointer checkpoint Method for Bowler Program. Writes a checkpoint of games now.
+
+        Data Properties:
+            games : Mapping[str, ScoreKeeper]
+
+        Returns:
+            - None
+        """
+        write_checkpoint(self._path, games)
+        self._last = self._clock()
+        self._count += 1
@@ -0,0 +1,111 @@
+import asyncio
+import random
+import time
+from typing import List, Optional
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameOverPolicy
+
+class LaneClient():
+    """
+        LaneClient Class for Bowler Program. Client of a LaneServer that sends the rolls of one or more lanes over a single connection.
+
+        Data Properties:
+            - reader : asyncio.StreamReader
+            - writer : asyncio.StreamWriter
+    """
+    def __init__(self, reader : asyncio.StreamReader, writer : asyncio.StreamWriter):
+        self._reader : asyncio.StreamReader = reader
+        self._writer : asyncio.StreamWriter = writer
+
+    @classmethod
+    async def connect(cls, host : str = "127.0.0.1", port : int = 7010, path : Optional[str] = None) -> "LaneClient":
+        """
+        LaneClient connect coroutine for Bowler Program. Opens a connection to a LaneServer over TCP, or over a Unix socket when path is given.
+
+        Data Properties:
+            host : str
+            port : int
+            path : Optional[str] - Unix socket path
+
+        Returns:
+            - A connected client (LaneClient)
+        """
+        if path is not None:
+            return cls(*await asyncio.open_unix_connection(path))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def roll(self, lane : str, pins : int) -> int:
+        """
+        LaneClient roll coroutine for Bowler Program. Sends a roll and waits for the server's answer.
+        Will raise a ValueError if the server rejects the roll.
+
+        Data Properties:
+            lane : str
+            pins : int
+
+        Returns:
+            - Score of the lane after the roll (int)
+        """
+        self._writer.write(f"ROLL {lane} {pins}\n".encode())
+        reply : List[str] = (await self._reader.readline()).decode().split(maxsplit=1)
+        if not reply or reply[0] != "OK":
+            raise ValueError(f"Roll rejected: {' '.join(reply[1:]) or 'connection closed'}")
+        return int(reply[1])
+
+    async def close(self) -> None:
+        """
+        LaneClient close coroutine for Bowler Program. Closes the connection.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        self._writer.close()
+        await self._writer.wait_closed()
+
+async def generate_load(lanes : int = 50, rate : float = 10_000, duration : float = 5.0, seed : int = 0,
+                        host : str = "127.0.0.1", port : int = 7010, path : Optional[str] = None) -> List[float]:
+    """
+    Client generate_load coroutine for Bowler Program. Load generator that plays legal random games on many lanes at a fixed total roll rate.
+    Every lane has its own connection and sends on an open-loop schedule, so a slow reply shows up as latency instead of lowering the rate.
+
+    Data Properties:
+        lanes : int - number of concurrent lane connections
+        rate : float - total rolls per second across all lanes
+        duration : float - seconds to run
+        seed : int
+        host : str
+        port : int
+        path : Optional[str] - Unix socket path
+
+    Returns:
+        - Latency of every roll in seconds (List[float])
+    """
+    latencies : List[float] = []
+    interval : float = lanes / rate
+
+    async def lane(number : int) -> None:
+        rng : random.Random = random.Random(seed * 1_000_003 + number)
+        game : ScoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART) # tracks standing pins so every roll is legal
+        client : LaneClient = await LaneClient.connect(host=host, port=port, path=path)
+        name : str = f"lane-{number}"
+        start : float = time.perf_counter() + interval * number / lanes
+        end : float = start + duration
+        scheduled : float = start
+        try:
+            while scheduled < end:
+                delay : float = scheduled - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                pins : int = rng.randint(0, game.pins)
+                sent : float = time.perf_counter()
+                await client.roll(name, pins)
+                latencies.append(time.perf_counter() - sent)
+                game.roll(pins)
+                scheduled += interval
+        finally:
+            await client.close()
+
+    await asyncio.gather(*(lane(number) for number in range(lanes)))
+    return latencies
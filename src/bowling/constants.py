@@ -1,7 +1,10 @@
-
-from typing import Dict, Union
+from __future__ import annotations
 from enum import Enum, auto
 
+TYPE_CHECKING = False # typing is only imported by type checkers, it would double the import time of the scorer
+if TYPE_CHECKING:
+    from typing import Dict, Union
+
 class RollState(Enum):
     EMPTY = auto()
     OPEN = auto()
@@ -33,10 +36,20 @@ class GameState(Enum):
     STRIKE_TWO_ROLLS_AGO = auto()
     BONUS = auto()
     GAME_END = auto()
+    THIRD_ROLL = auto() # third ball of a three ball frame, e.g. candlepin
 
     def __str__(self):
         return str(self.name)
     
+class GameOverPolicy(Enum):
+    PROMPT = auto() # ask on stdin whether to restart
+    RAISE = auto() # raise GameOverError
+    IGNORE = auto() # drop the roll
+    RESTART = auto() # reset the ScoreKeeper and score the roll in a new game
+
+    def __str__(self):
+        return str(self.name)
+
 class RollStageEnum(Enum):
     FIRST_ROLL = 1
     SECOND_ROLL = 2
@@ -63,6 +76,7 @@ RollStage : Dict[GameState, RollStageEnum] = {
     GameState.STRIKE_TWO_ROLLS_AGO : RollStageEnum.SECOND_ROLL,
     GameState.BONUS : RollStageEnum.THIRD_ROLL,
     GameState.GAME_END : RollStageEnum.GAME_OVER,
+    GameState.THIRD_ROLL : RollStageEnum.THIRD_ROLL,
 }
 
 Symbols : Dict[Union[RollState, int], str] = {
@@ -70,6 +84,7 @@ Symbols : Dict[Union[RollState, int], str] = {
     RollState.SPARE : '/',
     RollState.STRIKE : 'X',
     RollState.STRIKED : '',
+    RollState.FOUL : 'F',
     0 : '-',
     1 : '1',
     2 : '2',
@@ -0,0 +1,227 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameState
+from .rules import TENPIN, Rules
+from .transitions import CompiledRules, Transition, compile_rules
+
+Position = Tuple[CompiledRules, int, int] # (rules, frames left including the current one, Position id in the rules' transition table)
+
+def position(scoreKeeper : ScoreKeeper) -> Position:
+    """
+    Distribution position Function for Bowler Program. Returns the part of a live game that decides how the rest of it can be scored.
+
+    Data Properties:
+        scoreKeeper : ScoreKeeper
+
+    Returns:
+        - (rules, frames left including the current one, Position id) (Position)
+    """
+    return (scoreKeeper._rules, scoreKeeper.rounds - scoreKeeper.frame, scoreKeeper._position)
+
+def _next(rules : CompiledRules, remaining : int, position : int, pins : int) -> Tuple[int, Position]:
+    """
+    Distribution private next Function for Bowler Program. Applies one roll to a position through the transition table.
+
+    Data Properties:
+        rules : CompiledRules
+        remaining : int
+        position : int
+        pins : int
+
+    Returns:
+        - Points the roll adds to the game including addends, and the position after it (Tuple[int, Position])
+    """
+    transition : Transition = rules.transitions[rules.index(position, remaining == 1, pins)]
+    points : int = transition.score * (1 + len(transition.bonus))
+    return points, (rules, remaining - transition.advance, transition.position)
+
+@lru_cache(maxsize=None)
+def _counts(rules : CompiledRules, remaining : int, position : int) -> Tuple[int, ...]:
+    """
+    Distribution private counts Function for Bowler Program. Counts the legal ways to finish a game from a position, by points still to be scored.
+    Memoized, so the whole game space of a ten frame game is covered by a few thousand sub-problems.
+
+    Data Properties:
+        rules : CompiledRules
+        remaining : int
+        position : int
+
+    Returns:
+        - Number of game endings per points still to be scored (Tuple[int, ...])
+    """
+    if rules.states[position] == GameState.GAME_END:
+        return (1,)
+    counts : list = []
+    for pins in range(rules.positions[position].standing + 1):
+        points, after = _next(rules, remaining, position, pins)
+        rest : Tuple[int, ...] = _counts(*after)
+        if len(counts) < points + len(rest):
+            counts.extend([0] * (points + len(rest) - len(counts)))
+        for extra, games in enumerate(rest):
+            counts[points + extra] += games
+    return tuple(counts)
+
+@lru_cache(maxsize=None)
+def _extremes(rules : CompiledRules, remaining : int, position : int) -> Tuple[int, int]:
+    """
+    Distribution private extremes Function for Bowler Program. Returns the fewest and most points that can still be scored from a position.
+
+    Data Properties:
+        rules : CompiledRules
+        remaining : int
+        position : int
+
+    Returns:
+        - (worst, best) points still to be scored (Tuple[int, int])
+    """
+    if rules.states[position] == GameState.GAME_END:
+        return (0, 0)
+    worst, best = None, None
+    for pins in range(rules.positions[position].standing + 1):
+        points, after = _next(rules, remaining, position, pins)
+        low, high = _extremes(*after)
+        worst = points + low if worst is None else min(worst, points + low)
+        best = points + high if best is None else max(best, points + high)
+    return (worst, best)
+
+class ScoreDistribution():
+    """
+        ScoreDistribution Class for Bowler Program. Distribution of final scores over every legal way to finish a game, each counted once.
+
+        Data Properties:
+            - games : int - number of legal game endings
+            - worst : int - lowest reachable final score
+            - best  : int - highest reachable final score
+            - mean  : float - average final score
+    """
+    def __init__(self, score : int, counts : Tuple[int, ...]):
+        self._score : int = score # points already scored
+        self._counts : Tuple[int, ...] = counts
+        self._games : int = sum(counts)
+
+    @property
+    def games(self) -> int:
+        """
+        ScoreDistribution Read-Only games Property for Bowler Program. Returns the number of legal game endings.
+
+        Data Properties:
+
+        Returns:
+            - Number of legal game endings (int)
+        """
+        return self._games
+
+    @property
+    def worst(self) -> int:
+        """
+        ScoreDistribution Read-Only worst Property for Bowler Program. Returns the lowest reachable final score.
+
+        Data Properties:
+
+        Returns:
+            - Lowest reachable final score (int)
+        """
+        return self._score + next(points for points, games in enumerate(self._counts) if games)
+
+    @property
+    def best(self) -> int:
+        """
+        ScoreDistribution Read-Only best Property for Bowler Program. Returns the highest reachable final score.
+
+        Data Properties:
+
+        Returns:
+            - Highest reachable final score (int)
+        """
+        return self._score + len(self._counts) - 1
+
+    @property
+    def mean(self) -> float:
+        """
+        ScoreDistribution Read-Only mean Property for Bowler Program. Returns the average final score over all game endings.
+
+        Data Properties:
+
+        Returns:
+            - Average final score (float)
+        """
+        return self._score + sum(points * games for points, games in enumerate(self._counts)) / self._games
+
+    def games_with(self, score : int) -> int:
+        """
+        ScoreDistribution games_with Method for Bowler Program. Returns the number of game endings with exactly a final score.
+
+        Data Properties:
+            score : int
+
+        Returns:
+            - Number of game endings with that final score (int)
+        """
+        points : int = score - self._score
+        return self._counts[points] if 0 <= points < len(self._counts) else 0
+
+    def probability(self, score : int) -> float:
+        """
+        ScoreDistribution probability Method for Bowler Program. Returns the share of game endings with exactly a final score.
+
+        Data Properties:
+            score : int
+
+        Returns:
+            - Share of game endings with that final score (float)
+        """
+        return self.games_with(score) / self._games
+
+    def probability_at_least(self, score : int) -> float:
+        """
+        ScoreDistribution probability_at_least Method for Bowler Program. Returns the share of game endings that reach a final score, e.g. 200.
+
+        Data Properties:
+            score : int
+
+        Returns:
+            - Share of game endings with a final score of at least score (float)
+        """
+        points : int = max(0, score - self._score)
+        return sum(self._counts[points:]) / self._games
+
+def distribution(scoreKeeper : Optional[ScoreKeeper] = None, rounds : int = 10, rules : Rules = TENPIN) -> ScoreDistribution:
+    """
+    Distribution distribution Function for Bowler Program. Returns the distribution of final scores from a live game, or over all games of rounds frames.
+
+    Data Properties:
+        scoreKeeper : Optional[ScoreKeeper] - live game, a new game when None
+        rounds : int - frames of a new game
+        rules : Rules - rules of a new game
+
+    Returns:
+        - Distribution of final scores (ScoreDistribution)
+    """
+    if scoreKeeper is None:
+        return ScoreDistribution(0, _counts(compile_rules(rules), rounds, 0))
+    return ScoreDistribution(scoreKeeper.score, _counts(*position(scoreKeeper)))
+
+def best_score(scoreKeeper : ScoreKeeper) -> int:
+    """
+    Distribution best_score Function for Bowler Program. Returns the highest final score a live game can still reach.
+
+    Data Properties:
+        scoreKeeper : ScoreKeeper
+
+    Returns:
+        - Highest reachable final score (int)
+    """
+    return scoreKeeper.score + _extremes(*position(scoreKeeper))[1]
+
+def worst_score(scoreKeeper : ScoreKeeper) -> int:
+    """
+    Distribution worst_score Function for Bowler Program. Returns the lowest final score a live game can still end with.
+
+    Data Properties:
+        scoreKeeper : ScoreKeeper
+
+    Returns:
+        - Lowest reachable final score (int)
+    """
+    return scoreKeeper.score + _extremes(*position(scoreKeeper))[0]
@@ -0,0 +1,4 @@
+class GameOverError(Exception):
+    """
+        GameOverError Class for Bowler Program. Raised when a roll is made after a game has ended and the ScoreKeeper's GameOverPolicy is RAISE.
+    """
@@ -0,0 +1,106 @@
+import random
+from typing import Dict, List, NamedTuple, Optional
+
+class SkillProfile(NamedTuple):
+    """
+        SkillProfile Class for Bowler Program. Roll model of a bowler used by the random game generator.
+        The first ball at a fresh rack is a strike with probability strike, otherwise it knocks 0-9 pins uniformly.
+        Any other ball is a spare with probability spare, otherwise it leaves at least one pin standing, uniformly. A second ball after a gutter ball is a spare ball at 10 pins.
+
+        Data Properties:
+            - strike : float - probability of a strike with the first ball at a fresh rack
+            - spare  : float - probability of converting a leave, all 10 pins after a gutter ball included
+    """
+    strike : float
+    spare : float
+
+PROFILES : Dict[str, SkillProfile] = {
+    "open" : SkillProfile(0.0, 0.0), # never strikes or spares
+    "beginner" : SkillProfile(0.05, 0.15),
+    "league" : SkillProfile(0.25, 0.55),
+    "pro" : SkillProfile(0.6, 0.85),
+    "perfect" : SkillProfile(1.0, 1.0),
+}
+
+def random_moves(rng : Optional[random.Random] = None, profile : SkillProfile = PROFILES["league"], rounds : int = 10) -> List[List[Optional[int]]]:
+    """
+    Generator random_moves Function for Bowler Program. Returns one random legal game in the nested format play() accepts.
+
+    Data Properties:
+        rng : Optional[random.Random] - seeded source of randomness, a new unseeded one when None
+        profile : SkillProfile
+        rounds : int
+
+    Returns:
+        - Rolls per frame, [first, second or None] and [first, second, third or None] for the last frame (List[List[Optional[int]]])
+    """
+    rng = rng or random.Random()
+
+    def ball(standing : int, fresh : bool) -> int:
+        if rng.random() < (profile.strike if fresh else profile.spare):
+            return standing
+        return rng.randrange(standing)
+
+    moves : List[List[Optional[int]]] = []
+    for _ in range(rounds - 1):
+        first : int = ball(10, True)
+        moves.append([first, None if first == 10 else ball(10 - first, False)])
+    first = ball(10, True)
+    second : int = ball(10 if first == 10 else 10 - first, first == 10)
+    third : Optional[int] = None
+    if first + second >= 10:
+        third = ball(10 if second == 10 or first + second == 10 else 20 - first - second, second == 10 or first < 10 and first + second == 10)
+    moves.append([first, second, third])
+    return moves
+
+def flatten(moves : List[List[Optional[int]]], rounds : int = 10) -> List[int]:
+    """
+    Generator flatten Function for Bowler Program. Converts a nested game to a flat padded row as used by batch.score_games.
+
+    Data Properties:
+        moves : List[List[Optional[int]]]
+        rounds : int
+
+    Returns:
+        - Rolls in order padded with -1 to 2 * rounds + 1 (List[int])
+    """
+    rolls : List[int] = [pins for frame in moves for pins in frame if pins is not None]
+    return rolls + [-1] * (2 * rounds + 1 - len(rolls))
+
+def random_games(count : int, seed : Optional[int] = None, profile : SkillProfile = PROFILES["league"], rounds : int = 10):
+    """
+    Generator random_games Function for Bowler Program. Generates many random legal games at once as a padded NumPy pin array.
+    Every frame is drawn for all games together, so no Python object is created per game. Requires numpy.
+
+    Data Properties:
+        count : int
+        seed : Optional[int]
+        profile : SkillProfile
+        rounds : int
+
+    Returns:
+        - Pin array of shape (count, 2 * rounds + 1) padded with -1, the input format of batch.score_games (np.ndarray)
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    games = np.full((count, 2 * rounds + 1), -1, dtype=np.int8)
+    rows = np.arange(count)
+    position = np.zeros(count, dtype=np.intp)
+
+    def ball(standing, fresh, where):
+        hit = rng.random(count) < np.where(fresh, profile.strike, profile.spare)
+        pins = np.where(hit, standing, (rng.random(count) * standing).astype(np.int8))
+        games[rows[where], position[where]] = pins[where]
+        position[where] += 1
+        return pins
+
+    everyone = np.ones(count, dtype=bool)
+    for _ in range(rounds - 1):
+        first = ball(np.full(count, 10, dtype=np.int8), True, everyone)
+        ball((10 - first).astype(np.int8), False, first < 10)
+    first = ball(np.full(count, 10, dtype=np.int8), True, everyone)
+    second = ball(np.where(first == 10, 10, 10 - first).astype(np.int8), first == 10, everyone)
+    cleared = (second == 10) | (first + second == 10)
+    ball(np.where(cleared, 10, 20 - first - second).astype(np.int8), (second == 10) | (first < 10) & (first + second == 10), first + second >= 10)
+    return games
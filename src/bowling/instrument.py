@@ -0,0 +1,258 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameState
+
+# upper bounds of the histogram buckets in ns, 250 ns to about 16 ms doubling, the last bucket takes everything above
+BUCKETS : Tuple[int, ...] = tuple(250 << shift for shift in range(17))
+INSTRUMENTED : Tuple[str, ...] = ("roll", "_apply", "_addend", "show_scoreboard")
+
+class Histogram():
+    """
+        Histogram Class for Bowler Program. Counts durations in fixed doubling buckets, with their sum and the number of calls that raised.
+
+        Data Properties:
+            - counts : List[int] - calls per bucket of BUCKETS, plus one for slower calls
+            - count  : int - calls observed
+            - total  : int - ns observed
+            - errors : int - calls that raised
+    """
+    __slots__ = ('counts', 'total', 'errors')
+
+    def __init__(self):
+        self.counts : List[int] = [0] * (len(BUCKETS) + 1)
+        self.total : int = 0
+        self.errors : int = 0
+
+    @property
+    def count(self) -> int:
+        """
+        Histogram Read-Only count Property for Bowler Program. Returns the number of calls observed.
+
+        Data Properties:
+
+        Returns:
+            - Calls observed (int)
+        """
+        return sum(self.counts)
+
+    def observe(self, elapsed : int) -> None:
+        """
+        Histogram observe Method for Bowler Program. Counts one call that took elapsed ns.
+
+        Data Properties:
+            elapsed : int
+
+        Returns:
+            - None
+        """
+        self.counts[bisect_left(BUCKETS, elapsed)] += 1
+        self.total += elapsed
+
+class Metrics():
+    """
+        Metrics Class for Bowler Program. Registry of the histograms of the instrumented ScoreKeeper methods, one per method and GameState at the time of the call.
+        Durations are inclusive: roll includes its _apply and show_scoreboard, _apply includes its _addend calls.
+
+        Data Properties:
+            - histograms : Dict[Tuple[str, GameState], Histogram]
+    """
+    def __init__(self):
+        self._histograms : Dict[Tuple[str, GameState], Histogram] = {(function, state) : Histogram() for function in INSTRUMENTED for state in GameState}
+
+    def histograms(self, function : str) -> Dict[GameState, Histogram]:
+        """
+        Metrics histograms Method for Bowler Program. Returns the histograms of one instrumented method by GameState.
+
+        Data Properties:
+            function : str
+
+        Returns:
+            - Histogram per GameState (Dict[GameState, Histogram])
+        """
+        return {state : self._histograms[(function, state)] for state in GameState}
+
+    def reset(self) -> None:
+        """
+        Metrics reset Method for Bowler Program. Sets every histogram back to zero.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        for histogram in self._histograms.values():
+            histogram.counts[:] = [0] * len(histogram.counts)
+            histogram.total = histogram.errors = 0
+
+    def snapshot(self) -> Dict[str, Dict[str, dict]]:
+        """
+        Metrics snapshot Method for Bowler Program. Returns a copy of every histogram that saw a call, by method and GameState name.
+
+        Data Properties:
+
+        Returns:
+            - count, total_ns, errors and per bucket counts keyed by bucket upper bound in ns, None for the overflow bucket (Dict[str, Dict[str, dict]])
+        """
+        snapshot : Dict[str, Dict[str, dict]] = {}
+        for (function, state), histogram in self._histograms.items():
+            counts : List[int] = histogram.counts[:]
+            if not any(counts) and not histogram.errors:
+                continue
+            snapshot.setdefault(function, {})[state.name] = {
+                "count" : sum(counts), "total_ns" : histogram.total, "errors" : histogram.errors,
+                "buckets" : dict(zip(BUCKETS + (None,), counts)),
+            }
+        return snapshot
+
+    def prometheus(self, prefix : str = "bowling") -> str:
+        """
+        Metrics prometheus Method for Bowler Program. Returns every histogram in the Prometheus text exposition format.
+
+        Data Properties:
+            prefix : str - prefix of the metric names
+
+        Returns:
+            - Prometheus text (str)
+        """
+        lines : List[str] = [
+            f"# HELP {prefix}_call_seconds Time spent in instrumented ScoreKeeper methods, by GameState at the time of the call.",
+            f"# TYPE {prefix}_call_seconds histogram",
+        ]
+        errors : List[str] = [
+            f"# HELP {prefix}_call_errors_total Calls of instrumented ScoreKeeper methods that raised.",
+            f"# TYPE {prefix}_call_errors_total counter",
+        ]
+        for function, states in self.snapshot().items():
+            for state, data in states.items():
+                labels : str = f'function="{function.lstrip("_")}",state="{state}"'
+                cumulative : int = 0
+                for bound, count in data["buckets"].items():
+                    cumulative += count
+                    lines.append(f'{prefix}_call_seconds_bucket{{{labels},le="{"+Inf" if bound is None else f"{bound / 1e9:g}"}"}} {cumulative}')
+                lines.append(f"{prefix}_call_seconds_sum{{{labels}}} {data['total_ns'] / 1e9:.9f}")
+                lines.append(f"{prefix}_call_seconds_count{{{labels}}} {data['count']}")
+                errors.append(f"{prefix}_call_errors_total{{{labels}}} {data['errors']}")
+        return "\n".join(lines + errors) + "\n"
+
+METRICS : Metrics = Metrics()
+_originals : Dict[str, Callable] = {} # ScoreKeeper methods replaced by install
+
+def _timed(function : str, method : Callable, metrics : Metrics) -> Callable:
+    """
+    Instrument private timed Function for Bowler Program. Wraps a ScoreKeeper method to time and count its calls by the game's GameState.
+
+    Data Properties:
+        function : str
+        method : Callable
+        metrics : Metrics
+
+    Returns:
+        - The wrapped method (Callable)
+    """
+    histograms : Dict[GameState, Histogram] = metrics.histograms(function)
+    clock : Callable[[], int] = time.perf_counter_ns
+
+    def timed(self, *args, **kwargs):
+        histogram : Histogram = histograms[self._state]
+        start : int = clock()
+        try:
+            return method(self, *args, **kwargs)
+        except BaseException:
+            histogram.errors += 1
+            raise
+        finally:
+            histogram.observe(clock() - start)
+    timed.__name__, timed.__doc__, timed.__wrapped__ = method.__name__, method.__doc__, method
+    return timed
+
+def install(metrics : Metrics = METRICS) -> Metrics:
+    """
+    Instrument install Function for Bowler Program. Replaces roll, _apply, _addend and show_scoreboard of ScoreKeeper with timed versions, for every ScoreKeeper.
+    Nothing is measured, and nothing costs anything, until install is called; uninstall puts the original methods back.
+
+    Data Properties:
+        metrics : Metrics - where the calls are counted
+
+    Returns:
+        - The metrics in use (Metrics)
+    """
+    uninstall()
+    for function in INSTRUMENTED:
+        _originals[function] = getattr(ScoreKeeper, function)
+        setattr(ScoreKeeper, function, _timed(function, _originals[function], metrics))
+    return metrics
+
+def uninstall() -> None:
+    """
+    Instrument uninstall Function for Bowler Program. Puts back the ScoreKeeper methods replaced by install.
+
+    Data Properties:
+
+    Returns:
+        - None
+    """
+    for function, method in _originals.items():
+        setattr(ScoreKeeper, function, method)
+    _originals.clear()
+
+def installed() -> bool:
+    """
+    Instrument installed Function for Bowler Program. Returns whether ScoreKeeper is instrumented.
+
+    Data Properties:
+
+    Returns:
+        - Whether install is in effect (bool)
+    """
+    return bool(_originals)
+
+def write_prometheus(path : str, metrics : Metrics = METRICS) -> None:
+    """
+    Instrument write_prometheus Function for Bowler Program. Writes the Prometheus text of metrics to a file, e.g. for the node exporter's textfile collector.
+    The file is replaced atomically, so a scrape never reads half of it.
+
+    Data Properties:
+        path : str
+        metrics : Metrics
+
+    Returns:
+        - None
+    """
+    temporary : str = f"{path}.tmp"
+    with open(temporary, "w") as file:
+        file.write(metrics.prometheus())
+    os.replace(temporary, path)
+
+def serve_metrics(host : str = "127.0.0.1", port : int = 9710, metrics : Metrics = METRICS) -> ThreadingHTTPServer:
+    """
+    Instrument serve_metrics Function for Bowler Program. Serves the Prometheus text of metrics over HTTP from a daemon thread, at any path.
+
+    Data Properties:
+        host : str
+        port : int - 0 picks a free port, see server_address of the result
+        metrics : Metrics
+
+    Returns:
+        - The running server, call shutdown() to stop it (ThreadingHTTPServer)
+    """
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body : bytes = metrics.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format : str, *args) -> None:
+            pass
+
+    server : ThreadingHTTPServer = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
@@ -0,0 +1,541 @@
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, Iterator, Optional, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameState
+
+MAGIC : bytes = b"BWLJ"
+VERSION : int = 1
+HEADER : struct.Struct = struct.Struct("<4sH2x") # magic, version
+BATCH : struct.Struct = struct.Struct("<II") # payload length, crc32 of the payload, followed by the records of one group commit
+ROLL : struct.Struct = struct.Struct("<BIHBBH") # kind, game id, frame, roll index in the frame, pins, leave
+GAME : struct.Struct = struct.Struct("<BIHI") # kind, game id, key length, snapshot length, followed by the key and the snapshot
+
+# record kinds
+GAME_RECORD : int = 0 # the game of a key as it is now, as a ScoreKeeper snapshot
+ROLL_RECORD : int = 1
+FOUL_RECORD : int = 2 # a roll reported as a foul
+CORRECT_RECORD : int = 3 # frame, roll index and pins of a correction
+UNDO_RECORD : int = 4
+NO_LEAVE : int = 0xFFFF # a roll made without its standing pins
+
+def _fsync(file) -> None:
+    """
+    Journal private fsync Function for Bowler Program. Flushes a file and forces its data to disk, without its metadata where the platform allows.
+
+    Data Properties:
+        file : BinaryIO
+
+    Returns:
+        - None
+    """
+    file.flush()
+    getattr(os, "fdatasync", os.fsync)(file.fileno())
+
+def read_batches(data : bytes) -> Iterator[Tuple[int, memoryview]]:
+    """
+    Journal read_batches Function for Bowler Program. Walks the committed batches of a journal, stopping at the first one a crash cut short or corrupted.
+    Will raise a ValueError if the data is not a roll journal.
+
+    Data Properties:
+        data : bytes - whole journal file
+
+    Returns:
+        - Iterator of (offset after the batch, records of the batch) (Iterator[Tuple[int, memoryview]])
+    """
+    if len(data) < HEADER.size or HEADER.unpack_from(data)[0] != MAGIC:
+        raise ValueError("Not a roll journal.")
+    view : memoryview = memoryview(data)
+    offset : int = HEADER.size
+    while offset + BATCH.size <= len(data):
+        length, checksum = BATCH.unpack_from(data, offset)
+        end : int = offset + BATCH.size + length
+        if end > len(data) or zlib.crc32(view[offset + BATCH.size:end]) != checksum:
+            return
+        yield end, view[offset + BATCH.size:end]
+        offset = end
+
+def replay_journal(data : bytes, **options) -> Dict[str, ScoreKeeper]:
+    """
+    Journal replay_journal Function for Bowler Program. Rebuilds every game of a journal by restoring its last snapshot and replaying the rolls after it.
+    Rolls and corrections that failed when they were made fail again and are skipped, as they left their game unchanged.
+    Will raise a ValueError if the data is not a roll journal or a roll does not fit the frame and roll it was journaled at.
+
+    Data Properties:
+        data : bytes - whole journal file
+        options - verbose, on_game_over and scoreboard for ScoreKeeper.restore
+
+    Returns:
+        - Games by key (Dict[str, ScoreKeeper])
+    """
+    games : Dict[str, ScoreKeeper] = {}
+    ids : Dict[int, ScoreKeeper] = {}
+    for _, records in read_batches(data):
+        offset : int = 0
+        while offset < len(records):
+            if records[offset] == GAME_RECORD:
+                _, game, size, length = GAME.unpack_from(records, offset)
+                offset += GAME.size
+                key : str = str(records[offset:offset + size], "utf-8")
+                ids[game] = games[key] = ScoreKeeper.restore(records[offset + size:offset + size + length], **options)
+                offset += size + length
+                continue
+            kind, game, frame, roll, pins, leave = ROLL.unpack_from(records, offset)
+            offset += ROLL.size
+            scoreKeeper : ScoreKeeper = ids[game]
+            if kind in (ROLL_RECORD, FOUL_RECORD) and (frame != scoreKeeper.frame or roll != scoreKeeper._rules.positions[scoreKeeper._position].ball):
+                raise ValueError(f"Journaled roll of frame {frame + 1}, roll {roll + 1} does not fit its game at frame {scoreKeeper.frame + 1}.")
+            try:
+                if kind == CORRECT_RECORD:
+                    scoreKeeper.correct(frame, roll, pins)
+                elif kind == UNDO_RECORD:
+                    scoreKeeper.undo()
+                else:
+                    scoreKeeper.roll(pins, None if leave == NO_LEAVE else leave, kind == FOUL_RECORD)
+            except ValueError: # it failed when it was made too
+                pass
+    return games
+
+def read_journal(path : str, **options) -> Dict[str, ScoreKeeper]:
+    """
+    Journal read_journal Function for Bowler Program. Recovers every game of a journal file after a crash.
+
+    Data Properties:
+        path : str
+        options - verbose, on_game_over and scoreboard for ScoreKeeper.restore
+
+    Returns:
+        - Games by key (Dict[str, ScoreKeeper])
+    """
+    with open(path, "rb") as file:
+        return replay_journal(file.read(), **options)
+
+class RollJournal():
+    """
+        RollJournal Class for Bowler Program. Append-only write-ahead journal of the rolls of many games, so every scored roll survives a crash.
+        Each roll is recorded as (game, frame, roll index, pins) before it is applied to its ScoreKeeper. Records of all games are gathered in memory
+        and a committer thread writes and fsyncs them as one batch every interval seconds, so concurrent games share one fsync (group commit).
+        A roll is durable once wait returns for it. The first roll of a key in a journal, or of a new ScoreKeeper for the key, records a snapshot
+        of the game first, as does a roll that starts a new game after one ends. Read the games back with read_journal.
+        If a commit fails, e.g. the disk is full, its records are kept and every roll, correct, undo, wait and close raises the error until
+        commit is called again and succeeds, so no caller takes a roll for durable when it is not.
+
+        Data Properties:
+            - path : str
+            - interval : Optional[float] - seconds records wait to be committed together, None commits only on commit and wait
+            - appended : int - records appended
+            - durable : int - records committed to disk
+            - commits : int - batches written
+    """
+    def __init__(self, path : str, interval : Optional[float] = 0.002, sync : bool = True):
+        self._path : str = path
+        self._interval : Optional[float] = interval
+        self._sync : bool = sync # fsync each batch, off only to measure the journal without the disk
+        self._lock : threading.Lock = threading.Lock()
+        self._changed : threading.Condition = threading.Condition(self._lock) # records appended or committed
+        self._writing : threading.Lock = threading.Lock() # one batch is written at a time
+        self._buffer : bytearray = bytearray()
+        self._appended : int = 0
+        self._durable : int = 0
+        self._commits : int = 0
+        self._closed : bool = False
+        self._failure : Optional[Exception] = None # error of the last commit, until one succeeds
+        self._ids : Dict[str, int] = {}
+        self._games : Dict[str, ScoreKeeper] = {}
+        self._file = self._open(path)
+        self._size : int = self._file.tell() # bytes of the committed batches
+        self._committer : Optional[threading.Thread] = None
+        self._start()
+
+    @staticmethod
+    def _open(path : str):
+        """
+        RollJournal private Open method for Bowler Program. Opens a journal for appending, cutting off a batch a crash left half written.
+        Will raise a ValueError if the file is not a roll journal.
+
+        Data Properties:
+            path : str
+
+        Returns:
+            - The journal file (BinaryIO)
+        """
+        if os.path.exists(path) and os.path.getsize(path):
+            with open(path, "r+b") as file:
+                data : bytes = file.read()
+                valid : int = HEADER.size
+                for valid, _ in read_batches(data):
+                    pass
+                if valid < len(data):
+                    file.truncate(valid)
+                    _fsync(file)
+            return open(path, "ab")
+        file = open(path, "wb")
+        file.write(HEADER.pack(MAGIC, VERSION))
+        _fsync(file)
+        return file
+
+    @property
+    def path(self) -> str:
+        """
+        RollJournal Read-Only path Property for Bowler Program. Returns the path of the journal file.
+
+        Data Properties:
+
+        Returns:
+            - Journal path (str)
+        """
+        return self._path
+
+    @property
+    def interval(self) -> Optional[float]:
+        """
+        RollJournal Read-Only interval Property for Bowler Program. Returns the group commit interval in seconds.
+
+        Data Properties:
+
+        Returns:
+            - Seconds between commits, None without a committer thread (Optional[float])
+        """
+        return self._interval
+
+    @property
+    def appended(self) -> int:
+        """
+        RollJournal Read-Only appended Property for Bowler Program. Returns the number of records appended, the sequence number of the last one.
+
+        Data Properties:
+
+        Returns:
+            - Records appended (int)
+        """
+        return self._appended
+
+    @property
+    def durable(self) -> int:
+        """
+        RollJournal Read-Only durable Property for Bowler Program. Returns the number of records committed to disk.
+
+        Data Properties:
+
+        Returns:
+            - Records committed (int)
+        """
+        return self._durable
+
+    @property
+    def commits(self) -> int:
+        """
+        RollJournal Read-Only commits Property for Bowler Program. Returns the number of batches written.
+
+        Data Properties:
+
+        Returns:
+            - Batches written (int)
+        """
+        return self._commits
+
+    def _append(self, record : bytes) -> int:
+        """
+        RollJournal private Append method for Bowler Program. Adds a record to the next batch.
+
+        Data Properties:
+            record : bytes
+
+        Returns:
+            - Sequence number of the record (int)
+        """
+        with self._lock:
+            return self._push(record)
+
+    def _push(self, record : bytes) -> int:
+        """
+        RollJournal private Push method for Bowler Program. Adds a record to the next batch, with the lock held.
+        Will raise a ValueError if the journal is closed.
+
+        Data Properties:
+            record : bytes
+
+        Returns:
+            - Sequence number of the record (int)
+        """
+        if self._closed:
+            raise ValueError("The roll journal is closed.")
+        self._buffer += record
+        self._appended += 1
+        if len(self._buffer) == len(record): # wake the committer for a new batch
+            self._changed.notify_all()
+        return self._appended
+
+    def _track(self, key : str, scoreKeeper : ScoreKeeper) -> int:
+        """
+        RollJournal private Track method for Bowler Program. Returns the game id of a key, recording a snapshot of its game when the journal does not hold it yet.
+
+        Data Properties:
+            key : str
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - Game id (int)
+        """
+        if self._games.get(key) is not scoreKeeper:
+            self._snapshot(key, scoreKeeper)
+        return self._ids[key]
+
+    def _snapshot(self, key : str, scoreKeeper : ScoreKeeper) -> None:
+        """
+        RollJournal private void Snapshot method for Bowler Program. Records the game of a key as it is now.
+
+        Data Properties:
+            key : str
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - None
+        """
+        name : bytes = key.encode()
+        snapshot : bytes = scoreKeeper.snapshot()
+        with self._lock:
+            game : int = self._ids.setdefault(key, len(self._ids))
+            self._push(GAME.pack(GAME_RECORD, game, len(name), len(snapshot)) + name + snapshot)
+            self._games[key] = scoreKeeper
+
+    def roll(self, key : str, scoreKeeper : ScoreKeeper, pins : int, leave : Optional[int] = None, foul : bool = False, wait : bool = False) -> int:
+        """
+        RollJournal roll method for Bowler Program. Journals a roll of a game, then applies it with ScoreKeeper.roll.
+        The rolls of one game must come from one thread, the games of a journal may be rolled from many.
+        Will raise a ValueError if the pins are more than are standing, or what ScoreKeeper.roll raises, a roll that fails is replayed as failing.
+        Will raise the error of a failed commit, see commit.
+
+        Data Properties:
+            key : str - game key, e.g. lane id
+            scoreKeeper : ScoreKeeper
+            pins : int
+            leave : Optional[int] - pins left standing, see ScoreKeeper.roll
+            foul : bool
+            wait : bool - return only once the roll is durable
+
+        Returns:
+            - Sequence number of the roll's record (int)
+        """
+        self._check()
+        game : int = self._track(key, scoreKeeper)
+        if scoreKeeper._state == GameState.GAME_END: # the GameOverPolicy decides, the outcome is journaled as the game it leaves
+            scoreKeeper.roll(pins, leave, foul)
+            self._snapshot(key, scoreKeeper)
+            sequence : int = self._appended
+        elif not 0 <= pins <= scoreKeeper.pins: # nothing to journal, the game is left unchanged
+            raise ValueError(f"Roll Exceeds # of Available Pins. \n Roll: {pins} , Available Pins: {scoreKeeper.pins}")
+        else:
+            sequence = self._append(ROLL.pack(FOUL_RECORD if foul else ROLL_RECORD, game, scoreKeeper.frame,
+                                              scoreKeeper._rules.positions[scoreKeeper._position].ball, pins, NO_LEAVE if leave is None else leave))
+            scoreKeeper.roll(pins, leave, foul)
+        if wait:
+            self.wait(sequence)
+        return sequence
+
+    def correct(self, key : str, scoreKeeper : ScoreKeeper, frame : int, roll : int, pins : int, wait : bool = False) -> int:
+        """
+        RollJournal correct method for Bowler Program. Journals a correction of a game, then applies it with ScoreKeeper.correct.
+        Will raise a ValueError if the correction is not legal, the game is left unchanged, or the error of a failed commit, see commit.
+
+        Data Properties:
+            key : str
+            scoreKeeper : ScoreKeeper
+            frame : int - 0-frames
+            roll : int - 0-rolls of the frame
+            pins : int
+            wait : bool - return only once the correction is durable
+
+        Returns:
+            - Sequence number of the correction's record (int)
+        """
+        self._check()
+        game : int = self._track(key, scoreKeeper)
+        sequence : int = self._append(ROLL.pack(CORRECT_RECORD, game, frame, roll, pins, NO_LEAVE))
+        scoreKeeper.correct(frame, roll, pins)
+        if wait:
+            self.wait(sequence)
+        return sequence
+
+    def undo(self, key : str, scoreKeeper : ScoreKeeper, wait : bool = False) -> int:
+        """
+        RollJournal undo method for Bowler Program. Journals taking back the last roll of a game, then applies it with ScoreKeeper.undo.
+        Will raise a ValueError if no roll has been made, or the error of a failed commit, see commit.
+
+        Data Properties:
+            key : str
+            scoreKeeper : ScoreKeeper
+            wait : bool - return only once the undo is durable
+
+        Returns:
+            - Sequence number of the undo's record (int)
+        """
+        self._check()
+        game : int = self._track(key, scoreKeeper)
+        sequence : int = self._append(ROLL.pack(UNDO_RECORD, game, 0, 0, 0, NO_LEAVE))
+        scoreKeeper.undo()
+        if wait:
+            self.wait(sequence)
+        return sequence
+
+    def commit(self) -> None:
+        """
+        RollJournal void commit method for Bowler Program. Writes the records appended so far as one batch and fsyncs it.
+        Records appended while the batch is written go to the next one. The records stay pending until the batch is on disk:
+        if writing it fails, the error is kept and raised to every caller until a commit succeeds. Calling commit again retries,
+        cutting the file back to its committed batches first and restarting the committer thread.
+        Will raise the OSError of a failed write or fsync.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        with self._writing:
+            if self._failure is not None:
+                self._recover()
+            with self._lock:
+                payload : bytes = bytes(self._buffer)
+                sequence : int = self._appended
+            if payload:
+                try:
+                    self._file.write(BATCH.pack(len(payload), zlib.crc32(payload)) + payload)
+                    if self._sync:
+                        _fsync(self._file)
+                    else:
+                        self._file.flush()
+                except Exception as error:
+                    with self._lock:
+                        self._failure = error
+                        self._changed.notify_all()
+                    raise
+                self._size += BATCH.size + len(payload)
+                self._commits += 1
+            with self._lock:
+                del self._buffer[:len(payload)]
+                self._durable = max(self._durable, sequence)
+                self._changed.notify_all()
+
+    def _recover(self) -> None:
+        """
+        RollJournal private void Recover method for Bowler Program. Gets ready to retry after a failed commit: cuts off whatever part of the batch
+        reached the file, reopens it and restarts the committer thread. Called with the writing lock held.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        try:
+            self._file.close()
+        except OSError: # the failed batch may still be buffered, it is cut off below
+            pass
+        file = open(self._path, "ab")
+        file.truncate(self._size)
+        self._file = file
+        with self._lock:
+            self._failure = None
+        if self._committer is not None and self._committer is not threading.current_thread():
+            self._committer.join() # stopped by the failure
+        self._start()
+
+    def _check(self) -> None:
+        """
+        RollJournal private void Check method for Bowler Program. Raises the error of a failed commit, until a commit succeeds.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        failure : Optional[Exception] = self._failure
+        if failure is not None:
+            raise failure
+
+    def _start(self) -> None:
+        """
+        RollJournal private void Start method for Bowler Program. Starts the committer thread, unless the journal has no interval, is closed or has one running.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        if self._interval is None or self._closed or self._committer is not None and self._committer.is_alive():
+            return
+        self._committer = threading.Thread(target=self._commit_loop, name="roll-journal", daemon=True)
+        self._committer.start()
+
+    def wait(self, sequence : Optional[int] = None) -> None:
+        """
+        RollJournal void wait method for Bowler Program. Blocks until a record is durable, committing right away without a committer thread.
+        Will raise the error of a failed commit, see commit.
+
+        Data Properties:
+            sequence : Optional[int] - sequence number of the record, every record appended so far when None
+
+        Returns:
+            - None
+        """
+        sequence = self._appended if sequence is None else sequence
+        self._check()
+        if self._committer is None or not self._committer.is_alive():
+            if self._durable < sequence:
+                self.commit()
+            return
+        with self._lock:
+            while self._durable < sequence:
+                self._check()
+                self._changed.wait()
+
+    def _commit_loop(self) -> None:
+        """
+        RollJournal private void Commit Loop method for Bowler Program. Committer thread: once a record is appended, waits interval seconds for
+        the rolls of other games to join it, then commits them together.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        while True:
+            with self._lock:
+                while not self._buffer and not self._closed:
+                    self._changed.wait()
+                if not self._buffer:
+                    return
+            if self._interval and not self._closed:
+                with self._lock:
+                    self._changed.wait_for(lambda: self._closed, self._interval)
+            try:
+                self.commit()
+            except Exception: # kept for the callers, the thread stops until a commit succeeds
+                return
+
+    def close(self) -> None:
+        """
+        RollJournal void close method for Bowler Program. Commits every record still pending, stops the committer thread and closes the file.
+        Will raise the error of a failed commit, see commit, the file is then left open and close may be called again.
+
+        Data Properties:
+
+        Returns:
+            - None
+        """
+        with self._lock:
+            if self._file.closed and self._failure is None:
+                return
+            self._closed = True
+            self._changed.notify_all()
+        if self._committer is not None:
+            self._committer.join()
+        self.commit()
+        self._file.close()
+
+    def __enter__(self) -> "RollJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,283 @@
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import RollState
+
+# a leave is one small integer per roll: the pins left standing after the ball, pin n in bit n - 1, plus flags
+PINS : int = 0x3FF # standing pin mask of a rack of up to ten pins
+KNOWN : int = 1 << 10 # the standing pins were given for the roll
+FULL : int = 1 << 11 # the ball was rolled at a full rack
+SPLIT : int = 1 << 12 # the ball left a split
+FOUL : int = 1 << 13 # the ball was a foul, scored 0 and its pins were respotted
+LEAVES : int = PINS + 1 # distinct standing pin masks
+
+# tenpin rack positions (row, column) of pins 1 to 10, the headpin in front
+RACK : Tuple[Tuple[int, int], ...] = ((0, 0), (1, -1), (1, 1), (2, -2), (2, 0), (2, 2), (3, -3), (3, -1), (3, 1), (3, 3))
+
+def leave_mask(pins : Iterable[int]) -> int:
+    """
+    Leaves leave_mask Function for Bowler Program. Returns the standing pin mask of a leave given by pin numbers, e.g. (7, 10).
+
+    Data Properties:
+        pins : Iterable[int] - pin numbers from 1 to 10
+
+    Returns:
+        - Standing pin mask (int)
+    """
+    mask : int = 0
+    for pin in pins:
+        if not 1 <= pin <= 10:
+            raise ValueError(f"Pins are numbered 1 to 10. Got: {pin}")
+        mask |= 1 << (pin - 1)
+    return mask
+
+def leave_pins(mask : int) -> Tuple[int, ...]:
+    """
+    Leaves leave_pins Function for Bowler Program. Returns the pin numbers standing in a mask or leave.
+
+    Data Properties:
+        mask : int
+
+    Returns:
+        - Standing pins in order (Tuple[int, ...])
+    """
+    return tuple(pin + 1 for pin in range(10) if mask >> pin & 1)
+
+def _split(mask : int) -> bool:
+    """
+    Leaves private split Function for Bowler Program. Works out whether a first ball leave of a tenpin rack is a split:
+    the headpin is down and the standing pins are not one group of neighbours, so a pin is down between or just ahead of two of them (7-10, 3-10, 5-6).
+
+    Data Properties:
+        mask : int
+
+    Returns:
+        - Whether the leave is a split (bool)
+    """
+    standing : List[int] = [pin for pin in range(10) if mask >> pin & 1]
+    if mask & 1 or len(standing) < 2:
+        return False
+    reached, frontier = {standing[0]}, [standing[0]]
+    while frontier:
+        row, column = RACK[frontier.pop()]
+        for pin in standing:
+            if pin not in reached and abs(RACK[pin][0] - row) == 1 and abs(RACK[pin][1] - column) == 1:
+                reached.add(pin)
+                frontier.append(pin)
+    return len(reached) < len(standing)
+
+# whether each standing pin mask of a full tenpin rack is a split, so detecting one is a lookup
+SPLITS : bytes = bytes(_split(mask) for mask in range(LEAVES))
+
+def is_split(leave : int) -> bool:
+    """
+    Leaves is_split Function for Bowler Program. Returns whether a standing pin mask, left by a ball at a full ten pin rack, is a split.
+
+    Data Properties:
+        leave : int
+
+    Returns:
+        - Whether the leave is a split (bool)
+    """
+    return bool(SPLITS[leave & PINS])
+
+def leave_mark(leave : int) -> Optional[int]:
+    """
+    Leaves leave_mark Function for Bowler Program. Returns the RollState value a leave marks its roll with, a foul over a split.
+
+    Data Properties:
+        leave : int
+
+    Returns:
+        - RollState FOUL or SPLIT value, None to keep the RollState the roll scores (Optional[int])
+    """
+    if leave & FOUL:
+        return RollState.FOUL.value
+    if leave & SPLIT:
+        return RollState.SPLIT.value
+    return None
+
+def encode_leave(pins : int, standing : Optional[int], foul : bool, before : Optional[int], remaining : int, full : bool, rack : int) -> int:
+    """
+    Leaves encode_leave Function for Bowler Program. Checks the standing pins given with a roll and packs them with the roll's flags into one leave.
+    A roll of 0 that knocked pins down is a foul. A foul's pins are respotted, so its leave is the rack it was rolled at.
+    Will raise a ValueError if the standing pins do not match the roll.
+
+    Data Properties:
+        pins : int - pins the roll scores
+        standing : Optional[int] - standing pin mask after the ball, None when only a foul is reported
+        foul : bool
+        before : Optional[int] - standing pin mask before the ball, None when not known
+        remaining : int - pins standing before the ball
+        full : bool - whether the ball is rolled at a full rack
+        rack : int - pins in a full rack
+
+    Returns:
+        - The leave of the roll (int)
+    """
+    if foul and pins:
+        raise ValueError(f"A foul scores 0 pins. Got: {pins}")
+    if standing is None:
+        return FOUL if foul else 0
+    if not 0 <= standing < 1 << rack:
+        raise ValueError(f"Standing pin mask {standing:#x} has pins outside a rack of {rack}.")
+    if before is not None and standing & ~before:
+        raise ValueError(f"Pins {leave_pins(standing & ~before)} were already down before the roll.")
+    felled : int = bin(before & ~standing).count("1") if before is not None else remaining - bin(standing).count("1")
+    if foul or (pins == 0 and felled):
+        if before is None:
+            return FOUL
+        return FOUL | KNOWN | (FULL if full else 0) | before
+    if felled != pins:
+        raise ValueError(f"Standing pins {leave_pins(standing)} do not match a roll of {pins}.")
+    leave : int = KNOWN | standing
+    if full:
+        leave |= FULL | (SPLIT if rack == 10 and SPLITS[standing] else 0)
+    return leave
+
+class LeaveIndex():
+    """
+        LeaveIndex Class for Bowler Program. How often each leave of a ball at a full rack came up and how often the next ball cleared it, over many games.
+        Both are one counter per standing pin mask, so a query like the 7-10 conversion rate is two array reads however many games were added.
+
+        Data Properties:
+            - games  : int - games added
+            - counts : array - leaves per standing pin mask
+            - cleared : array - leaves cleared by the next ball per standing pin mask
+    """
+    def __init__(self):
+        self._games : int = 0
+        self._counts : array = array('q', bytes(8 * LEAVES))
+        self._cleared : array = array('q', bytes(8 * LEAVES))
+
+    @property
+    def games(self) -> int:
+        """
+        LeaveIndex Read-Only games Property for Bowler Program. Returns the number of games added.
+
+        Data Properties:
+
+        Returns:
+            - Games added (int)
+        """
+        return self._games
+
+    @property
+    def counts(self) -> array:
+        """
+        LeaveIndex Read-Only counts Property for Bowler Program. Returns how often each leave came up, indexed by standing pin mask. A strike is mask 0.
+
+        Data Properties:
+
+        Returns:
+            - Leaves per mask (array)
+        """
+        return self._counts
+
+    @property
+    def cleared(self) -> array:
+        """
+        LeaveIndex Read-Only cleared Property for Bowler Program. Returns how often each leave was cleared by the next ball, indexed by standing pin mask.
+
+        Data Properties:
+
+        Returns:
+            - Cleared leaves per mask (array)
+        """
+        return self._cleared
+
+    def add(self, scoreKeeper : ScoreKeeper) -> None:
+        """
+        LeaveIndex add method for Bowler Program. Counts the leaves recorded with the rolls of a game.
+
+        Data Properties:
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - None
+        """
+        self._games += 1
+        leaves : Optional[array] = scoreKeeper.leaves
+        if leaves is None:
+            return
+        for slot, leave in enumerate(leaves):
+            if leave & (FULL | KNOWN) == FULL | KNOWN and not leave & FOUL:
+                self._counts[leave & PINS] += 1
+                after : int = leaves[slot + 1] if slot + 1 < len(leaves) and leave & PINS else 0
+                if after & (KNOWN | FULL | FOUL | PINS) == KNOWN:
+                    self._cleared[leave & PINS] += 1
+
+    def add_leaves(self, leaves) -> None:
+        """
+        LeaveIndex add_leaves Method for Bowler Program. Counts the leaves of many games at once from a packed array, with vectorized passes. Requires numpy.
+        Each row is the leave buffer of one game (ScoreKeeper.leaves, all with the same rules and rounds), e.g. stacked with np.frombuffer.
+
+        Data Properties:
+            leaves : array-like of shape (games, roll slots) of uint16
+
+        Returns:
+            - None
+        """
+        import numpy as np
+        rows : np.ndarray = np.asarray(leaves, dtype=np.uint16)
+        if rows.ndim != 2:
+            raise ValueError(f"Leaves must have shape (games, roll slots). Got: {rows.shape}")
+        self._games += rows.shape[0]
+        known : np.ndarray = (rows & (FULL | KNOWN | FOUL)) == FULL | KNOWN
+        masks : np.ndarray = rows & PINS
+        np.frombuffer(self._counts, dtype=np.int64)[:] += np.bincount(masks[known], minlength=LEAVES)
+        # a leave is cleared when the ball after it, in the next slot of the same rack, knocked every pin left down
+        after : np.ndarray = rows[:, 1:]
+        cleared : np.ndarray = known[:, :-1] & (masks[:, :-1] != 0) & ((after & (KNOWN | FULL | FOUL | PINS)) == KNOWN)
+        np.frombuffer(self._cleared, dtype=np.int64)[:] += np.bincount(masks[:, :-1][cleared], minlength=LEAVES)
+
+    def count(self, pins : Sequence[int]) -> int:
+        """
+        LeaveIndex count Method for Bowler Program. Returns how often a leave came up.
+
+        Data Properties:
+            pins : Sequence[int] - standing pin numbers, e.g. (7, 10)
+
+        Returns:
+            - Times the leave came up (int)
+        """
+        return self._counts[leave_mask(pins)]
+
+    def rate(self, pins : Sequence[int]) -> Optional[float]:
+        """
+        LeaveIndex rate Method for Bowler Program. Returns the share of a leave that was cleared by the next ball, e.g. the 7-10 split conversion rate.
+
+        Data Properties:
+            pins : Sequence[int] - standing pin numbers, e.g. (7, 10)
+
+        Returns:
+            - Cleared share from 0 to 1, None if the leave never came up (Optional[float])
+        """
+        mask : int = leave_mask(pins)
+        return self._cleared[mask] / self._counts[mask] if self._counts[mask] else None
+
+    def split_rate(self) -> Optional[float]:
+        """
+        LeaveIndex split_rate Method for Bowler Program. Returns the share of all splits that was cleared by the next ball.
+
+        Data Properties:
+
+        Returns:
+            - Cleared share from 0 to 1, None if no split came up (Optional[float])
+        """
+        splits : int = sum(count for mask, count in enumerate(self._counts) if SPLITS[mask])
+        return sum(cleared for mask, cleared in enumerate(self._cleared) if SPLITS[mask]) / splits if splits else None
+
+    def most_common(self, count : int, splits : bool = False) -> List[Tuple[Tuple[int, ...], int, float]]:
+        """
+        LeaveIndex most_common Method for Bowler Program. Returns the leaves that came up most, strikes left out.
+
+        Data Properties:
+            count : int
+            splits : bool - only splits
+
+        Returns:
+            - Up to count (standing pins, times, cleared share) (List[Tuple[Tuple[int, ...], int, float]])
+        """
+        masks : List[int] = sorted((mask for mask in range(1, LEAVES) if self._counts[mask] and (SPLITS[mask] or not splits)), key=lambda mask: -self._counts[mask])
+        return [(leave_pins(mask), self._counts[mask], self._cleared[mask] / self._counts[mask]) for mask in masks[:count]]
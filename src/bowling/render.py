@@ -0,0 +1,114 @@
+import sys
+from typing import List, Optional, TextIO
+from .Roll import SLOT_SYMBOLS
+from .constants import GameState, RollStage, RollState
+
+ROW : str = "{:<8} {:<8} {:<8} {:<8} {:<8}\n"
+SEPARATOR : str = "-------------------------------------------\n"
+HEADER : str = SEPARATOR + ROW.format('FR', 'R1', 'R2', 'R3', 'Score') + SEPARATOR
+TITLE : str = "\n{start}Bowling Game{end}\n" + SEPARATOR
+ANSI_TITLE : str = TITLE.format(start="\033[1m", end="\033[0;0m")
+PLAIN_TITLE : str = TITLE.format(start="", end="")
+
+class Scoreboard():
+    """
+        Scoreboard Class for Bowler Program. Renders a ScoreKeeper's scoreboard into one buffer and writes it with a single call.
+
+        In delta mode a Scoreboard remembers the frame rows it last wrote and, after the first full board, only writes the status lines and the rows that changed since.
+        Plain mode leaves out the ANSI bold codes of the title, for log files. Use one delta Scoreboard per game.
+
+        Data Properties:
+            - stream : TextIO - where boards are written, sys.stdout when None
+            - ansi : bool - bold title with ANSI codes
+            - delta : bool - write only what changed since the last board
+    """
+    def __init__(self, stream : Optional[TextIO] = None, ansi : bool = True, delta : bool = False):
+        self._stream : Optional[TextIO] = stream
+        self._title : str = ANSI_TITLE if ansi else PLAIN_TITLE
+        self._delta : bool = delta
+        self._rows : Optional[List[str]] = None # rows of the last board written in delta mode
+
+    def status(self, scoreKeeper) -> str:
+        """
+        Scoreboard status Method for Bowler Program. Returns the current frame, pins, score, roll and moves remaining lines of a game.
+
+        Data Properties:
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - Status lines (str)
+        """
+        return (f"Current Frame : {scoreKeeper.frame + 1:<4} Current Pins : {scoreKeeper.pins:<4}\n"
+                f"Current Score : {scoreKeeper.score:<4} Current Roll : {RollStage[scoreKeeper._state]:<4}\n"
+                f"Moves Remaining : {scoreKeeper.movesRemaining():<4} \n")
+
+    def rows(self, scoreKeeper) -> List[str]:
+        """
+        Scoreboard rows Method for Bowler Program. Returns the row of every frame of a game, read straight from its roll buffers.
+
+        Data Properties:
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - One row per frame (List[str])
+        """
+        pinfall, marks, totals = scoreKeeper._pinfall, scoreKeeper._marks, scoreKeeper._totals
+        empty : int = RollState.EMPTY.value
+        balls, last_slots = scoreKeeper._rules.balls, scoreKeeper._rules.last_slots
+        last : int = scoreKeeper.rounds - 1
+        rows : List[str] = []
+        for index in range(last + 1):
+            slot : int = balls * index
+            size : int = last_slots if index == last else balls # roll slots of the frame, at most three
+            second : str = SLOT_SYMBOLS[marks[slot + 1] * 11 + pinfall[slot + 1]] if size > 1 else ""
+            third : str = SLOT_SYMBOLS[marks[slot + 2] * 11 + pinfall[slot + 2]] if size > 2 else ""
+            rows.append(ROW.format(index + 1, SLOT_SYMBOLS[marks[slot] * 11 + pinfall[slot]], second,
+                                   third, "" if marks[slot] == empty else totals[index])) # same as ScoreKeeper.cumulative_score
+        return rows
+
+    def total(self, scoreKeeper) -> str:
+        """
+        Scoreboard total Method for Bowler Program. Returns the total row of a finished game, or an empty string while it is still going.
+
+        Data Properties:
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - Total row (str)
+        """
+        if scoreKeeper._state != GameState.GAME_END:
+            return ""
+        return ROW.format('Total', '', '', '', scoreKeeper.score) + SEPARATOR
+
+    def render(self, scoreKeeper) -> str:
+        """
+        Scoreboard render Method for Bowler Program. Returns the full board of a game.
+
+        Data Properties:
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - Full board (str)
+        """
+        return self._title + self.status(scoreKeeper) + HEADER + SEPARATOR.join(self.rows(scoreKeeper)) + SEPARATOR + self.total(scoreKeeper)
+
+    def show(self, scoreKeeper) -> None:
+        """
+        Scoreboard show Method for Bowler Program. Writes the board of a game, or in delta mode only the status and the frame rows that changed since the last call.
+
+        Data Properties:
+            scoreKeeper : ScoreKeeper
+
+        Returns:
+            - None
+        """
+        stream : TextIO = self._stream or sys.stdout
+        if not self._delta:
+            stream.write(self.render(scoreKeeper))
+            return
+        rows : List[str] = self.rows(scoreKeeper)
+        if self._rows is None or len(self._rows) != len(rows):
+            stream.write(self._title + self.status(scoreKeeper) + HEADER + SEPARATOR.join(rows) + SEPARATOR + self.total(scoreKeeper))
+        else:
+            stream.write(self.status(scoreKeeper) + "".join(row for row, old in zip(rows, self._rows) if row != old) + self.total(scoreKeeper))
+        self._rows = rows
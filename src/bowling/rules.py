@@ -0,0 +1,60 @@
+from __future__ import annotations
+import struct
+from collections import namedtuple
+
+TYPE_CHECKING = False # typing is only imported by type checkers, it would double the import time of the scorer
+if TYPE_CHECKING:
+    from typing import Dict, Tuple
+
+class Rules(namedtuple("Rules", ("pins", "balls", "bonus", "fill", "no_tap"), defaults=(10, 2, (2, 1), (2, 1), 10))):
+    """
+        Rules Class for Bowler Program. Scoring rules of a bowling variant. Compiled once per variant into the transition table every game with those rules shares, see transitions.compile_rules.
+
+        Data Properties:
+            - pins   : int - pins in a full rack, at most 10
+            - balls  : int - balls per frame
+            - bonus  : Tuple[int, ...] - bonus balls a frame earns for clearing the rack with each of its balls, e.g. (2, 1) for a strike and a spare
+            - fill   : Tuple[int, ...] - fill balls the last frame gets for clearing the rack with each of its balls
+            - no_tap : int - pins knocked by the first ball of a rack that count as a strike, a full rack always does
+    """
+    __slots__ = ()
+
+TENPIN : Rules = Rules()
+CANDLEPIN : Rules = Rules(balls=3, bonus=(2, 1, 0), fill=(2, 1, 0)) # a rack cleared with the third ball (ten-box) earns nothing
+NINE_PIN_NO_TAP : Rules = Rules(no_tap=9)
+
+RULES : Dict[str, Rules] = {
+    "tenpin" : TENPIN,
+    "candlepin" : CANDLEPIN,
+    "duckpin" : CANDLEPIN, # scored like candlepin, only the pins differ
+    "9-pin-no-tap" : NINE_PIN_NO_TAP,
+}
+
+PACKED : struct.Struct = struct.Struct("<9B") # pins, balls, bonus and fill padded to three balls, no_tap
+
+def pack_rules(rules : Rules) -> bytes:
+    """
+    Rules pack_rules Function for Bowler Program. Packs Rules into PACKED.size bytes, e.g. for a ScoreKeeper snapshot.
+
+    Data Properties:
+        rules : Rules
+
+    Returns:
+        - Packed rules (bytes)
+    """
+    padding : Tuple[int, ...] = (0,) * (3 - rules.balls)
+    return PACKED.pack(rules.pins, rules.balls, *rules.bonus, *padding, *rules.fill, *padding, rules.no_tap)
+
+def unpack_rules(data : bytes, offset : int = 0) -> Rules:
+    """
+    Rules unpack_rules Function for Bowler Program. Reads Rules packed by pack_rules.
+
+    Data Properties:
+        data : bytes
+        offset : int
+
+    Returns:
+        - The rules (Rules)
+    """
+    pins, balls, *fields, no_tap = PACKED.unpack_from(data, offset)
+    return Rules(pins, balls, tuple(fields[:balls]), tuple(fields[3:3 + balls]), no_tap)
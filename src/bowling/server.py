@@ -0,0 +1,187 @@
+import asyncio
+import json
+from typing import Dict, List, Optional, Set
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameOverPolicy, GameState
+from .rules import TENPIN, Rules
+
+MAX_SUBSCRIBER_BUFFER : int = 1 << 20 # subscribers that fall this far behind are dropped
+
+class LaneServer():
+    """
+        LaneServer Class for Bowler Program. asyncio server that scores roll events from many lane clients, one ScoreKeeper per lane.
+
+        Clients send newline-delimited commands:
+            - ROLL <lane> <pins> : score a roll, answered with OK <score> or ERR <message>
+            - SUB [<lane> ...]   : subscribe to scoreboard deltas of the lanes (all lanes if none are given), answered with OK
+
+        Subscribers receive one JSON line per roll with the lane, game, frame, pins, score, state and the cumulative scores of the frames the roll changed.
+        Rolls after a game ends start the lane's next game (GameOverPolicy.RESTART), so roll never waits on input and never blocks the event loop.
+
+        Data Properties:
+            - lanes : Dict[str, ScoreKeeper]
+            - rounds : int
+            - rules : Rules
+    """
+    def __init__(self, rounds : int = 10, rules : Rules = TENPIN):
+        self._rounds : int = rounds
+        self._rules : Rules = rules
+        self._lanes : Dict[str, ScoreKeeper] = {}
+        self._games : Dict[str, int] = {}
+        self._subscribers : Dict[Optional[str], Set[asyncio.StreamWriter]] = {}
+
+    @property
+    def lanes(self) -> Dict[str, ScoreKeeper]:
+        """
+        LaneServer Read-Only lanes Property for Bowler Program. Returns the ScoreKeeper of every lane seen so far.
+
+        Data Properties:
+
+        Returns:
+            - ScoreKeeper per lane id (Dict[str, ScoreKeeper])
+        """
+        return self._lanes
+
+    def roll(self, lane : str, pins : int) -> dict:
+        """
+        LaneServer roll method for Bowler Program. Scores a roll on a lane and publishes the scoreboard delta to the lane's subscribers.
+
+        Data Properties:
+            lane : str
+            pins : int
+
+        Returns:
+            - The scoreboard delta of the roll (dict)
+        """
+        scoreKeeper : Optional[ScoreKeeper] = self._lanes.get(lane)
+        if scoreKeeper is None:
+            scoreKeeper = self._lanes[lane] = ScoreKeeper(rounds=self._rounds, on_game_over=GameOverPolicy.RESTART, rules=self._rules)
+            self._games[lane] = 1
+        restart : bool = scoreKeeper._state == GameState.GAME_END
+        frame : int = 0 if restart else scoreKeeper.frame
+        scoreKeeper.roll(pins)
+        if restart:
+            self._games[lane] += 1
+
+        # a roll changes its own frame and, through bonuses, at most the frames a bonus reaches back to (two in tenpin)
+        frames : List[List[int]] = []
+        for index in range(max(0, frame - scoreKeeper._rules.reach), scoreKeeper.frame + 1):
+            cumulative : Optional[int] = scoreKeeper.cumulative_score(index)
+            if cumulative is not None:
+                frames.append([index + 1, cumulative])
+        delta : dict = {
+            "lane": lane,
+            "game": self._games[lane],
+            "frame": scoreKeeper.frame + 1,
+            "pins": pins,
+            "score": scoreKeeper.score,
+            "state": str(scoreKeeper._state),
+            "frames": frames,
+        }
+        self._publish(lane, delta)
+        return delta
+
+    def _publish(self, lane : str, delta : dict) -> None:
+        """
+        LaneServer private void Publish method for Bowler Program. Writes a delta to the subscribers of a lane and of all lanes.
+        Writes are buffered by the transports, subscribers whose buffer grows past MAX_SUBSCRIBER_BUFFER are dropped.
+
+        Data Properties:
+            lane : str
+            delta : dict
+
+        Returns:
+            - None
+        """
+        subscribers : List[asyncio.StreamWriter] = [*self._subscribers.get(lane, ()), *self._subscribers.get(None, ())]
+        if not subscribers:
+            return
+        line : bytes = json.dumps(delta).encode() + b"\n"
+        for writer in subscribers:
+            if writer.is_closing() or writer.transport.get_write_buffer_size() > MAX_SUBSCRIBER_BUFFER:
+                self._unsubscribe(writer)
+                writer.close()
+            else:
+                writer.write(line)
+
+    def _unsubscribe(self, writer : asyncio.StreamWriter) -> None:
+        """
+        LaneServer private void Unsubscribe method for Bowler Program. Removes a writer from every subscription.
+
+        Data Properties:
+            writer : asyncio.StreamWriter
+
+        Returns:
+            - None
+        """
+        for subscribers in self._subscribers.values():
+            subscribers.discard(writer)
+
+    async def handle(self, reader : asyncio.StreamReader, writer : asyncio.StreamWriter) -> None:
+        """
+        LaneServer handle coroutine for Bowler Program. Serves the commands of one client connection until it disconnects.
+
+        Data Properties:
+            reader : asyncio.StreamReader
+            writer : asyncio.StreamWriter
+
+        Returns:
+            - None
+        """
+        try:
+            while True:
+                line : bytes = await reader.readline()
+                if not line:
+                    break
+                command, *fields = line.decode().split() or [""]
+                try:
+                    if command == "ROLL" and len(fields) == 2:
+                        writer.write(f"OK {self.roll(fields[0], int(fields[1]))['score']}\n".encode())
+                    elif command == "SUB":
+                        for lane in fields or [None]:
+                            self._subscribers.setdefault(lane, set()).add(writer)
+                        writer.write(b"OK\n")
+                    else:
+                        writer.write(f"ERR unknown command {line.decode().strip()!r}\n".encode())
+                except Exception as error:
+                    writer.write(f"ERR {str(error).splitlines()[0]}\n".encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._unsubscribe(writer)
+            writer.close()
+
+    async def start(self, host : str = "127.0.0.1", port : int = 7010, path : Optional[str] = None) -> asyncio.AbstractServer:
+        """
+        LaneServer start coroutine for Bowler Program. Starts listening on a TCP address, or on a Unix socket when path is given.
+
+        Data Properties:
+            host : str
+            port : int
+            path : Optional[str] - Unix socket path
+
+        Returns:
+            - The listening server (asyncio.AbstractServer)
+        """
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path)
+        return await asyncio.start_server(self.handle, host=host, port=port)
+
+async def serve(host : str = "127.0.0.1", port : int = 7010, path : Optional[str] = None, rounds : int = 10, rules : Rules = TENPIN) -> None:
+    """
+    Server serve coroutine for Bowler Program. Runs a LaneServer until cancelled.
+
+    Data Properties:
+        host : str
+        port : int
+        path : Optional[str] - Unix socket path
+        rounds : int
+        rules : Rules
+
+    Returns:
+        - None
+    """
+    server : asyncio.AbstractServer = await LaneServer(rounds=rounds, rules=rules).start(host=host, port=port, path=path)
+    async with server:
+        await server.serve_forever()
@@ -0,0 +1,117 @@
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import BinaryIO, Callable, Deque, Iterator, List, Optional, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameOverPolicy
+from .rules import TENPIN, Rules
+from .stream import report_error
+
+CHUNK_BYTES : int = 1 << 20 # about 20k games per chunk
+
+def read_chunks(source : BinaryIO, chunk_bytes : int = CHUNK_BYTES) -> Iterator[bytes]:
+    """
+    Shard read_chunks Function for Bowler Program. Splits a game file into raw byte chunks that end on a line boundary.
+
+    Data Properties:
+        source : BinaryIO - file of one game per line, rolls separated by whitespace
+        chunk_bytes : int - approximate size of a chunk
+
+    Returns:
+        - Iterator of chunks holding whole games (Iterator[bytes])
+    """
+    rest : bytes = b""
+    while True:
+        block : bytes = source.read(chunk_bytes)
+        if not block:
+            break
+        block = rest + block
+        cut : int = block.rfind(b"\n") + 1
+        if cut == 0: # a single line longer than a chunk
+            rest = block
+            continue
+        rest = block[cut:]
+        yield block[:cut]
+    if rest.strip():
+        yield rest
+
+def score_chunk(chunk : bytes, rounds : int = 10, rules : Rules = TENPIN) -> Tuple[bytes, List[Tuple[int, str]]]:
+    """
+    Shard score_chunk Function for Bowler Program. Worker that scores every game of a raw byte chunk.
+    A game with a roll that does not parse or that the ScoreKeeper rejects is skipped, the other games of the chunk carry on.
+
+    Data Properties:
+        chunk : bytes - one game per line, rolls separated by whitespace
+        rounds : int
+        rules : Rules
+
+    Returns:
+        - Final scores in game order packed as unsigned shorts (bytes)
+        - Line within the chunk, counted from 1, and error of each skipped game (List[Tuple[int, str]])
+    """
+    scores : array = array('H')
+    skipped : List[Tuple[int, str]] = []
+    scoreKeeper : ScoreKeeper = ScoreKeeper(rounds=rounds, on_game_over=GameOverPolicy.RAISE, rules=rules)
+    for number, line in enumerate(chunk.split(b"\n"), 1): # split on the line ends read_chunks cuts at, so line numbers add up across chunks
+        rolls = line.split()
+        if not rolls:
+            continue
+        scoreKeeper.reset()
+        try:
+            for pins in rolls:
+                scoreKeeper.roll(int(pins))
+        except Exception as error: # errors cross the process boundary as text
+            skipped.append((number, str(error)))
+            continue
+        scores.append(scoreKeeper.score)
+    return scores.tobytes(), skipped
+
+def score_file(source : BinaryIO, workers : Optional[int] = None, rounds : int = 10, chunk_bytes : int = CHUNK_BYTES, rules : Rules = TENPIN,
+               on_error : Optional[Callable[[Exception], None]] = None) -> Iterator[int]:
+    """
+    Shard score_file Function for Bowler Program. Scores a game file across a process pool.
+    Chunks are submitted in file order and at most two per worker are in flight, so scores come back in input order with bounded memory.
+    A game that does not parse or has an illegal roll is skipped and passed to on_error as a ValueError naming its line, so one bad game does not abort the archive.
+
+    Data Properties:
+        source : BinaryIO - file of one game per line, rolls separated by whitespace
+        workers : int - number of processes, defaults to the number of CPUs
+        rounds : int
+        chunk_bytes : int - approximate size of a chunk
+        rules : Rules
+        on_error : Optional[Callable[[Exception], None]] - called with the error of each skipped game, stream.report_error when None
+
+    Returns:
+        - Iterator of final scores in input order, skipped games left out (Iterator[int])
+    """
+    workers = workers or os.cpu_count() or 1
+    on_error = on_error or report_error
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending : Deque[Tuple[int, Future]] = deque()
+        limit : int = 2 * workers
+        line : int = 0 # lines before the chunk
+        for chunk in read_chunks(source, chunk_bytes):
+            pending.append((line, executor.submit(score_chunk, chunk, rounds, rules)))
+            line += chunk.count(b"\n")
+            if len(pending) >= limit:
+                yield from _scores(*pending.popleft(), on_error)
+        while pending:
+            yield from _scores(*pending.popleft(), on_error)
+
+def _scores(line : int, future : Future, on_error : Callable[[Exception], None]) -> array:
+    """
+    Shard private Scores Function for Bowler Program. Waits for a scored chunk and reports its skipped games.
+
+    Data Properties:
+        line : int - lines of the file before the chunk
+        future : Future - result of score_chunk
+        on_error : Callable[[Exception], None]
+
+    Returns:
+        - Final scores of the chunk (array)
+    """
+    scores, skipped = future.result()
+    for number, error in skipped:
+        on_error(ValueError(f"Dropped game on line {line + number}: {error}"))
+    return array('H', scores)
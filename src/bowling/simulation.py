@@ -0,0 +1,221 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+import numpy as np
+from .Match import Match
+from .ScoreKeeper import ScoreKeeper
+from .generator import PROFILES, SkillProfile
+from .rules import Rules
+from .transitions import CompiledRules, compile_rules
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .stats import BowlerStats
+
+CHUNK_GAMES : int = 1 << 12 # simulations per worker task, the seed of each chunk is fixed so results do not depend on the number of workers
+
+Live = Tuple[int, int, int, int] # (score, frames left including the current one, Position id, most rolls left) of a game in progress
+
+class Outcome(NamedTuple):
+    """
+        Outcome Class for Bowler Program. How a bowler's game ends over every simulated finish.
+
+        Data Properties:
+            - bowler  : str
+            - win     : float - probability of the best final score, ties decided by an even draw
+            - places  : Tuple[float, ...] - probability of each finishing place, first place first
+            - mean    : float - average final score
+            - bracket : Optional[float] - probability of winning the bracket, None without one
+    """
+    bowler : str
+    win : float
+    places : Tuple[float, ...]
+    mean : float
+    bracket : Optional[float]
+
+def skill_profile(stats : "BowlerStats") -> SkillProfile:
+    """
+    Simulation skill_profile Function for Bowler Program. Returns the roll model of a bowler from their season stats, see stats.Ledger.
+
+    Data Properties:
+        stats : BowlerStats
+
+    Returns:
+        - Strike and spare probabilities of the bowler (SkillProfile)
+    """
+    return SkillProfile(stats.strike_pct / 100, stats.spare_pct / 100)
+
+@lru_cache(maxsize=None)
+def _tables(rules : CompiledRules) -> Tuple[np.ndarray, ...]:
+    """
+    Simulation private tables Function for Bowler Program. Unpacks the transition table of a variant into flat arrays a roll of every simulation can index at once.
+    Rolls the table does not allow, e.g. after the game has ended, leave the game where it is.
+
+    Data Properties:
+        rules : CompiledRules
+
+    Returns:
+        - Position after, points and frame advance per table index, and pins standing and whether the rack is full per Position id (Tuple[np.ndarray, ...])
+    """
+    size : int = len(rules.transitions)
+    after : np.ndarray = np.arange(size, dtype=np.int32) // (2 * rules.width) # an impossible roll stays in its Position
+    points : np.ndarray = np.zeros(size, dtype=np.int32)
+    advance : np.ndarray = np.zeros(size, dtype=np.int32)
+    for index, transition in enumerate(rules.transitions):
+        if transition is not None:
+            after[index] = transition.position
+            points[index] = transition.score * (1 + len(transition.bonus)) # the roll's pins and the addends it pays
+            advance[index] = transition.advance
+    standing : np.ndarray = np.array([0 if position.ended else position.standing for position in rules.positions], dtype=np.int32)
+    fresh : np.ndarray = np.array([position.fresh for position in rules.positions], dtype=bool)
+    return after, points, advance, standing, fresh
+
+def live(scoreKeeper : ScoreKeeper) -> Live:
+    """
+    Simulation live Function for Bowler Program. Returns the part of a game in progress the simulator rolls forward, small enough to send to a worker.
+
+    Data Properties:
+        scoreKeeper : ScoreKeeper
+
+    Returns:
+        - (score, frames left including the current one, Position id, most rolls left) (Live)
+    """
+    return (scoreKeeper.score, scoreKeeper.rounds - scoreKeeper.frame, scoreKeeper._position, scoreKeeper.movesRemaining())
+
+def finish_games(games : Sequence[Live], profiles : Sequence[SkillProfile], count : int, rng : np.random.Generator, rules : Rules) -> np.ndarray:
+    """
+    Simulation finish_games Function for Bowler Program. Rolls live games forward to their end count times each.
+    Every roll of every simulation is drawn at once and scored through the transition table, so no ScoreKeeper is created per finish.
+    A ball at a full rack is a strike with the bowler's strike probability and a ball at a leave a spare with their spare probability,
+    otherwise the ball leaves at least one pin standing, uniformly, as generator.random_moves does.
+
+    Data Properties:
+        games : Sequence[Live] - live games, see live()
+        profiles : Sequence[SkillProfile] - roll model per game
+        count : int - finishes per game
+        rng : np.random.Generator
+        rules : Rules
+
+    Returns:
+        - Final scores of shape (count, games) (np.ndarray)
+    """
+    compiled : CompiledRules = compile_rules(rules)
+    after, points, advance, standing, fresh = _tables(compiled)
+    shape : Tuple[int, int] = (count, len(games))
+    score : np.ndarray = np.tile(np.array([game[0] for game in games], dtype=np.int32), (count, 1))
+    remaining : np.ndarray = np.tile(np.array([game[1] for game in games], dtype=np.int32), (count, 1))
+    position : np.ndarray = np.tile(np.array([game[2] for game in games], dtype=np.int32), (count, 1))
+    # one uniform draw per ball: below p it clears the pins, above it is spread over the misses
+    strike : np.ndarray = np.array([profile.strike for profile in profiles])
+    spare : np.ndarray = np.array([profile.spare for profile in profiles])
+    strike_miss : np.ndarray = np.where(strike < 1, 1 / np.maximum(1 - strike, 1e-12), 0)
+    spare_miss : np.ndarray = np.where(spare < 1, 1 / np.maximum(1 - spare, 1e-12), 0)
+    width : int = compiled.width
+    for _ in range(max((game[3] for game in games), default=0)):
+        pins : np.ndarray = standing[position]
+        full : np.ndarray = fresh[position]
+        draw : np.ndarray = rng.random(shape)
+        chance : np.ndarray = np.where(full, strike, spare)
+        missed : np.ndarray = np.minimum(((draw - chance) * np.where(full, strike_miss, spare_miss) * pins).astype(np.int32), pins)
+        knocked : np.ndarray = np.where(draw < chance, pins, missed)
+        index : np.ndarray = (position * 2 + (remaining == 1)) * width + knocked
+        score += points[index]
+        remaining -= advance[index]
+        position = after[index]
+    return score
+
+def simulate_chunk(games : Sequence[Live], profiles : Sequence[SkillProfile], count : int, seed : np.random.SeedSequence, rules : Rules,
+                   bracket : Sequence[int] = (), fresh : Sequence[Live] = ()) -> bytes:
+    """
+    Simulation simulate_chunk Function for Bowler Program. Worker that simulates count finishes of every game and tallies them, so only the tallies travel back.
+
+    Data Properties:
+        games : Sequence[Live]
+        profiles : Sequence[SkillProfile]
+        count : int
+        seed : np.random.SeedSequence
+        rules : Rules
+        bracket : Sequence[int] - games in bracket order, adjacent games meet in the first round, empty for no bracket
+        fresh : Sequence[Live] - a new game per bowler, rolled for the bracket rounds after the first
+
+    Returns:
+        - Finishes per game and place, total final score per game and bracket wins per game, packed as int64 (bytes)
+    """
+    rng : np.random.Generator = np.random.default_rng(seed)
+    bowlers : int = len(games)
+    finals : np.ndarray = finish_games(games, profiles, count, rng, rules)
+    keys : np.ndarray = finals + rng.random(finals.shape) # ties are decided by an even draw
+    order : np.ndarray = np.argsort(-keys, axis=1, kind="stable") # game in each place
+    places : np.ndarray = np.bincount((order * bowlers + np.arange(bowlers)).ravel(), minlength=bowlers * bowlers)
+    wins : np.ndarray = np.zeros(bowlers, dtype=np.int64)
+    if len(bracket):
+        draw : np.ndarray = np.asarray(bracket, dtype=np.intp)
+        alive : np.ndarray = np.tile(np.arange(len(draw)), (count, 1)) # bracket places still in
+        round_keys : np.ndarray = keys[:, draw]
+        while alive.shape[1] > 1:
+            best : np.ndarray = np.take_along_axis(round_keys, alive, axis=1)
+            alive = np.where(best[:, 0::2] > best[:, 1::2], alive[:, 0::2], alive[:, 1::2])
+            if alive.shape[1] > 1: # the next round is the next game
+                round_keys = finish_games([fresh[game] for game in draw], [profiles[game] for game in draw], count, rng, rules)
+                round_keys = round_keys + rng.random(round_keys.shape)
+        wins = np.bincount(draw[alive[:, 0]], minlength=bowlers)
+    return np.concatenate((places, finals.sum(axis=0, dtype=np.int64), wins)).astype(np.int64).tobytes()
+
+def simulate(games : Union[Match, Mapping[str, ScoreKeeper]], profiles : Optional[Mapping[str, SkillProfile]] = None, simulations : int = 100_000,
+             seed : Optional[int] = None, workers : Optional[int] = None, bracket : Sequence[str] = (), profile : SkillProfile = PROFILES["league"],
+             chunk : int = CHUNK_GAMES) -> List[Outcome]:
+    """
+    Simulation simulate Function for Bowler Program. Prices pot games and brackets by rolling every live game forward many times under each bowler's skill model.
+    Simulations run in fixed chunks across a process pool, each chunk seeded from seed, so a seed gives the same outcome on any number of workers.
+    A bracket is a single elimination of the bowlers in draw order, adjacent bowlers meet first and the higher score goes through.
+    The live game decides the first round and each later round is decided by a new game, as a bracket over a series is.
+    Will raise a ValueError if there are no games, the games do not share their rules or the bracket is not a draw of 2, 4, 8, ... distinct bowlers.
+
+    Data Properties:
+        games : Union[Match, Mapping[str, ScoreKeeper]] - live game per bowler, e.g. a Match
+        profiles : Optional[Mapping[str, SkillProfile]] - roll model per bowler, e.g. from skill_profile
+        simulations : int - finishes per bowler
+        seed : Optional[int]
+        workers : Optional[int] - number of processes, defaults to the number of CPUs, 1 simulates in this process
+        bracket : Sequence[str] - bowlers in bracket order
+        profile : SkillProfile - roll model of bowlers without one in profiles
+        chunk : int - simulations per worker task
+
+    Returns:
+        - Outcome per bowler, most likely winner first (List[Outcome])
+    """
+    bowlers : Tuple[str, ...] = tuple(games.bowlers if isinstance(games, Match) else games)
+    keepers : List[ScoreKeeper] = [games[bowler] for bowler in bowlers]
+    if not keepers:
+        raise ValueError("There are no games to simulate.")
+    if len({scoreKeeper.rules for scoreKeeper in keepers}) > 1:
+        raise ValueError("Simulated games must all be played under the same rules.")
+    index : Dict[str, int] = {bowler : number for number, bowler in enumerate(bowlers)}
+    if bracket and (len(bracket) & (len(bracket) - 1) or len(set(bracket)) != len(bracket) or len(bracket) < 2 or not set(bracket) <= set(index)):
+        raise ValueError(f"A bracket is a draw of 2, 4, 8, ... distinct bowlers of the games. Got: {list(bracket)}")
+    state : List[Live] = [live(scoreKeeper) for scoreKeeper in keepers]
+    models : List[SkillProfile] = [(profiles or {}).get(bowler, profile) for bowler in bowlers]
+    draw : Tuple[int, ...] = tuple(index[bowler] for bowler in bracket)
+    rules : Rules = keepers[0].rules
+    fresh : List[Live] = [(0, scoreKeeper.rounds, 0, compile_rules(rules).slots(scoreKeeper.rounds)) for scoreKeeper in keepers]
+    sizes : List[int] = [min(chunk, simulations - start) for start in range(0, simulations, chunk)]
+    seeds : List[np.random.SeedSequence] = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    count : int = len(bowlers)
+    totals : np.ndarray = np.zeros(count * count + 2 * count, dtype=np.int64)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(sizes) == 1:
+        for size, chunk_seed in zip(sizes, seeds):
+            totals += np.frombuffer(simulate_chunk(state, models, size, chunk_seed, rules, draw, fresh), dtype=np.int64)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for tally in executor.map(simulate_chunk, *zip(*((state, models, size, chunk_seed, rules, draw, fresh) for size, chunk_seed in zip(sizes, seeds)))):
+                totals += np.frombuffer(tally, dtype=np.int64)
+
+    places : np.ndarray = totals[:count * count].reshape(count, count) / max(simulations, 1)
+    means : np.ndarray = totals[count * count:count * count + count] / max(simulations, 1)
+    wins : np.ndarray = totals[count * count + count:] / max(simulations, 1)
+    outcomes : List[Outcome] = [Outcome(bowler, float(places[number, 0]), tuple(float(share) for share in places[number]), float(means[number]),
+                                        float(wins[number]) if draw else None) for number, bowler in enumerate(bowlers)]
+    return sorted(outcomes, key=lambda outcome: -outcome.win)
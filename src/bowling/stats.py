@@ -0,0 +1,410 @@
+from array import array
+from bisect import bisect_left, insort
+from typing import Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameState, RollState
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import numpy as np
+    from .Match import Match
+
+COLUMNS : Tuple[str, ...] = ("games", "score", "pins", "strikes", "strike_chances", "spares", "spare_chances", "opens", "high_game", "high_series", "series_score")
+RANKINGS : Tuple[str, ...] = ("average", "high_game", "high_series", "strike_pct", "spare_pct") # kept sorted for top()
+
+class GameLine(NamedTuple):
+    """
+        GameLine Class for Bowler Program. The counting stats of one finished game.
+
+        Data Properties:
+            - score          : int - final score
+            - pins           : int - pins knocked down
+            - strikes        : int - strikes, fill ball strikes of the last frame included
+            - strike_chances : int - balls rolled at a full rack
+            - spares         : int - spares, fill ball spares of the last frame included
+            - spare_chances  : int - balls at a full rack that left pins and were followed by another ball of the frame
+            - opens          : int - frames without a strike or spare
+    """
+    score : int
+    pins : int
+    strikes : int
+    strike_chances : int
+    spares : int
+    spare_chances : int
+    opens : int
+
+class BowlerStats(NamedTuple):
+    """
+        BowlerStats Class for Bowler Program. The rollup of every game recorded for a bowler.
+
+        Data Properties:
+            - bowler      : Hashable - bowler id
+            - games       : int - games recorded
+            - average     : float - score per game
+            - high_game   : int - best game
+            - high_series : int - best total of the games recorded with the same series key
+            - strike_pct  : float - strikes per strike chance, in percent
+            - spare_pct   : float - spares per spare chance, in percent
+            - opens       : int - open frames
+            - strikes     : int
+            - spares      : int
+            - pins        : int - pins knocked down
+    """
+    bowler : Hashable
+    games : int
+    average : float
+    high_game : int
+    high_series : int
+    strike_pct : float
+    spare_pct : float
+    opens : int
+    strikes : int
+    spares : int
+    pins : int
+
+def game_line(scoreKeeper : ScoreKeeper) -> GameLine:
+    """
+    Stats game_line Function for Bowler Program. Reads the counting stats of a finished game straight from its roll marks, without the Frame and Roll views.
+    Works for any Rules: a ball is at a full rack when it is the first of its frame or follows a STRIKE or SPARE of the last frame.
+    Will raise a ValueError if the game has not ended.
+
+    Data Properties:
+        scoreKeeper : ScoreKeeper
+
+    Returns:
+        - Stats of the game (GameLine)
+    """
+    if scoreKeeper._state != GameState.GAME_END:
+        raise ValueError("Only finished games can be recorded.")
+    marks, pinfall, balls, rounds = scoreKeeper._marks, scoreKeeper._pinfall, scoreKeeper._rules.balls, scoreKeeper._rounds
+    strike, spare, empty, striked = RollState.STRIKE.value, RollState.SPARE.value, RollState.EMPTY.value, RollState.STRIKED.value
+    pins = strikes = strike_chances = spares = spare_chances = opens = 0
+    for frame in range(rounds):
+        first : int = balls * frame
+        end : int = first + balls if frame < rounds - 1 else len(marks)
+        fresh, marked = True, False
+        for slot in range(first, end):
+            mark : int = marks[slot]
+            if mark == empty or mark == striked:
+                break
+            pins += pinfall[slot]
+            if fresh:
+                strike_chances += 1
+                if mark == strike:
+                    strikes += 1
+                elif slot + 1 < end and marks[slot + 1] != empty and marks[slot + 1] != striked:
+                    spare_chances += 1
+            spares += mark == spare
+            fresh = mark == strike or mark == spare
+            marked = marked or fresh
+        opens += not marked
+    return GameLine(scoreKeeper.score, pins, strikes, strike_chances, spares, spare_chances, opens)
+
+def game_lines(pins, rounds : int = 10) -> Dict[str, "np.ndarray"]:
+    """
+    Stats game_lines Function for Bowler Program. Computes the GameLine fields of many finished tenpin games at once, a frame at a time across all games.
+    Takes the padded pin array of batch.score_games, e.g. from generator.random_games or archive.RecordReader.pins(). Requires numpy.
+    Will raise a ValueError if a game is not finished.
+
+    Data Properties:
+        pins : array-like of shape (games, 2 * rounds + 1)
+        rounds : int
+
+    Returns:
+        - One array of shape (games,) per GameLine field (Dict[str, np.ndarray])
+    """
+    import numpy as np
+    from .batch import PAD, roll_slots, score_games
+    scores, _ = score_games(pins, rounds)
+    rows : np.ndarray = np.asarray(pins, dtype=np.int16)
+    games : int = rows.shape[0]
+    padded : np.ndarray = np.full((games, roll_slots(rounds) + 2), PAD, dtype=np.int16)
+    padded[:, :rows.shape[1]] = rows
+    known : np.ndarray = padded >= 0
+    counted : np.ndarray = np.where(known, padded, 0)
+
+    index : np.ndarray = np.arange(games)
+    start : np.ndarray = np.zeros(games, dtype=np.intp)
+    lines : Dict[str, np.ndarray] = {field : np.zeros(games, dtype=np.int64) for field in GameLine._fields}
+    lines["score"] = scores.astype(np.int64)
+    lines["pins"] = counted.sum(axis=1, dtype=np.int64)
+
+    for frame in range(rounds - 1):
+        first : np.ndarray = counted[index, start]
+        strike : np.ndarray = first == 10
+        spare : np.ndarray = ~strike & (first + counted[index, start + 1] == 10)
+        lines["strikes"] += strike
+        lines["strike_chances"] += 1
+        lines["spares"] += spare
+        lines["spare_chances"] += ~strike
+        lines["opens"] += ~strike & ~spare
+        start = start + np.where(strike, 1, 2)
+
+    # the last frame: a strike or spare sets a full rack for the fill balls
+    first, second, third = counted[index, start], counted[index, start + 1], counted[index, start + 2]
+    strike = first == 10
+    double : np.ndarray = strike & (second == 10)
+    spare = ~strike & (first + second == 10)
+    fill : np.ndarray = strike | spare
+    if not (known[index, start + 1].all() and (known[index, start + 2] | ~fill).all()):
+        raise ValueError("Only finished games can be recorded.")
+    refilled : np.ndarray = double | spare # the third ball is at a full rack
+    converted : np.ndarray = strike & ~double & (second + third == 10)
+    lines["strikes"] += strike.astype(np.int64) + double + (refilled & (third == 10))
+    lines["strike_chances"] += 1 + strike.astype(np.int64) + refilled
+    lines["spares"] += spare.astype(np.int64) + converted
+    lines["spare_chances"] += ~double # the first ball unless it was a strike, else the second unless it was one too
+    lines["opens"] += ~fill
+    return lines
+
+class Ledger():
+    """
+        Ledger Class for Bowler Program. Season stats of many bowlers, rolled up a game at a time as games finish.
+        Every counter is one compact array indexed by bowler, and the bowlers are kept sorted by each of RANKINGS,
+        so top() reads the leaders off an index instead of scanning every bowler.
+
+        Data Properties:
+            - bowlers : Tuple[Hashable, ...] - bowlers in the order they were first recorded
+    """
+    def __init__(self):
+        self._bowlers : List[Hashable] = []
+        self._index : Dict[Hashable, int] = {}
+        self._columns : Dict[str, array] = {column : array('q') for column in COLUMNS}
+        self._series : List[Optional[Hashable]] = [] # series key of each bowler's latest series
+        self._rankings : Dict[str, List[Tuple[float, int]]] = {ranking : [] for ranking in RANKINGS} # (value, -bowler index), ascending
+
+    @property
+    def bowlers(self) -> Tuple[Hashable, ...]:
+        """
+        Ledger Read-Only bowlers Property for Bowler Program. Returns the bowlers in the order they were first recorded.
+
+        Data Properties:
+
+        Returns:
+            - Bowlers (Tuple[Hashable, ...])
+        """
+        return tuple(self._bowlers)
+
+    def __len__(self) -> int:
+        """
+        Ledger len Property for Bowler Program. Returns number of bowlers in the Ledger.
+
+        Data Properties:
+
+        Returns:
+            - Number of bowlers (int)
+        """
+        return len(self._bowlers)
+
+    def __contains__(self, bowler : Hashable) -> bool:
+        """
+        Ledger contains Property for Bowler Program. Returns whether a bowler has games recorded.
+
+        Data Properties:
+            bowler : Hashable
+
+        Returns:
+            - Whether the bowler is in the Ledger (bool)
+        """
+        return bowler in self._index
+
+    def __getitem__(self, bowler : Hashable) -> BowlerStats:
+        """
+        Ledger GetItem Property for Bowler Program. Returns the stats of a bowler.
+        Will raise a KeyError if the bowler has no games recorded.
+
+        Data Properties:
+            bowler : Hashable
+
+        Returns:
+            - The bowler's stats (BowlerStats)
+        """
+        return self._stats(self._index[bowler])
+
+    def _stats(self, index : int) -> BowlerStats:
+        """
+        Ledger private Stats method for Bowler Program. Builds the stats of the bowler at an index from the counters.
+
+        Data Properties:
+            index : int
+
+        Returns:
+            - The bowler's stats (BowlerStats)
+        """
+        columns : Dict[str, array] = self._columns
+        return BowlerStats(self._bowlers[index], columns["games"][index], self._value("average", index), columns["high_game"][index], columns["high_series"][index],
+                           self._value("strike_pct", index), self._value("spare_pct", index), columns["opens"][index], columns["strikes"][index],
+                           columns["spares"][index], columns["pins"][index])
+
+    def _value(self, ranking : str, index : int) -> float:
+        """
+        Ledger private Value method for Bowler Program. Returns the value a bowler is ranked by.
+
+        Data Properties:
+            ranking : str - one of RANKINGS
+            index : int
+
+        Returns:
+            - Value of the ranking (float)
+        """
+        columns : Dict[str, array] = self._columns
+        if ranking == "average":
+            return columns["score"][index] / columns["games"][index]
+        if ranking == "strike_pct":
+            chances : int = columns["strike_chances"][index]
+            return 100 * columns["strikes"][index] / chances if chances else 0.0
+        if ranking == "spare_pct":
+            chances = columns["spare_chances"][index]
+            return 100 * columns["spares"][index] / chances if chances else 0.0
+        return columns[ranking][index]
+
+    def record(self, bowler : Hashable, scoreKeeper : ScoreKeeper, series : Optional[Hashable] = None) -> GameLine:
+        """
+        Ledger record method for Bowler Program. Rolls a finished game into a bowler's stats, e.g. from the on_finish hook of stream.score_events.
+        Games recorded in a row with the same series key, e.g. a league night, add up to a series. Games without a key count toward no series.
+        Will raise a ValueError if the game has not ended.
+
+        Data Properties:
+            bowler : Hashable
+            scoreKeeper : ScoreKeeper
+            series : Optional[Hashable]
+
+        Returns:
+            - Stats of the recorded game (GameLine)
+        """
+        line : GameLine = game_line(scoreKeeper)
+        self.add(bowler, line, series)
+        return line
+
+    def record_match(self, match : "Match", series : Optional[Hashable] = None) -> None:
+        """
+        Ledger record_match method for Bowler Program. Records the game of every bowler of a finished Match.
+        Will raise a ValueError if a game has not ended.
+
+        Data Properties:
+            match : Match
+            series : Optional[Hashable]
+
+        Returns:
+            - None
+        """
+        for bowler in match.bowlers:
+            self.record(bowler, match[bowler], series)
+
+    def add(self, bowler : Hashable, line : GameLine, series : Optional[Hashable] = None) -> None:
+        """
+        Ledger add method for Bowler Program. Adds the stats of one game to a bowler's counters and moves the bowler within each ranking.
+
+        Data Properties:
+            bowler : Hashable
+            line : GameLine
+            series : Optional[Hashable]
+
+        Returns:
+            - None
+        """
+        index : Optional[int] = self._index.get(bowler)
+        if index is None:
+            index = self._index[bowler] = len(self._bowlers)
+            self._bowlers.append(bowler)
+            self._series.append(None)
+            for column in self._columns.values():
+                column.append(0)
+        else:
+            for ranking, ranked in self._rankings.items():
+                del ranked[bisect_left(ranked, (self._value(ranking, index), -index))]
+
+        columns : Dict[str, array] = self._columns
+        columns["games"][index] += 1
+        for field, value in zip(GameLine._fields, line):
+            columns[field][index] += value
+        columns["high_game"][index] = max(columns["high_game"][index], line.score)
+        if series is not None:
+            if self._series[index] != series:
+                self._series[index] = series
+                columns["series_score"][index] = 0
+            columns["series_score"][index] += line.score
+            columns["high_series"][index] = max(columns["high_series"][index], columns["series_score"][index])
+
+        for ranking, ranked in self._rankings.items():
+            insort(ranked, (self._value(ranking, index), -index))
+
+    def top(self, count : int, by : str = "average", min_games : int = 0) -> List[BowlerStats]:
+        """
+        Ledger top method for Bowler Program. Returns the leaders of a ranking, read from its index. Ties are listed in the order bowlers were first recorded.
+        Will raise a ValueError if by is not one of RANKINGS.
+
+        Data Properties:
+            count : int
+            by : str - one of RANKINGS
+            min_games : int - bowlers with fewer games are skipped, as league average lists require
+
+        Returns:
+            - Up to count bowlers, best first (List[BowlerStats])
+        """
+        if by not in self._rankings:
+            raise ValueError(f"Cannot rank by {by!r}. Rankings: {', '.join(RANKINGS)}")
+        games : array = self._columns["games"]
+        leaders : List[BowlerStats] = []
+        for _, index in reversed(self._rankings[by]):
+            if len(leaders) == count:
+                break
+            if games[-index] >= min_games:
+                leaders.append(self._stats(-index))
+        return leaders
+
+    @classmethod
+    def from_games(cls, pins, bowlers : Sequence[Hashable], series : Optional[Sequence[Hashable]] = None, rounds : int = 10) -> "Ledger":
+        """
+        Ledger from_games Method for Bowler Program. Recomputes season stats from a bulk corpus of finished tenpin games with vectorized passes instead of a ScoreKeeper per game.
+        The corpus is in the order the games were bowled, so later games can be recorded incrementally on the returned Ledger. Requires numpy.
+        Will raise a ValueError if the corpus and its bowlers or series keys differ in length, or a game is not finished.
+
+        Data Properties:
+            pins : array-like of shape (games, 2 * rounds + 1) - padded pin array as taken by batch.score_games
+            bowlers : Sequence[Hashable] - bowler of each game
+            series : Optional[Sequence[Hashable]] - series key of each game
+            rounds : int
+
+        Returns:
+            - Stats of every bowler in the corpus, bowlers in sorted order (Ledger)
+        """
+        import numpy as np
+        lines : Dict[str, np.ndarray] = game_lines(pins, rounds)
+        games : int = len(lines["score"])
+        if len(bowlers) != games or (series is not None and len(series) != games):
+            raise ValueError(f"Expected a bowler{' and a series key' if series is not None else ''} for each of the {games} games.")
+        ledger : Ledger = cls()
+        if not games:
+            return ledger
+        names, codes = np.unique(np.asarray(bowlers), return_inverse=True)
+        count : int = len(names)
+        columns : Dict[str, np.ndarray] = {field : np.bincount(codes, weights=lines[field], minlength=count) for field in GameLine._fields}
+        columns["games"] = np.bincount(codes, minlength=count)
+        columns["high_game"] = np.zeros(count, dtype=np.int64)
+        np.maximum.at(columns["high_game"], codes, lines["score"])
+        columns["high_series"] = np.zeros(count, dtype=np.int64)
+        columns["series_score"] = np.zeros(count, dtype=np.int64)
+        keys : List[Optional[Hashable]] = [None] * count
+
+        if series is not None:
+            # games a bowler rolls in a row with the same key add up to a series, as record() does, the bowler's latest series stays open for games recorded later
+            series_keys, series_codes = np.unique(np.asarray(series), return_inverse=True)
+            order : np.ndarray = np.argsort(codes, kind="stable") # each bowler's games, in the order they were bowled
+            bowler_codes, key_codes = codes[order], series_codes[order]
+            starts : np.ndarray = np.ones(games, dtype=bool)
+            starts[1:] = (bowler_codes[1:] != bowler_codes[:-1]) | (key_codes[1:] != key_codes[:-1])
+            runs : np.ndarray = np.cumsum(starts) - 1
+            totals : np.ndarray = np.bincount(runs, weights=lines["score"][order]).astype(np.int64)
+            np.maximum.at(columns["high_series"], bowler_codes[starts], totals)
+            latest : np.ndarray = np.append(bowler_codes[1:] != bowler_codes[:-1], True) # last game of each bowler
+            columns["series_score"] = totals[runs[latest]]
+            keys = series_keys[key_codes[latest]].tolist()
+
+        ledger._bowlers = names.tolist()
+        ledger._index = {bowler : index for index, bowler in enumerate(ledger._bowlers)}
+        ledger._columns = {column : array('q', columns[column].astype(np.int64).tobytes()) for column in COLUMNS}
+        ledger._series = keys
+        for ranking in RANKINGS:
+            ledger._rankings[ranking] = sorted((ledger._value(ranking, index), -index) for index in range(count))
+        return ledger
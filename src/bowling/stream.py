@@ -0,0 +1,150 @@
+import sys
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+from .ScoreKeeper import ScoreKeeper
+from .constants import GameOverPolicy, GameState
+from .rules import TENPIN, Rules
+
+Event = Tuple[str, str, int] # (lane_id, game_id, pins)
+REMEMBER : int = 100_000 # ids of ended games kept to reject late rolls, the oldest are forgotten first
+
+class GameRecord(NamedTuple):
+    """
+        GameRecord Class for Bowler Program. Result of a completed game emitted by the streaming scorer.
+
+        Data Properties:
+            - lane   : str - lane id
+            - game   : str - game id
+            - score  : int - final score
+            - frames : Tuple[int, ...] - cumulative score per frame
+    """
+    lane : str
+    game : str
+    score : int
+    frames : Tuple[int, ...]
+
+    def __str__(self) -> str:
+        return f"{self.lane} {self.game} {self.score}"
+
+def report_error(error : Exception) -> None:
+    """
+    Stream report_error Function for Bowler Program. Default on_error of the streaming scorer, writes the error to stderr and carries on.
+
+    Data Properties:
+        error : Exception
+
+    Returns:
+        - None
+    """
+    print(f"Skipped: {error}", file=sys.stderr)
+
+def read_events(lines : Iterable[str], on_error : Optional[Callable[[Exception], None]] = None) -> Iterator[Event]:
+    """
+    Stream read_events Function for Bowler Program. Parses newline-delimited roll events.
+    Each non-blank line holds a lane id, a game id and a pin count separated by whitespace or commas. Lines starting with # are skipped.
+    A malformed line is skipped and passed to on_error as a ValueError, so one bad line does not end an endless stream.
+
+    Data Properties:
+        lines : Iterable[str] - e.g. an open file or sys.stdin
+        on_error : Optional[Callable[[Exception], None]] - called with each skipped line's error, report_error when None
+
+    Returns:
+        - Iterator of (lane_id, game_id, pins) events (Iterator[Event])
+    """
+    on_error = on_error or report_error
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = line.replace(",", " ").split()
+        if len(fields) != 3 or not fields[2].lstrip("-").isdigit():
+            on_error(ValueError(f"Malformed roll event on line {number}: {line!r}"))
+            continue
+        lane, game, pins = fields
+        yield lane, game, int(pins)
+
+def score_events(events : Iterable[Event], rounds : int = 10, rules : Rules = TENPIN,
+                 on_finish : Optional[Callable[[str, str, ScoreKeeper], None]] = None,
+                 on_error : Optional[Callable[[Exception], None]] = None, remember : int = REMEMBER) -> Iterator[GameRecord]:
+    """
+    Stream score_events Function for Bowler Program. Routes roll events to a ScoreKeeper per (lane, game) and yields each game as soon as it ends.
+    Finished games are evicted, so memory is bounded by the number of games in flight rather than by the length of the stream.
+    Evicted ScoreKeepers are reset and reused for the next new game.
+    A roll the ScoreKeeper rejects drops its game, and a roll for a game that has finished or was dropped is rejected rather than starting
+    a new game under the same id, each passed to on_error as a ValueError. The other games carry on.
+
+    Data Properties:
+        events : Iterable[Event]
+        rounds : int
+        rules : Rules
+        on_finish : Optional[Callable[[str, str, ScoreKeeper], None]] - called with the lane, game and ScoreKeeper of each game as it ends, before it is reused, e.g. to record it in a stats.Ledger
+        on_error : Optional[Callable[[Exception], None]] - called with the error of each rejected roll, report_error when None
+        remember : int - ids of ended games kept to reject late rolls, the oldest are forgotten first
+
+    Returns:
+        - Iterator of completed games in the order they finish (Iterator[GameRecord])
+    """
+    on_error = on_error or report_error
+    games : Dict[Tuple[str, str], ScoreKeeper] = {}
+    ended : Dict[Tuple[str, str], str] = {} # finished or dropped games, oldest first
+    pool : List[ScoreKeeper] = []
+    for lane, game, pins in events:
+        key : Tuple[str, str] = (lane, game)
+        scoreKeeper : ScoreKeeper = games.get(key)
+        if scoreKeeper is None:
+            if key in ended:
+                on_error(ValueError(f"Late roll of {pins} for lane {lane} game {game}, which {ended[key]}."))
+                continue
+            scoreKeeper = games[key] = pool.pop() if pool else ScoreKeeper(rounds=rounds, on_game_over=GameOverPolicy.RAISE, rules=rules)
+        try:
+            scoreKeeper.roll(pins)
+        except Exception as error:
+            on_error(ValueError(f"Dropped lane {lane} game {game}: {error}"))
+            _end(games, ended, key, "was dropped", remember)
+            scoreKeeper.reset()
+            pool.append(scoreKeeper)
+            continue
+        if scoreKeeper._state == GameState.GAME_END:
+            _end(games, ended, key, "has finished", remember)
+            record : GameRecord = GameRecord(lane, game, scoreKeeper.score, tuple(scoreKeeper.cumulative_score(i) for i in range(rounds)))
+            if on_finish is not None:
+                on_finish(lane, game, scoreKeeper)
+            scoreKeeper.reset()
+            pool.append(scoreKeeper)
+            yield record
+
+def _end(games : Dict[Tuple[str, str], ScoreKeeper], ended : Dict[Tuple[str, str], str], key : Tuple[str, str], reason : str, remember : int) -> None:
+    """
+    Stream private void End Function for Bowler Program. Evicts a game that finished or was dropped and remembers its id, forgetting the oldest past remember.
+
+    Data Properties:
+        games : Dict[Tuple[str, str], ScoreKeeper] - games in flight
+        ended : Dict[Tuple[str, str], str] - why each remembered game ended
+        key : Tuple[str, str] - (lane, game)
+        reason : str
+        remember : int
+
+    Returns:
+        - None
+    """
+    del games[key]
+    ended[key] = reason
+    if len(ended) > remember:
+        del ended[next(iter(ended))]
+
+def score_stream(source : TextIO, rounds : int = 10, rules : Rules = TENPIN,
+                 on_finish : Optional[Callable[[str, str, ScoreKeeper], None]] = None,
+                 on_error : Optional[Callable[[Exception], None]] = None) -> Iterator[GameRecord]:
+    """
+    Stream score_stream Function for Bowler Program. Scores a newline-delimited roll event log from a file or stdin.
+
+    Data Properties:
+        source : TextIO
+        rounds : int
+        rules : Rules
+        on_finish : Optional[Callable[[str, str, ScoreKeeper], None]] - see score_events
+        on_error : Optional[Callable[[Exception], None]] - called with each malformed line and rejected roll, report_error when None
+
+    Returns:
+        - Iterator of completed games in the order they finish (Iterator[GameRecord])
+    """
+    return score_events(read_events(source, on_error), rounds=rounds, rules=rules, on_finish=on_finish, on_error=on_error)
@@ -0,0 +1,280 @@
+from __future__ import annotations
+from collections import namedtuple
+from functools import lru_cache
+from .constants import GameState, RollState
+from .rules import Rules
+
+TYPE_CHECKING = False # typing is only imported by type checkers, it would double the import time of the scorer
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Tuple
+
+MAX_FRAME_SLOTS : int = 3 # roll boxes per frame on a scoresheet
+MAX_BONUS_BALLS : int = 3 # bonus balls one frame can earn, the table grows fast with more
+
+class Transition(namedtuple("Transition", ("position", "state", "slot", "mark", "striked", "bonus", "advance", "pins", "score"))):
+    """
+        Transition Class for Bowler Program. Precomputed effect of one roll in a given game position.
+
+        Data Properties:
+            - position : int - Position id after the roll
+            - state    : GameState - game state after the roll
+            - slot     : int - roll slot of the frame that receives the pins
+            - mark     : int - RollState value stored for the roll
+            - striked  : int - number of slots after the roll left unused by a mark and marked STRIKED
+            - bonus    : Tuple[int, ...] - how many frames back each strike or spare addend goes
+            - advance  : bool - move to the next frame
+            - pins     : int - pins standing after the roll, a full rack once the game is over
+            - score    : int - pins the roll counts for, a no-tap strike counts the full rack
+    """
+    __slots__ = ()
+
+class Position(namedtuple("Position", ("ball", "standing", "owed", "allowed", "fresh", "last", "filling", "ended"), defaults=(True, False, False, False))):
+    """
+        Position Class for Bowler Program. Everything about a game in progress that decides how its next roll is scored.
+
+        Data Properties:
+            - ball     : int - balls rolled in the current frame
+            - standing : int - pins standing
+            - owed     : Tuple[int, ...] - bonus balls still owed to the frames before the current one, the previous frame first
+            - allowed  : int - balls the current frame may take
+            - fresh    : bool - the next ball is the first at a full rack
+            - last     : bool - inside the last frame, after its first ball
+            - filling  : bool - the last frame has earned fill balls
+            - ended    : bool - the game is over
+    """
+    __slots__ = ()
+
+def _label(position : Position) -> GameState:
+    """
+    Transitions private label Function for Bowler Program. Names a Position by the GameState of a tenpin game in the same spot, for display and instrumentation.
+
+    Data Properties:
+        position : Position
+
+    Returns:
+        - The GameState of the position (GameState)
+    """
+    if position.ended:
+        return GameState.GAME_END
+    elif position.ball == 0:
+        if not position.owed:
+            return GameState.FIRST_ROLL
+        elif len(position.owed) > 1:
+            return GameState.CONSECTUIVE_STRIKES
+        return GameState.STRIKE_A_ROLL_AGO if position.owed[0] > 1 else GameState.SPARE_A_ROLL_AGO
+    elif position.ball == 1:
+        return GameState.STRIKE_TWO_ROLLS_AGO if position.owed else GameState.SECOND_ROLL
+    return GameState.BONUS if position.filling else GameState.THIRD_ROLL
+
+def _trim(owed : Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Transitions private trim Function for Bowler Program. Drops the frames at the end of owed that are owed nothing.
+
+    Data Properties:
+        owed : Tuple[int, ...]
+
+    Returns:
+        - Trimmed owed bonus balls (Tuple[int, ...])
+    """
+    while owed and not owed[-1]:
+        owed = owed[:-1]
+    return owed
+
+def _roll(rules : Rules, position : Position, last : bool, pins : int) -> Optional[Tuple[Position, int, int, Tuple[int, ...], bool, int, int]]:
+    """
+    Transitions private roll Function for Bowler Program. Works out the effect of one roll, following the strike, spare and fill ball rules of a variant.
+
+    Data Properties:
+        rules : Rules
+        position : Position
+        last : bool - the roll is in the last frame
+        pins : int - pins knocked by the roll
+
+    Returns:
+        - Position after the roll, mark, striked slots, bonus frames back, advance and pins the roll counts for, None for an impossible roll (Optional[Tuple])
+    """
+    if position.ended or pins > position.standing or position.last and not last:
+        return None
+    ball : int = position.ball
+    fresh : bool = position.fresh
+    strike : bool = fresh and pins >= rules.no_tap
+    cleared : bool = strike or pins == position.standing
+    score : int = position.standing if cleared else pins
+    bonus : Tuple[int, ...] = tuple(back + 1 for back in reversed(range(len(position.owed))) if position.owed[back]) # STRIKE and SPARE addends, oldest first
+    owed : Tuple[int, ...] = tuple(max(balls - 1, 0) for balls in position.owed)
+
+    if not last:
+        if cleared: # STRIKE or SPARE, the frame earns bonus balls
+            mark : RollState = RollState.STRIKE if fresh else RollState.SPARE if rules.bonus[ball] else RollState.OPEN
+            after : Position = Position(0, rules.pins, _trim((rules.bonus[ball],) + owed), rules.balls)
+            return after, mark.value, rules.balls - ball - 1, bonus, True, rules.pins, score
+        elif ball + 1 == rules.balls: # OPEN
+            return Position(0, rules.pins, _trim((0,) + owed), rules.balls), RollState.OPEN.value, 0, bonus, True, rules.pins, score
+        after = Position(ball + 1, position.standing - pins, _trim(owed), rules.balls, False)
+        return after, RollState.OPEN.value, 0, bonus, False, after.standing, score
+
+    # last frame: a cleared rack is set again and a mark with its own balls earns fill balls
+    allowed, filling = position.allowed, position.filling
+    if strike:
+        mark = RollState.STRIKE
+    elif cleared and (filling or rules.bonus[ball]):
+        mark = RollState.SPARE
+    else:
+        mark = RollState.OPEN
+    if cleared and not filling:
+        allowed, filling = ball + 1 + rules.fill[ball], rules.fill[ball] > 0
+    standing : int = rules.pins if cleared else position.standing - pins
+    after = Position(ball + 1, standing, _trim(owed), allowed, cleared, True, filling, ball + 1 >= allowed)
+    return after, mark.value, 0, bonus, False, rules.pins if after.ended else standing, score # a full rack once the game is over, as the next roll may start a new game
+
+def check_rules(rules : Rules) -> None:
+    """
+    Transitions check_rules Function for Bowler Program. Checks that Rules describe a playable variant that fits a scoresheet.
+    Will raise a ValueError if they do not.
+
+    Data Properties:
+        rules : Rules
+
+    Returns:
+        - None
+    """
+    if not 1 <= rules.pins <= 10:
+        raise ValueError(f"Rules must have 1 to 10 pins. Got: {rules.pins}")
+    if not 1 <= rules.balls <= MAX_FRAME_SLOTS:
+        raise ValueError(f"Rules must have 1 to {MAX_FRAME_SLOTS} balls per frame. Got: {rules.balls}")
+    if len(rules.bonus) != rules.balls or len(rules.fill) != rules.balls or min(rules.bonus + rules.fill) < 0:
+        raise ValueError(f"Rules need a bonus and a fill ball count of 0 or more for each of the {rules.balls} balls of a frame. Got: {rules.bonus}, {rules.fill}")
+    if max(rules.bonus) > MAX_BONUS_BALLS:
+        raise ValueError(f"Rules can earn a frame at most {MAX_BONUS_BALLS} bonus balls. Got: {rules.bonus}")
+    if not 1 <= rules.no_tap <= 255:
+        raise ValueError(f"Rules need a no_tap count of 1 or more pins, more than the rack never applies. Got: {rules.no_tap}")
+    if max(ball + 1 + fill for ball, fill in enumerate(rules.fill)) > MAX_FRAME_SLOTS:
+        raise ValueError(f"The last frame can take at most {MAX_FRAME_SLOTS} balls. Got fill balls: {rules.fill}")
+
+class CompiledRules():
+    """
+        CompiledRules Class for Bowler Program. Transition table of a bowling variant, indexed by Position id, last frame and pins knocked.
+        Built once per Rules by compile_rules and shared by every game that plays them.
+
+        Data Properties:
+            - rules       : Rules
+            - pins        : int - pins in a full rack
+            - balls       : int - roll slots of a frame other than the last
+            - last_slots  : int - roll slots of the last frame
+            - reach       : int - most frames back a bonus can be owed to
+            - width       : int - pin counts per Position and frame kind in the table
+            - transitions : Tuple[Optional[Transition], ...] - indexed by CompiledRules.index
+            - positions   : Tuple[Position, ...] - Position by id, the start of a game is id 0
+            - states      : Tuple[GameState, ...] - GameState by Position id
+            - moves       : Tuple[int, ...] - most rolls left in the frame, indexed by Position id * 2 + last
+    """
+    __slots__ = ('rules', 'pins', 'balls', 'last_slots', 'reach', 'width', 'transitions', 'positions', 'states', 'moves', '_ids')
+
+    def __init__(self, rules : Rules):
+        check_rules(rules)
+        self.rules : Rules = rules
+        self.pins : int = rules.pins
+        self.balls : int = rules.balls
+        self.last_slots : int = max([rules.balls] + [ball + 1 + fill for ball, fill in enumerate(rules.fill)])
+        self.reach : int = max(rules.bonus)
+        self.width : int = rules.pins + 1
+
+        # every Position a game can reach, numbered in the order they are found
+        self._ids : Dict[Position, int] = {}
+        positions : List[Position] = []
+        found : Dict[Tuple[int, bool, int], tuple] = {}
+        pending : List[Position] = [Position(0, rules.pins, (), rules.balls)]
+        self._ids[pending[0]] = 0
+        while pending:
+            position : Position = pending.pop(0)
+            positions.append(position)
+            for last in ((True,) if position.last else (False, True)):
+                for pins in range(self.width):
+                    effect : Optional[tuple] = _roll(rules, position, last, pins)
+                    if effect is None:
+                        continue
+                    after : Position = effect[0]
+                    if after not in self._ids:
+                        self._ids[after] = len(self._ids)
+                        pending.append(after)
+                    found[(self._ids[position], last, pins)] = effect
+        self.positions : Tuple[Position, ...] = tuple(positions)
+        self.states : Tuple[GameState, ...] = tuple(_label(position) for position in positions)
+
+        table : List[Optional[Transition]] = [None] * (len(positions) * 2 * self.width)
+        for (position, last, pins), (after, mark, striked, bonus, advance, standing, score) in found.items():
+            index : int = self._ids[after]
+            table[self.index(position, last, pins)] = Transition(index, self.states[index], positions[position].ball, mark, striked, bonus, advance, standing, score)
+        self.transitions : Tuple[Optional[Transition], ...] = tuple(table)
+        self.moves : Tuple[int, ...] = tuple(self._moves(position, last) for position in range(len(positions)) for last in (False, True))
+
+    def index(self, position : int, last : bool, pins : int) -> int:
+        """
+        CompiledRules index Method for Bowler Program. Returns the position of a roll's Transition in the table.
+
+        Data Properties:
+            position : int - Position id before the roll
+            last : bool - the roll is in the last frame
+            pins : int - pins knocked by the roll
+
+        Returns:
+            - Index into transitions (int)
+        """
+        return (position * 2 + last) * self.width + pins
+
+    def start(self, owed : Tuple[int, ...] = ()) -> int:
+        """
+        CompiledRules start Method for Bowler Program. Returns the Position id of the first ball of a frame.
+        Will raise a KeyError if the bonus balls owed cannot occur under the rules.
+
+        Data Properties:
+            owed : Tuple[int, ...] - bonus balls owed to the frames before, the previous frame first
+
+        Returns:
+            - Position id (int)
+        """
+        return self._ids[Position(0, self.pins, _trim(owed), self.balls)]
+
+    def slots(self, rounds : int) -> int:
+        """
+        CompiledRules slots Method for Bowler Program. Returns the number of roll slots of a game.
+
+        Data Properties:
+            rounds : int
+
+        Returns:
+            - Roll slots of a game of rounds frames (int)
+        """
+        return self.balls * (rounds - 1) + self.last_slots
+
+    def _moves(self, position : int, last : bool) -> int:
+        """
+        CompiledRules private moves Method for Bowler Program. Works out the most rolls a frame can still take from a Position.
+
+        Data Properties:
+            position : int
+            last : bool
+
+        Returns:
+            - Most rolls left in the frame (int)
+        """
+        most : int = 0
+        for pins in range(self.width):
+            transition : Optional[Transition] = self.transitions[self.index(position, last, pins)]
+            if transition is not None:
+                most = max(most, 1 if transition.advance else 1 + self._moves(transition.position, last))
+        return most
+
+@lru_cache(maxsize=None)
+def compile_rules(rules : Rules) -> CompiledRules:
+    """
+    Transitions compile_rules Function for Bowler Program. Returns the transition table of a bowling variant, compiled on first use and shared afterwards.
+    Will raise a ValueError if the rules are not playable, see check_rules.
+
+    Data Properties:
+        rules : Rules
+
+    Returns:
+        - The compiled rules (CompiledRules)
+    """
+    return CompiledRules(rules)
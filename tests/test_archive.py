@@ -0,0 +1,88 @@
+"""
+Tests of the binary game archive for the Bowler Program: records read back as they were written, one at a time or as arrays.
+"""
+import random
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.archive import RecordReader, RecordWriter, pack_game
+from bowling.generator import flatten, random_moves
+
+def finished_games(count : int, seed : int):
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        scoreKeeper = ScoreKeeper()
+        for pins in flatten(random_moves(rng)):
+            if pins >= 0:
+                scoreKeeper.roll(pins)
+        games.append(scoreKeeper)
+    return games
+
+def test_records_read_back(tmp_path) -> None:
+    games = finished_games(200, 1)
+    path = str(tmp_path / "games.bwl")
+    with open(path, "wb") as file:
+        writer = RecordWriter(file)
+        for index, scoreKeeper in enumerate(games):
+            writer.write(scoreKeeper, game=index, lane=index % 24, timestamp=1_700_000_000 + index)
+    assert writer.count == len(games)
+    with RecordReader(path) as reader:
+        assert len(reader) == len(games)
+        for index, (record, scoreKeeper) in enumerate(zip(reader, games)):
+            assert (record.game, record.lane, record.timestamp) == (index, index % 24, 1_700_000_000 + index)
+            assert record.score == scoreKeeper.score
+            assert record.rolls == tuple(scoreKeeper.rolls())
+            assert record.frames == tuple(scoreKeeper.cumulative_score(frame) for frame in range(10))
+        assert reader[-1] == reader[len(games) - 1]
+        with pytest.raises(IndexError):
+            reader[len(games)]
+
+def test_appending_keeps_one_header(tmp_path) -> None:
+    path = str(tmp_path / "games.bwl")
+    for seed in (2, 3):
+        with open(path, "ab") as file:
+            writer = RecordWriter(file)
+            for scoreKeeper in finished_games(5, seed):
+                writer.write(scoreKeeper)
+    with RecordReader(path) as reader:
+        assert [record.score for record in reader] == [scoreKeeper.score for scoreKeeper in finished_games(5, 2) + finished_games(5, 3)]
+
+def test_pins_rescore_like_the_records(tmp_path) -> None:
+    np = pytest.importorskip("numpy")
+    from bowling.batch import score_games
+    path = str(tmp_path / "games.bwl")
+    with open(path, "wb") as file:
+        writer = RecordWriter(file)
+        for scoreKeeper in finished_games(300, 4):
+            writer.write(scoreKeeper)
+    with RecordReader(path) as reader:
+        records = reader.records()
+        scores, cumulative = score_games(reader.pins())
+        assert (scores == records["score"]).all()
+        assert (cumulative == records["frames"]).all()
+        del records
+        assert np.array_equal(scores, [record.score for record in reader])
+
+def test_unfinished_games_and_other_files_are_rejected(tmp_path) -> None:
+    scoreKeeper = ScoreKeeper()
+    scoreKeeper.roll(10)
+    with pytest.raises(ValueError):
+        pack_game(scoreKeeper)
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not an archive of games")
+    with pytest.raises(ValueError):
+        RecordReader(str(path))
+
+def test_no_tap_strikes_are_archived_as_tenpin_strikes(tmp_path) -> None:
+    from bowling.rules import NINE_PIN_NO_TAP
+    scoreKeeper = ScoreKeeper(rules=NINE_PIN_NO_TAP)
+    for pins in [9] * 12:
+        scoreKeeper.roll(pins)
+    assert (scoreKeeper.score, scoreKeeper.rolls()) == (300, [9] * 12)
+    path = str(tmp_path / "games.bwl")
+    with open(path, "wb") as file:
+        RecordWriter(file).write(scoreKeeper)
+    with RecordReader(path) as reader:
+        assert (reader[0].score, reader[0].rolls) == (300, (10,) * 12)
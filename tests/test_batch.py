@@ -0,0 +1,42 @@
+"""
+Tests of the batch scorer for the Bowler Program: scores of a whole pin array match a ScoreKeeper rolling each game.
+"""
+import random
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+
+np = pytest.importorskip("numpy")
+from bowling.batch import roll_slots, score_games # requires numpy
+
+def test_scores_match_the_scorekeeper() -> None:
+    """
+    One game in four stops part way, its frames not rolled yet score -1.
+    """
+    rng = random.Random(1)
+    rows, keepers = [], []
+    for _ in range(3_000):
+        scoreKeeper = ScoreKeeper()
+        rolls = []
+        stop = rng.randrange(22) if rng.random() < 0.25 else None
+        while scoreKeeper.movesRemaining() and len(rolls) != stop:
+            pins = scoreKeeper.pins if rng.random() < 0.3 else rng.randint(0, scoreKeeper.pins)
+            scoreKeeper.roll(pins)
+            rolls.append(pins)
+        rows.append(rolls + [-1] * (roll_slots() - len(rolls)))
+        keepers.append(scoreKeeper)
+    scores, cumulative = score_games(np.array(rows))
+    for scoreKeeper, score, frames in zip(keepers, scores.tolist(), cumulative.tolist()):
+        assert score == scoreKeeper.score
+        assert frames == [-1 if total is None else total for total in (scoreKeeper.cumulative_score(frame) for frame in range(10))]
+
+def test_fewer_rounds() -> None:
+    scores, cumulative = score_games([[10, 10, 10, 10, 10, -1, -1], [3, 4, 5, 5, 2, 0, -1]], rounds=3)
+    assert scores.tolist() == [90, 21]
+    assert cumulative.tolist() == [[30, 60, 90], [7, 19, 21]]
+
+@pytest.mark.parametrize("pins", [[[11] + [-1] * 20], [[-2] + [-1] * 20], [[0] * 22], [0] * 21])
+def test_malformed_arrays_raise(pins) -> None:
+    with pytest.raises(ValueError):
+        score_games(pins)
@@ -0,0 +1,33 @@
+"""
+Tests of ScoreKeeper checkpoints for the Bowler Program: games round-trip, and damaged checkpoints raise ValueError.
+"""
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.checkpoint import dump_checkpoint, load_checkpoint
+
+def games():
+    keepers = {}
+    for lane, rolls in (("lane1", [3, 4, 10, 5]), ("lane2", [10] * 12), ("lane3", [])):
+        scoreKeeper = ScoreKeeper()
+        for pins in rolls:
+            scoreKeeper.roll(pins)
+        keepers[lane] = scoreKeeper
+    return keepers
+
+def test_round_trip() -> None:
+    keepers = games()
+    restored = load_checkpoint(dump_checkpoint(keepers))
+    assert {lane: game.snapshot() for lane, game in restored.items()} == {lane: game.snapshot() for lane, game in keepers.items()}
+
+def test_every_truncation_raises_value_error() -> None:
+    data = dump_checkpoint(games())
+    for length in range(len(data)):
+        with pytest.raises(ValueError):
+            load_checkpoint(data[:length])
+
+def test_short_snapshot_raises_value_error() -> None:
+    snapshot = games()["lane1"].snapshot()
+    for length in range(len(snapshot)):
+        with pytest.raises(ValueError):
+            ScoreKeeper.restore(snapshot[:length])
@@ -0,0 +1,107 @@
+"""
+Concurrency tests of ScoreKeeper.view for the Bowler Program: one thread rolls a game while others read it without a lock.
+"""
+import random
+import sys
+import threading
+from typing import Callable, List
+
+from bowling.ScoreKeeper import GameView, ScoreKeeper
+from bowling.constants import GameOverPolicy
+
+def writer_calls(count : int, seed : int) -> List[Callable[[ScoreKeeper], None]]:
+    """
+    Returns count seeded rolls, corrections and undos that a ScoreKeeper with GameOverPolicy.RESTART can make in order, games back to back.
+    """
+    rng = random.Random(seed)
+    scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART)
+    calls : List[Callable[[ScoreKeeper], None]] = []
+    while len(calls) < count:
+        draw = rng.random()
+        if draw < 0.05 and scoreKeeper.rolls():
+            call = lambda game: game.undo()
+        elif draw < 0.1 and scoreKeeper.frame > 0:
+            frame = rng.randrange(scoreKeeper.frame)
+            call = lambda game, frame=frame: game.correct(frame, 0, 0)
+        else:
+            pins = rng.randint(0, scoreKeeper.pins)
+            call = lambda game, pins=pins: game.roll(pins)
+        try:
+            call(scoreKeeper)
+        except ValueError: # a correction that would make a later roll illegal, the game is unchanged
+            continue
+        calls.append(call)
+    return calls
+
+def published_views(calls : List[Callable[[ScoreKeeper], None]]) -> List[GameView]:
+    """
+    Returns the view after each whole call, made in one thread, starting with the empty game. Version v is at index v - 1.
+    """
+    scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART, concurrent=True)
+    views = [scoreKeeper.view]
+    for call in calls:
+        call(scoreKeeper)
+        views.append(scoreKeeper.view)
+    return views
+
+def test_every_call_publishes_one_view() -> None:
+    views = published_views(writer_calls(2_000, 0))
+    assert [view.version for view in views] == list(range(1, len(views) + 1))
+
+def test_restart_publishes_only_the_roll() -> None:
+    scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART, concurrent=True)
+    for pins in [0] * 18 + [3, 4]:
+        scoreKeeper.roll(pins)
+    ended = scoreKeeper.view
+    scoreKeeper.roll(10)
+    view = scoreKeeper.view
+    assert view.version == ended.version + 1
+    assert (view.score, view.frame, view.frames) == (10, 1, (10,))
+
+def test_views_match_a_plain_game() -> None:
+    plain = ScoreKeeper()
+    concurrent = ScoreKeeper(concurrent=True)
+    for pins in [10, 7, 3, 9, 0, 10, 10, 4]:
+        plain.roll(pins)
+        concurrent.roll(pins)
+        assert plain.view == concurrent.view._replace(version=0)
+    assert plain.view.version == 0
+
+def test_readers_only_see_whole_rolls() -> None:
+    """
+    Readers check every view they read against the view published after some whole call, and that versions never go back.
+    """
+    calls = writer_calls(20_000, 1)
+    expected = published_views(calls)
+    scoreKeeper = ScoreKeeper(on_game_over=GameOverPolicy.RESTART, concurrent=True)
+    done = threading.Event()
+    torn : List[GameView] = []
+    reads = [0]
+
+    def write() -> None:
+        for call in calls:
+            call(scoreKeeper)
+        done.set()
+
+    def read() -> None:
+        last = 0
+        while not done.is_set():
+            view = scoreKeeper.view
+            if view.version < last or expected[view.version - 1] != view:
+                torn.append(view)
+            last = view.version
+            reads[0] += 1
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=write)] + [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert not torn
+    assert reads[0] > 0
+    assert scoreKeeper.view == expected[-1]
@@ -0,0 +1,92 @@
+"""
+Tests of roll correction and undo for the Bowler Program: under every rules preset, the edited game matches a fresh game rolled with the edited rolls.
+"""
+import random
+from typing import List, Optional
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameState, RollState
+from bowling.rules import RULES, Rules
+
+def replay(rolls : List[int], rules : Rules) -> Optional[ScoreKeeper]:
+    """
+    Returns a new game that rolled rolls, None if one of them is illegal.
+    """
+    scoreKeeper = ScoreKeeper(rules=rules)
+    for pins in rolls:
+        if scoreKeeper._state == GameState.GAME_END or not 0 <= pins <= scoreKeeper.pins:
+            return None
+        scoreKeeper.roll(pins)
+    return scoreKeeper
+
+def same_game(edited : ScoreKeeper, fresh : ScoreKeeper) -> bool:
+    return (edited.snapshot() == fresh.snapshot() and edited.rolls() == fresh.rolls()
+            and [frame.score for frame in edited._frames] == [frame.score for frame in fresh._frames]
+            and [[roll.symbol for roll in frame] for frame in edited._frames] == [[roll.symbol for roll in frame] for frame in fresh._frames])
+
+def random_rolls(rng : random.Random, rules : Rules) -> List[int]:
+    """
+    Returns the rolls of a random game, often a no-tap strike or a strike.
+    """
+    scoreKeeper = ScoreKeeper(rules=rules)
+    rolls : List[int] = []
+    while scoreKeeper._state != GameState.GAME_END:
+        draw = rng.random()
+        pins = scoreKeeper.pins if draw < 0.25 else min(rules.no_tap, scoreKeeper.pins) if draw < 0.5 else rng.randint(0, scoreKeeper.pins)
+        scoreKeeper.roll(pins)
+        rolls.append(pins)
+    return rolls
+
+def made_rolls(scoreKeeper : ScoreKeeper):
+    """
+    Yields the frame and roll of every roll made, in the order they were rolled.
+    """
+    balls = scoreKeeper._rules.balls
+    for slot, mark in enumerate(scoreKeeper._marks):
+        if mark not in (RollState.EMPTY.value, RollState.STRIKED.value):
+            frame = min(slot // balls, scoreKeeper.rounds - 1)
+            yield frame, slot - balls * frame
+
+@pytest.mark.parametrize("name", sorted(RULES))
+def test_corrections_match_a_fresh_game(name : str) -> None:
+    rules = RULES[name]
+    rng = random.Random(name)
+    for _ in range(300):
+        rolls = random_rolls(rng, rules)
+        scoreKeeper = replay(rolls, rules)
+        index = rng.randrange(len(rolls))
+        frame, roll = list(made_rolls(scoreKeeper))[index]
+        pins = rng.choice([0, rules.no_tap, rules.pins, rng.randint(0, rules.pins)])
+        corrected = rolls[:index] + [pins] + rolls[index + 1:]
+        fresh = replay(corrected, rules)
+        before = scoreKeeper.snapshot()
+        if fresh is None:
+            with pytest.raises(ValueError):
+                scoreKeeper.correct(frame, roll, pins)
+            assert scoreKeeper.snapshot() == before, (rolls, index, pins)
+        else:
+            scoreKeeper.correct(frame, roll, pins)
+            assert same_game(scoreKeeper, fresh), (rolls, index, pins)
+            assert scoreKeeper.rolls() == corrected
+
+@pytest.mark.parametrize("name", sorted(RULES))
+def test_undo_matches_a_fresh_game(name : str) -> None:
+    rules = RULES[name]
+    rng = random.Random(name)
+    for _ in range(100):
+        rolls = random_rolls(rng, rules)
+        scoreKeeper = ScoreKeeper(rules=rules)
+        for index, pins in enumerate(rolls):
+            scoreKeeper.roll(pins)
+            scoreKeeper.undo()
+            assert same_game(scoreKeeper, replay(rolls[:index], rules)), rolls[:index + 1]
+            scoreKeeper.roll(pins)
+        assert same_game(scoreKeeper, replay(rolls, rules))
+
+def test_a_no_tap_strike_replays_as_the_pins_it_knocked() -> None:
+    scoreKeeper = replay([10, 2, 7, 4, 6, 2, 8, 10, 10, 10, 10, 9, 2, 8, 5], RULES["9-pin-no-tap"])
+    scoreKeeper.correct(7, 0, 0)
+    assert scoreKeeper.score == 158
+    assert [roll.symbol for roll in scoreKeeper._frames[7]] == ["-", "9"]
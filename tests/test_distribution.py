@@ -0,0 +1,56 @@
+"""
+Tests of the score distribution engine for the Bowler Program, against every game of a few frames rolled out on a ScoreKeeper.
+"""
+import collections
+from typing import Counter
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameState
+from bowling.distribution import best_score, distribution, worst_score
+from bowling.rules import RULES
+
+def endings(scoreKeeper : ScoreKeeper) -> Counter:
+    """
+    Returns the final scores of every legal way to finish a game, rolled out one roll at a time.
+    """
+    scores : Counter = collections.Counter()
+    pending = [scoreKeeper.snapshot()]
+    while pending:
+        snapshot = pending.pop()
+        for pins in range(ScoreKeeper.restore(snapshot).pins + 1):
+            child = ScoreKeeper.restore(snapshot)
+            child.roll(pins)
+            if child._state == GameState.GAME_END:
+                scores[child.score] += 1
+            else:
+                pending.append(child.snapshot())
+    return scores
+
+@pytest.mark.parametrize("rules", sorted(RULES))
+def test_one_frame_matches_every_ending(rules : str) -> None:
+    scoreKeeper = ScoreKeeper(rounds=1, rules=RULES[rules])
+    scores = endings(scoreKeeper)
+    found = distribution(rounds=1, rules=RULES[rules])
+    assert found.games == sum(scores.values())
+    assert {score : found.games_with(score) for score in scores} == dict(scores)
+    assert (found.worst, found.best) == (min(scores), max(scores))
+
+def test_live_games_match_every_ending() -> None:
+    for rolls in ([], [10], [3], [3, 7], [10, 10], [9, 0, 10], [10, 3]):
+        scoreKeeper = ScoreKeeper(rounds=2 if len(rolls) < 3 else 3)
+        for pins in rolls:
+            scoreKeeper.roll(pins)
+        scores = endings(scoreKeeper)
+        found = distribution(scoreKeeper)
+        assert {score : found.games_with(score) for score in scores} == dict(scores), rolls
+        assert found.games == sum(scores.values())
+        assert (worst_score(scoreKeeper), best_score(scoreKeeper)) == (min(scores), max(scores)), rolls
+        assert found.mean == pytest.approx(sum(score * games for score, games in scores.items()) / found.games)
+
+def test_ten_frames() -> None:
+    found = distribution()
+    assert (found.worst, found.best, found.games_with(300)) == (0, 300, 1)
+    assert found.probability_at_least(0) == 1.0
+    assert found.probability(301) == 0.0
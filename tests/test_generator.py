@@ -0,0 +1,57 @@
+"""
+Tests of the random game generator for the Bowler Program: games are legal, seeded, and both generators follow the simulator's roll model.
+"""
+import random
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameState
+from bowling.generator import PROFILES, SkillProfile, flatten, random_moves
+
+SPARES = SkillProfile(0.0, 1.0) # every first ball misses and every other ball clears
+
+def play(rolls) -> ScoreKeeper:
+    scoreKeeper = ScoreKeeper()
+    for pins in rolls:
+        if pins >= 0:
+            scoreKeeper.roll(int(pins))
+    return scoreKeeper
+
+@pytest.mark.parametrize("profile", sorted(PROFILES))
+def test_random_moves_are_legal_finished_games(profile : str) -> None:
+    rng = random.Random(5)
+    for _ in range(500):
+        assert play(flatten(random_moves(rng, PROFILES[profile])))._state == GameState.GAME_END
+
+def test_random_moves_are_seeded() -> None:
+    assert random_moves(random.Random(3)) == random_moves(random.Random(3))
+    assert play(flatten(random_moves(profile=PROFILES["perfect"]))).score == 300
+
+def test_a_ball_after_a_gutter_ball_is_a_spare_ball() -> None:
+    rng = random.Random(6)
+    for _ in range(500):
+        moves = random_moves(rng, SPARES)
+        assert all(frame[0] < 10 and frame[0] + frame[1] == 10 for frame in moves)
+        assert moves[-1][2] < 10
+
+def test_random_games_follow_the_same_model() -> None:
+    np = pytest.importorskip("numpy")
+    from bowling.batch import score_games
+    from bowling.generator import random_games
+    from bowling.simulation import finish_games
+    from bowling.rules import TENPIN
+
+    pins = random_games(500, seed=7, profile=SPARES)
+    first = pins[:, 0:20:2]
+    assert ((first < 10) & (first + pins[:, 1:20:2] == 10)).all()
+    assert all(play(row)._state == GameState.GAME_END for row in random_games(500, seed=8))
+    assert (random_games(50, seed=9) == random_games(50, seed=9)).all()
+
+    new = ScoreKeeper()
+    for profile in ("league", "pro"):
+        generated = score_games(random_games(100_000, seed=10, profile=PROFILES[profile]))[0].mean()
+        rng = random.Random(11)
+        moved = np.mean([play(flatten(random_moves(rng, PROFILES[profile]))).score for _ in range(10_000)])
+        simulated = finish_games([(0, 10, new._position, new.movesRemaining())], [PROFILES[profile]], 100_000, np.random.default_rng(12), TENPIN).mean()
+        assert abs(generated - simulated) < 0.8 and abs(moved - simulated) < 2, (profile, generated, moved, simulated)
@@ -0,0 +1,61 @@
+"""
+Tests of ScoreKeeper instrumentation for the Bowler Program: calls are counted by GameState, exported to Prometheus, and uninstall puts the methods back.
+"""
+import urllib.request
+
+import pytest
+
+from bowling import instrument
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameState
+
+@pytest.fixture
+def metrics():
+    originals = {function : getattr(ScoreKeeper, function) for function in instrument.INSTRUMENTED}
+    metrics = instrument.install(instrument.Metrics())
+    try:
+        yield metrics
+    finally:
+        instrument.uninstall()
+    assert {function : getattr(ScoreKeeper, function) for function in instrument.INSTRUMENTED} == originals
+
+def test_rolls_are_counted_by_game_state(metrics) -> None:
+    assert instrument.installed()
+    scoreKeeper = ScoreKeeper()
+    for pins in [10, 3, 4] + [0] * 16:
+        scoreKeeper.roll(pins)
+    with pytest.raises(Exception):
+        scoreKeeper.roll(11)
+    rolls = metrics.histograms("roll")
+    assert sum(histogram.count for histogram in rolls.values()) == 20
+    assert sum(histogram.errors for histogram in rolls.values()) == 1
+    assert rolls[GameState.GAME_END].count == rolls[GameState.GAME_END].errors == 1 # the roll after the game ended
+    assert rolls[GameState.STRIKE_A_ROLL_AGO].count == 1
+    assert sum(histogram.count for histogram in metrics.histograms("_apply").values()) == 19
+    assert all(histogram.total > 0 for histogram in rolls.values() if histogram.count)
+
+def test_prometheus_buckets_are_cumulative(metrics, tmp_path) -> None:
+    scoreKeeper = ScoreKeeper()
+    for pins in [10] * 12:
+        scoreKeeper.roll(pins)
+    text = metrics.prometheus()
+    counts = [line for line in text.splitlines() if line.startswith("bowling_call_seconds_count{function=\"roll\"")]
+    assert sum(int(line.split()[-1]) for line in counts) == 12
+    buckets = [int(line.split()[-1]) for line in text.splitlines() if line.startswith('bowling_call_seconds_bucket{function="roll",state="FIRST_ROLL"')]
+    assert buckets == sorted(buckets)
+    path = tmp_path / "bowling.prom"
+    instrument.write_prometheus(str(path), metrics)
+    assert path.read_text() == text
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+def test_metrics_are_served_over_http(metrics) -> None:
+    ScoreKeeper().roll(7)
+    server = instrument.serve_metrics(port=0, metrics=metrics)
+    try:
+        host, port = server.server_address[:2]
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+            assert response.read().decode() == metrics.prometheus()
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,120 @@
+"""
+Tests of the roll journal for the Bowler Program: journaled games are rebuilt after a crash, a half written batch is dropped, and a failed commit is raised until it is retried.
+"""
+import errno
+import os
+import random
+import threading
+from typing import Dict
+
+import pytest
+
+import bowling.journal as journal_module
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameOverPolicy
+from bowling.journal import RollJournal, read_batches, read_journal, replay_journal
+from bowling.leaves import leave_mask
+
+def bowl(journal : RollJournal, games : Dict[str, ScoreKeeper], seed : int, rolls : int = 40) -> None:
+    rng = random.Random(seed)
+    for key, scoreKeeper in games.items():
+        for _ in range(rolls):
+            journal.roll(key, scoreKeeper, rng.randint(0, scoreKeeper.pins))
+            chance = rng.random()
+            try:
+                if chance < 0.05:
+                    journal.undo(key, scoreKeeper)
+                elif chance < 0.1 and scoreKeeper.frame > 0:
+                    journal.correct(key, scoreKeeper, 0, 0, rng.randint(0, 10))
+            except ValueError:
+                pass # a rejected correction is journaled and skipped on replay too
+
+def snapshots(games : Dict[str, ScoreKeeper]) -> dict:
+    return {key: scoreKeeper.snapshot() for key, scoreKeeper in games.items()}
+
+@pytest.mark.parametrize("interval", [0.001, None])
+def test_concurrent_games_are_recovered(tmp_path, interval) -> None:
+    path = str(tmp_path / "rolls.journal")
+    games = {f"lane{lane}": ScoreKeeper(on_game_over=GameOverPolicy.RESTART) for lane in range(8)}
+    with RollJournal(path, interval=interval) as journal:
+        threads = [threading.Thread(target=bowl, args=(journal, {key: games[key] for key in list(games)[lane::4]}, lane)) for lane in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        journal.wait()
+        assert journal.durable == journal.appended
+    assert snapshots(read_journal(path, on_game_over=GameOverPolicy.RESTART)) == snapshots(games)
+
+def test_leaves_fouls_and_rejected_rolls_are_replayed(tmp_path) -> None:
+    path = str(tmp_path / "rolls.journal")
+    games = {"leaves": ScoreKeeper()}
+    with RollJournal(path) as journal:
+        journal.roll("leaves", games["leaves"], 8, leave=leave_mask((7, 10)))
+        journal.roll("leaves", games["leaves"], 0, foul=True)
+        with pytest.raises(ValueError):
+            journal.roll("leaves", games["leaves"], 5, leave=0)
+        with pytest.raises(ValueError):
+            journal.roll("leaves", games["leaves"], 11)
+        journal.roll("leaves", games["leaves"], 5)
+        games["new"] = ScoreKeeper()
+        journal.roll("new", games["new"], 7)
+        games["new"] = ScoreKeeper() # a new game under a journaled key starts over
+        journal.roll("new", games["new"], 3)
+    recovered = read_journal(path)
+    assert snapshots(recovered) == snapshots(games)
+    assert bytes(recovered["leaves"].leaves) == bytes(games["leaves"].leaves)
+
+def test_a_torn_batch_is_dropped_and_cut_off(tmp_path) -> None:
+    path = str(tmp_path / "rolls.journal")
+    scoreKeeper = ScoreKeeper()
+    with RollJournal(path, interval=None) as journal:
+        for pins in (3, 4, 10, 5):
+            journal.roll("lane", scoreKeeper, pins, wait=True)
+    with open(path, "rb") as file:
+        data = file.read()
+    ends = [end for end, _ in read_batches(data)]
+    assert len(ends) == 4
+    with open(path, "r+b") as file:
+        file.truncate(ends[-2] + 7)
+    assert replay_journal(data[:ends[-2] + 7])["lane"].rolls() == [3, 4, 10]
+    with RollJournal(path, interval=None) as journal:
+        assert os.path.getsize(path) == ends[-2]
+        recovered = read_journal(path)["lane"]
+        journal.roll("lane", recovered, 2, wait=True)
+    assert read_journal(path)["lane"].rolls() == [3, 4, 10, 2]
+
+def test_other_files_are_not_journals(tmp_path) -> None:
+    path = tmp_path / "notes.txt"
+    path.write_text("not a journal\n")
+    with pytest.raises(ValueError):
+        RollJournal(str(path))
+
+@pytest.mark.parametrize("interval", [0.001, None])
+def test_a_failed_commit_raises_until_retried(tmp_path, monkeypatch, interval) -> None:
+    fsync, failing = journal_module._fsync, [True]
+    def full_disk(file) -> None:
+        if failing[0]:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        fsync(file)
+    path = str(tmp_path / "rolls.journal")
+    scoreKeeper = ScoreKeeper()
+    journal = RollJournal(path, interval=interval)
+    journal.roll("lane", scoreKeeper, 4, wait=True)
+    monkeypatch.setattr(journal_module, "_fsync", full_disk)
+    with pytest.raises(OSError):
+        journal.roll("lane", scoreKeeper, 5, wait=True)
+    with pytest.raises(OSError):
+        journal.roll("lane", scoreKeeper, 3)
+    failing[0] = False
+    journal.commit()
+    assert journal.durable == journal.appended
+    journal.roll("lane", scoreKeeper, 3, wait=True)
+    failing[0] = True
+    journal.roll("lane", scoreKeeper, 0)
+    with pytest.raises(OSError):
+        journal.close()
+    failing[0] = False
+    journal.close()
+    journal.close()
+    assert read_journal(path)["lane"].snapshot() == scoreKeeper.snapshot()
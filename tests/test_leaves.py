@@ -0,0 +1,83 @@
+"""
+Tests of pin leave tracking for the Bowler Program: leaves are checked against the roll, splits and fouls are marked, and the index counts conversions.
+"""
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameOverPolicy, RollState
+from bowling.leaves import FOUL, KNOWN, PINS, LeaveIndex, is_split, leave_mask, leave_pins
+
+RACK = leave_mask(range(1, 11))
+
+def test_masks_and_splits() -> None:
+    assert leave_mask((7, 10)) == 0b1001000000
+    assert leave_pins(leave_mask((7, 10))) == (7, 10)
+    assert [is_split(leave_mask(pins)) for pins in [(7, 10), (3, 10), (5, 6), (4, 7), (1, 7, 10), (10,)]] == [True, True, True, False, False, False]
+    with pytest.raises(ValueError):
+        leave_mask((11,))
+
+def test_rolls_are_marked_from_their_leaves() -> None:
+    scoreKeeper = ScoreKeeper()
+    scoreKeeper.roll(8, leave=leave_mask((7, 10)))
+    scoreKeeper.roll(2, leave=0)
+    scoreKeeper.roll(0, foul=True)
+    assert [scoreKeeper._marks[slot] for slot in range(3)] == [RollState.SPLIT.value, RollState.SPARE.value, RollState.FOUL.value]
+    assert scoreKeeper.leaves[0] & PINS == leave_mask((7, 10))
+    assert scoreKeeper.leaves[2] == FOUL # no standing pins were given for the foul
+    assert scoreKeeper.score == 10
+    assert scoreKeeper.pins == 10
+
+def test_a_leave_that_does_not_match_raises_before_the_roll() -> None:
+    scoreKeeper = ScoreKeeper()
+    scoreKeeper.roll(6, leave=leave_mask((7, 8, 9, 10)))
+    before = scoreKeeper.snapshot()
+    for pins, leave in [(3, leave_mask((7, 8))), (1, leave_mask((1, 7, 8, 9))), (2, RACK)]:
+        with pytest.raises(ValueError):
+            scoreKeeper.roll(pins, leave=leave)
+    with pytest.raises(ValueError):
+        scoreKeeper.roll(2, foul=True)
+    assert scoreKeeper.snapshot() == before
+
+@pytest.mark.parametrize("policy", [GameOverPolicy.RESTART, GameOverPolicy.PROMPT])
+def test_a_bad_leave_after_the_game_keeps_the_finished_game(policy : GameOverPolicy, monkeypatch) -> None:
+    monkeypatch.setattr("builtins.input", lambda prompt: "Y")
+    scoreKeeper = ScoreKeeper(on_game_over=policy, concurrent=True)
+    for _ in range(12):
+        scoreKeeper.roll(10)
+    view, before = scoreKeeper.view, scoreKeeper.snapshot()
+    with pytest.raises(ValueError):
+        scoreKeeper.roll(3, leave=0)
+    assert scoreKeeper.snapshot() == before
+    assert scoreKeeper.view is view and scoreKeeper.score == 300
+    scoreKeeper.roll(3, leave=leave_mask((1, 2, 3, 5, 6, 8, 9)))
+    assert (scoreKeeper.score, scoreKeeper.rolls(), scoreKeeper.view.version) == (3, [3], view.version + 1)
+
+def test_index_counts_conversions() -> None:
+    index = LeaveIndex()
+    for second in (2, 0, 2):
+        scoreKeeper = ScoreKeeper()
+        scoreKeeper.roll(8, leave=leave_mask((7, 10)))
+        scoreKeeper.roll(second, leave=0 if second else leave_mask((7, 10)))
+        scoreKeeper.roll(10, leave=0)
+        index.add(scoreKeeper)
+    assert index.games == 3
+    assert (index.count((7, 10)), index.rate((7, 10)), index.split_rate()) == (3, 2 / 3, 2 / 3)
+    assert index.most_common(1) == [((7, 10), 3, 2 / 3)]
+    assert index.rate((1,)) is None
+
+def test_bulk_index_matches_adding_games() -> None:
+    np = pytest.importorskip("numpy")
+    games = []
+    for first, standing in [(8, (7, 10)), (9, (10,)), (7, (4, 7, 10)), (10, ())]:
+        scoreKeeper = ScoreKeeper()
+        scoreKeeper.roll(first, leave=leave_mask(standing))
+        if first < 10:
+            scoreKeeper.roll(10 - first, leave=0)
+        scoreKeeper.roll(0, foul=True)
+        games.append(scoreKeeper)
+    one, bulk = LeaveIndex(), LeaveIndex()
+    for scoreKeeper in games:
+        one.add(scoreKeeper)
+    bulk.add_leaves(np.stack([np.frombuffer(scoreKeeper.leaves, dtype=np.uint16) for scoreKeeper in games]))
+    assert (list(bulk.counts), list(bulk.cleared), bulk.games) == (list(one.counts), list(one.cleared), one.games)
+    assert all(leave & KNOWN for leave in games[0].leaves[:2])
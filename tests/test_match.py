@@ -0,0 +1,26 @@
+"""
+Tests of Match for the Bowler Program: the standings and team totals follow every change to a bowler's game.
+"""
+import pytest
+
+from bowling.Match import Match
+
+def test_undo_and_correct_update_the_standings() -> None:
+    match = Match(["a", "b"], teams={"a": "x", "b": "x"})
+    match.roll(10)
+    match.roll(7)
+    assert match.standings == [("a", 10), ("b", 7)]
+    match.undo("a")
+    assert match.standings == [("b", 7), ("a", 0)]
+    assert match.teams == {"x": 7}
+    assert match.up == "a"
+    match.roll(9)
+    match.correct("b", 0, 0, 3)
+    assert match.standings == [("a", 9), ("b", 3)]
+    assert match.teams == {"x": 12}
+
+def test_undo_without_a_roll_raises() -> None:
+    match = Match(["a"])
+    with pytest.raises(ValueError):
+        match.undo("a")
+    assert match.standings == [("a", 0)]
@@ -0,0 +1,67 @@
+"""
+Call-count tests of scoreboard rendering for the Bowler Program: boards are rendered from the roll buffers, and the Frame and Roll views are only built when read.
+"""
+import collections
+import io
+import sys
+from typing import Callable, Counter
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.render import Scoreboard
+from bowling.rules import RULES
+
+VIEWS = ("Frames.__init__", "FrameView.__init__", "RollView.__init__")
+BOARD_CALLS : int = 30 # Python calls per rendered board, 18 to 25 when this was written
+
+def count_calls(run : Callable[[], None]) -> Counter:
+    """
+    Returns the Python calls made by run, by qualified name.
+    """
+    calls : Counter = collections.Counter()
+    def profile(frame, event, arg) -> None:
+        if event == "call":
+            calls[getattr(frame.f_code, "co_qualname", frame.f_code.co_name)] += 1
+    sys.setprofile(profile)
+    try:
+        run()
+    finally:
+        sys.setprofile(None)
+    return calls
+
+def game(rolls, rules : str = "tenpin") -> ScoreKeeper:
+    scoreKeeper = ScoreKeeper(scoreboard=Scoreboard(stream=io.StringIO()), rules=RULES[rules])
+    for pins in rolls:
+        scoreKeeper.roll(pins)
+    return scoreKeeper
+
+GAMES = [
+    ([], "tenpin"),
+    ([10, 7, 3, 9, 0], "tenpin"),
+    ([10] * 12, "tenpin"),
+    ([3, 4] * 9 + [10, 10, 10], "tenpin"),
+    ([5, 5] * 10 + [5], "tenpin"),
+    ([3, 4, 2] * 9 + [10, 10, 10], "candlepin"),
+]
+
+@pytest.mark.parametrize("rolls, rules", GAMES)
+def test_show_scoreboard_builds_no_views(rolls, rules : str) -> None:
+    scoreKeeper = game(rolls, rules)
+    scoreKeeper.show_scoreboard() # first board loads the renderer
+    calls = count_calls(scoreKeeper.show_scoreboard)
+    assert not [name for name in VIEWS if calls[name]]
+    assert not [name for name in calls if name.startswith(("Frame.", "FrameView.", "Roll.", "RollView."))]
+    assert sum(calls.values()) <= BOARD_CALLS, calls.most_common(10)
+
+def test_frame_views_are_built_per_frame_read() -> None:
+    scoreKeeper = game([10, 7, 3, 9, 0] + [3, 4] * 7)
+    frames = scoreKeeper._frames
+    calls = count_calls(lambda: [(frame.state, frame.score) for frame in frames])
+    assert calls["FrameView.__init__"] == scoreKeeper.rounds
+    assert calls["RollView.__init__"] == 0
+
+def test_roll_views_are_built_per_roll_read() -> None:
+    scoreKeeper = game([10, 7, 3, 9, 0])
+    calls = count_calls(lambda: scoreKeeper._frames[1][1].symbol)
+    assert (calls["Frames.__init__"], calls["FrameView.__init__"], calls["RollView.__init__"]) == (1, 1, 1)
@@ -0,0 +1,30 @@
+"""
+Tests of sharded rescoring for the Bowler Program: scores come back in file order, and a bad game is reported and skipped.
+"""
+import io
+from array import array
+from typing import List
+
+from bowling.shard import read_chunks, score_chunk, score_file
+
+GAMES = [b"10 10 10 10 10 10 10 10 10 10 10 10", b"3 4 " * 10, b"5 5 " * 10 + b"5", b"0 " * 20]
+SCORES = [300, 70, 150, 0]
+
+def test_chunks_end_on_a_line_boundary() -> None:
+    data = b"\n".join(GAMES) + b"\n"
+    chunks = list(read_chunks(io.BytesIO(data), chunk_bytes=16))
+    assert b"".join(chunks) == data
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+
+def test_bad_games_are_skipped_in_their_chunk() -> None:
+    scores, skipped = score_chunk(b"\n".join([GAMES[0], b"3 x 4", b"", b"7 7", GAMES[1]]))
+    assert list(array('H', scores)) == [300, 70]
+    assert [number for number, _ in skipped] == [2, 4]
+    assert "Roll Exceeds" in skipped[1][1]
+
+def test_score_file_reports_bad_games_by_file_line() -> None:
+    lines = GAMES + [b"9 9"] + GAMES + [b"", b"10 " * 13] + GAMES
+    errors : List[Exception] = []
+    scores = list(score_file(io.BytesIO(b"\n".join(lines) + b"\n"), workers=2, chunk_bytes=40, on_error=errors.append))
+    assert scores == SCORES * 3
+    assert [str(error).split(":")[0] for error in errors] == ["Dropped game on line 5", "Dropped game on line 11"]
@@ -0,0 +1,80 @@
+"""
+Tests of pot game and bracket simulation for the Bowler Program: finishes follow the roll model, outcomes are probabilities, and a seed gives the same outcome on any number of workers.
+"""
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+from bowling.ScoreKeeper import ScoreKeeper # requires numpy
+from bowling.constants import GameState
+from bowling.distribution import best_score, worst_score
+from bowling.generator import PROFILES, SkillProfile
+from bowling.rules import CANDLEPIN, TENPIN
+from bowling.simulation import finish_games, live, simulate
+
+def play(rolls, rules = TENPIN) -> ScoreKeeper:
+    scoreKeeper = ScoreKeeper(rules=rules)
+    for pins in rolls:
+        scoreKeeper.roll(pins)
+    return scoreKeeper
+
+def finish(scoreKeeper : ScoreKeeper, profile : SkillProfile, rng : random.Random) -> int:
+    scoreKeeper = ScoreKeeper.restore(scoreKeeper.snapshot())
+    while scoreKeeper._state != GameState.GAME_END:
+        standing = scoreKeeper.pins
+        chance = profile.strike if scoreKeeper._rules.positions[scoreKeeper._position].fresh else profile.spare
+        scoreKeeper.roll(standing if rng.random() < chance else rng.randrange(standing))
+    return scoreKeeper.score
+
+GAMES = {"a": [10, 10, 10], "b": [9, 1, 9, 0, 7, 2], "c": [10, 9, 1, 10], "d": [5, 5, 5, 5, 5]}
+
+@pytest.mark.parametrize("rules, rolls", [(TENPIN, [10, 7, 3, 10, 9, 0, 4]), (CANDLEPIN, [10, 5, 3, 2, 7, 3])])
+def test_finishes_follow_the_roll_model(rules, rolls) -> None:
+    scoreKeeper, profile = play(rolls, rules), SkillProfile(0.3, 0.5)
+    rng = random.Random(1)
+    played = [finish(scoreKeeper, profile, rng) for _ in range(4000)]
+    simulated = finish_games([live(scoreKeeper)], [profile], 100_000, np.random.default_rng(0), rules)[:, 0]
+    assert abs(simulated.mean() - np.mean(played)) < 1.5
+    assert worst_score(scoreKeeper) <= simulated.min() and simulated.max() <= best_score(scoreKeeper)
+
+def test_perfect_and_open_profiles() -> None:
+    fresh = live(ScoreKeeper())
+    assert list(finish_games([fresh], [PROFILES["perfect"]], 5, np.random.default_rng(0), TENPIN)[:, 0]) == [300] * 5
+    opens = finish_games([fresh], [PROFILES["open"]], 10_000, np.random.default_rng(0), TENPIN)[:, 0]
+    assert opens.max() <= 90 and abs(opens.mean() - 67.5) < 0.5 # 0-9 pins, then 0 to one short of the rest, 6.75 a frame
+
+def test_outcomes_are_probabilities() -> None:
+    games = {name: play(rolls) for name, rolls in GAMES.items()}
+    profiles = {"a": PROFILES["league"], "b": PROFILES["pro"], "d": PROFILES["beginner"]}
+    outcomes = simulate(games, profiles, 5_000, seed=7, workers=1, bracket=("a", "b", "c", "d"))
+    assert sorted(outcome.bowler for outcome in outcomes) == list(GAMES)
+    assert [outcome.win for outcome in outcomes] == sorted((outcome.win for outcome in outcomes), reverse=True)
+    assert sum(outcome.win for outcome in outcomes) == pytest.approx(1)
+    assert sum(outcome.bracket for outcome in outcomes) == pytest.approx(1)
+    for outcome in outcomes:
+        assert sum(outcome.places) == pytest.approx(1) and outcome.places[0] == outcome.win
+    assert all(outcome.bracket is None for outcome in simulate(games, profiles, 100, seed=7, workers=1))
+
+def test_ties_are_drawn_evenly() -> None:
+    done = play([10] * 12)
+    outcomes = simulate({"done": done, "fresh": ScoreKeeper()}, {"fresh": PROFILES["perfect"]}, 1_000, seed=1, workers=1)
+    assert [outcome.mean for outcome in outcomes] == [300.0, 300.0]
+    assert [outcome.win for outcome in outcomes] == [pytest.approx(0.5, abs=0.05)] * 2 # the tie is drawn for each simulation
+
+def test_a_seed_gives_the_same_outcome_on_any_number_of_workers() -> None:
+    games = {name: play(rolls) for name, rolls in GAMES.items()}
+    runs = [simulate(games, simulations=3_000, seed=3, workers=workers, bracket=("d", "c", "b", "a"), chunk=500) for workers in (1, 2)]
+    assert runs[0] == runs[1]
+    assert simulate(games, simulations=3_000, seed=4, workers=1, chunk=500) != simulate(games, simulations=3_000, seed=3, workers=1, chunk=500)
+
+@pytest.mark.parametrize("bracket", [("a", "b", "c"), ("a", "a"), ("a", "z"), ("a",)])
+def test_bad_brackets_are_rejected(bracket) -> None:
+    with pytest.raises(ValueError):
+        simulate({name: play(rolls) for name, rolls in GAMES.items()}, simulations=10, workers=1, bracket=bracket)
+
+def test_games_must_exist_and_share_rules() -> None:
+    with pytest.raises(ValueError):
+        simulate({}, simulations=10, workers=1)
+    with pytest.raises(ValueError):
+        simulate({"tenpin": ScoreKeeper(), "candlepin": ScoreKeeper(rules=CANDLEPIN)}, simulations=10, workers=1)
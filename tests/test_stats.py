@@ -0,0 +1,35 @@
+"""
+Tests of Ledger for the Bowler Program: stats recomputed in bulk match the same games recorded one at a time.
+"""
+import random
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.stats import Ledger
+
+np = pytest.importorskip("numpy")
+from bowling.generator import random_games # requires numpy
+
+def test_from_games_matches_record_with_interleaved_series() -> None:
+    """
+    Series keys come back to a bowler after other keys, so only games in a row make up a series.
+    """
+    pins = random_games(3_000, seed=4)
+    rng = random.Random(4)
+    bowlers = [rng.randrange(20) for _ in range(len(pins))]
+    series = [rng.choice("abc") for _ in range(len(pins))]
+    ledger = Ledger()
+    for row, bowler, key in zip(pins, bowlers, series):
+        scoreKeeper = ScoreKeeper()
+        for roll in row[row >= 0]:
+            scoreKeeper.roll(int(roll))
+        ledger.record(bowler, scoreKeeper, key)
+    bulk = Ledger.from_games(pins, bowlers, series)
+    assert [bulk[bowler] for bowler in bulk.bowlers] == [ledger[bowler] for bowler in sorted(ledger.bowlers)]
+    assert bulk._series == [ledger._series[ledger._index[bowler]] for bowler in bulk.bowlers]
+
+def test_a_series_key_rolled_again_later_starts_a_new_series() -> None:
+    pins = np.array([[10] * 12 + [-1] * 9, [0] * 20 + [-1], [10] * 12 + [-1] * 9])
+    bulk = Ledger.from_games(pins, ["a"] * 3, ["night", "other", "night"])
+    assert bulk["a"].high_series == 300
@@ -0,0 +1,33 @@
+"""
+Tests of the streaming scorer for the Bowler Program: bad events are reported and skipped, and the other lanes carry on.
+"""
+import io
+from typing import List
+
+from bowling.stream import read_events, score_events, score_stream
+
+def test_malformed_lines_are_skipped() -> None:
+    errors : List[Exception] = []
+    events = list(read_events(["l1 g1 4", "bad line", "l1 g1 x", "", "# comment", "l1,g1,5"], errors.append))
+    assert events == [("l1", "g1", 4), ("l1", "g1", 5)]
+    assert [str(error) for error in errors] == ["Malformed roll event on line 2: 'bad line'", "Malformed roll event on line 3: 'l1 g1 x'"]
+
+def test_an_illegal_roll_drops_only_its_game() -> None:
+    errors : List[Exception] = []
+    events = [("l1", "g1", 11), ("l1", "g1", 4)] + [("l2", "g1", 10)] * 12
+    records = list(score_events(events, on_error=errors.append))
+    assert [(record.lane, record.game, record.score) for record in records] == [("l2", "g1", 300)]
+    assert len(errors) == 2 and "Dropped lane l1 game g1" in str(errors[0]) and "was dropped" in str(errors[1])
+
+def test_late_rolls_do_not_start_a_new_game() -> None:
+    errors : List[Exception] = []
+    source = io.StringIO("".join("l1 g1 10\n" for _ in range(12)) + "l1 g1 7\n" + "".join("l1 g2 0\n" for _ in range(20)))
+    records = list(score_stream(source, on_error=errors.append))
+    assert [(record.game, record.score) for record in records] == [("g1", 300), ("g2", 0)]
+    assert [str(error) for error in errors] == ["Late roll of 7 for lane l1 game g1, which has finished."]
+
+def test_remembered_ids_are_bounded() -> None:
+    errors : List[Exception] = []
+    events = [(lane, "g", 10) for lane in ("l1", "l2") for _ in range(12)] + [("l1", "g", 10)]
+    list(score_events(events, on_error=errors.append, remember=1))
+    assert errors == [] # l1 was forgotten, its late roll starts a new game
@@ -0,0 +1,108 @@
+"""
+Equivalence tests of the table-driven ScoreKeeper.roll for the Bowler Program, against a plain tenpin scorer that adds up the rolls directly.
+"""
+import random
+from typing import Iterator, List, Optional, Tuple
+
+import pytest
+
+from bowling.ScoreKeeper import ScoreKeeper
+from bowling.constants import GameState
+
+def split_frames(rolls : List[int], rounds : int) -> List[List[int]]:
+    """
+    Returns the rolls of each frame rolled so far, a strike ends a frame before the last.
+    """
+    frames : List[List[int]] = []
+    for pins in rolls:
+        if not frames or len(frames) < rounds and (frames[-1] == [10] or len(frames[-1]) == 2):
+            frames.append([])
+        frames[-1].append(pins)
+    return frames
+
+def oracle(rolls : List[int], rounds : int) -> Tuple[int, int, int, bool, int, List[Optional[int]]]:
+    """
+    Returns score, frame, pins standing, whether the game has ended, most moves remaining and the running score through every frame
+    of a tenpin game, worked out from its rolls alone.
+    """
+    frames = split_frames(rolls, rounds)
+    cumulative : List[Optional[int]] = [None] * rounds
+    total, start = 0, 0
+    for index, balls in enumerate(frames):
+        after = rolls[start + len(balls):]
+        total += sum(balls)
+        if index < rounds - 1 and balls[0] == 10:
+            total += sum(after[:2])
+        elif index < rounds - 1 and sum(balls) == 10:
+            total += sum(after[:1])
+        cumulative[index] = total
+        start += len(balls)
+
+    last = frames[-1] if len(frames) == rounds else None
+    ended = last is not None and (len(last) == 3 or len(last) == 2 and sum(last) < 10)
+    if last is None: # a frame before the last
+        current = frames[-1] if frames and len(frames[-1]) == 1 and frames[-1] != [10] else []
+        frame = len(frames) - (1 if current else 0)
+        pins = 10 - sum(current)
+        moves = 2 - len(current) + (rounds - frame - 2) * 2 + 3
+    else:
+        frame = rounds - 1
+        if ended or not last:
+            pins = 10
+        elif len(last) == 1:
+            pins = 10 - last[0] if last[0] < 10 else 10
+        else:
+            pins = 10 - last[1] if last[0] == 10 and last[1] < 10 else 10
+        moves = 0 if ended else 3 - len(last)
+    return total, frame, pins, ended, moves, cumulative
+
+def observe(scoreKeeper : ScoreKeeper) -> Tuple[int, int, int, bool, int, List[Optional[int]]]:
+    """
+    Returns what oracle works out, read from a ScoreKeeper.
+    """
+    return (scoreKeeper.score, scoreKeeper.frame, scoreKeeper.pins, scoreKeeper._state == GameState.GAME_END, scoreKeeper.movesRemaining(),
+            [scoreKeeper.cumulative_score(frame) for frame in range(scoreKeeper.rounds)])
+
+def prefixes(rounds : int) -> Iterator[Tuple[List[int], ScoreKeeper]]:
+    """
+    Yields every legal prefix of a game of rounds frames, the empty game included, with a ScoreKeeper that has rolled it.
+    """
+    pending : List[Tuple[List[int], ScoreKeeper]] = [([], ScoreKeeper(rounds=rounds))]
+    while pending:
+        rolls, scoreKeeper = pending.pop()
+        yield rolls, scoreKeeper
+        if scoreKeeper._state == GameState.GAME_END:
+            continue
+        snapshot = scoreKeeper.snapshot()
+        for pins in range(scoreKeeper.pins + 1):
+            child = ScoreKeeper.restore(snapshot)
+            child.roll(pins)
+            pending.append((rolls + [pins], child))
+
+@pytest.mark.parametrize("rounds", [1, 2, 3])
+def test_every_legal_prefix_matches_the_oracle(rounds : int) -> None:
+    """
+    Three frames reach every bonus a roll can pay, two frames back, and every ball of the last frame.
+    A roll beyond the pins standing raises and leaves the game as it was.
+    """
+    count = 0
+    for rolls, scoreKeeper in prefixes(rounds):
+        observed = observe(scoreKeeper)
+        assert observed == oracle(rolls, rounds), rolls
+        if not observed[3] and scoreKeeper.pins < 10:
+            with pytest.raises(Exception, match="Roll Exceeds"):
+                scoreKeeper.roll(scoreKeeper.pins + 1)
+            assert observe(scoreKeeper) == observed, rolls
+        count += 1
+    assert count > 1
+
+def test_random_ten_frame_games_match_the_oracle() -> None:
+    rng = random.Random(8)
+    for _ in range(2_000):
+        scoreKeeper = ScoreKeeper()
+        rolls : List[int] = []
+        while scoreKeeper._state != GameState.GAME_END:
+            pins = scoreKeeper.pins if rng.random() < 0.3 else rng.randint(0, scoreKeeper.pins)
+            scoreKeeper.roll(pins)
+            rolls.append(pins)
+            assert observe(scoreKeeper) == oracle(rolls, 10), rolls